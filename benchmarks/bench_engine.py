@@ -0,0 +1,423 @@
+# benchmarks/bench_engine.py
+"""
+Engine throughput benchmarks on the committed squads, fixed seeds.
+
+Scenarios (ticks / second through BaseState.tick, best of SCENARIO_REPEATS):
+  kickoff_to_ruck   fresh match, kick-off until the first ruck.* tag
+  phase_play        PHASE_TICKS of sustained open play after the first phase
+  phase_play.every_tick  the same, with support players re-planning every tick
+                    (think_every=1); the table prints the scheduler's speed-up
+  scrum_cycle       forced scrum.start until play leaves scrum.*  (× SET_PIECE_CYCLES)
+  lineout_cycle     forced lineout.start until play leaves lineout.*  (× SET_PIECE_CYCLES)
+  full_match        Match.run_headless(), both halves
+
+Micro (ns per call on a match warmed up to open play):
+  build_context, choose_select, Ball.update, offside.update_flags, DeterministicRNG.randf
+
+Startup (ms in a fresh interpreter, best of STARTUP_REPEATS):
+  import_match      `import match` as reported by python -X importtime (cumulative)
+  first_tick        process start through imports, Match(...) and the first tick
+
+  The 100 ms first-tick target is not met: importing numpy on its own takes
+  ~80-110 ms here, and the first tick needs it (Match() builds the player
+  state arrays), so deferring the import would only move that cost from
+  import_match into first_tick.
+
+    python3 benchmarks/bench_engine.py                          # run + print table
+    python3 benchmarks/bench_engine.py --save benchmarks/baseline.json
+    python3 benchmarks/bench_engine.py --compare benchmarks/baseline.json --threshold 0.20
+
+--compare exits 1 when a scenario's ticks/s drops, or a startup time grows, by
+more than --threshold (fraction) against the baseline, or a micro's ns/call
+grows by more than --micro-threshold. Micro timings of a few µs swing more
+from run to run (about ±20% here even best-of-15), hence the wider default.
+It also fails when the baseline has no entry for something that was measured,
+and when a scenario ran a different number of ticks: the fixed seed no longer
+plays the same match, so the throughput numbers are not comparable.
+Baselines are per machine: regenerate one with --save before comparing on new
+hardware, and after any change to the simulation.
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+ENGINE = ROOT / "engine" / "matchEngine"
+sys.path.insert(0, str(ENGINE))
+
+from constants import ENGINE_VERSION, THINK_EVERY_TICKS        # noqa: E402
+from match import Match                                        # noqa: E402
+from choice.choice_controller import select as choose_select   # noqa: E402
+from choice.think import ThinkScheduler                         # noqa: E402
+from states import offside                                     # noqa: E402
+from utils.core.context import build_context                   # noqa: E402
+
+DEFAULT_DB = ROOT / "database" / "GameData.db"
+TEAM_A, TEAM_B = 2, 1
+SEED = 1234
+PHASE_TICKS = 400
+SET_PIECE_CYCLES = 20
+MAX_TICKS = 4000                 # safety cap for "until tag X" loops
+SET_PIECE_MAX_TICKS = 200        # some forced scrums never leave scrum.out; cap each cycle
+SCENARIO_REPEATS = 3             # best-of for the short scenarios (full_match runs once)
+MICRO_REPEATS = 15               # best-of, round-robin over the cases
+MICRO_MIN_S = 0.1                # each repeat runs at least this long
+STARTUP_REPEATS = 5              # best-of, one fresh interpreter each
+
+# run in a fresh interpreter (cwd ENGINE); prints the wall clock after the first tick
+_COLD_START = """
+import contextlib, io, time
+with contextlib.redirect_stdout(io.StringIO()):
+    from match import Match
+    m = Match({db!r}, {team_a}, {team_b}, seed={seed})
+    m._advance_clock()
+    m.state.tick()
+print(time.time())
+"""
+
+
+@contextlib.contextmanager
+def _quiet():
+    """The engine prints debug lines from many handlers; keep them out of the timings' output."""
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        yield
+
+
+def _new_match(db: str, seed: int = SEED) -> Match:
+    return Match(db, TEAM_A, TEAM_B, seed=seed)
+
+
+def _tag(m) -> str:
+    tag = m.state.controller.status[0]
+    return tag if isinstance(tag, str) else str(tag)
+
+
+def _step(m) -> None:
+    m._advance_clock()
+    m.state.tick()
+
+
+def _run_until(m, done, cap: int = MAX_TICKS) -> int:
+    n = 0
+    while not done(m) and n < cap and m.period["status"] != "full_time":
+        _step(m)
+        n += 1
+    return n
+
+
+def _warm_to_open_play(m) -> None:
+    _run_until(m, lambda x: _tag(x) == "open_play.phase_play")
+
+
+# -----------------------
+# scenarios → (ticks, seconds)
+# -----------------------
+def bench_kickoff_to_ruck(db):
+    m = _new_match(db)
+    t0 = time.perf_counter()
+    n = _run_until(m, lambda x: _tag(x).startswith("ruck."))
+    return n, time.perf_counter() - t0
+
+
+def bench_phase_play(db, think_every: int = THINK_EVERY_TICKS):
+    m = _new_match(db)
+    _warm_to_open_play(m)
+    m.think = ThinkScheduler(think_every)    # both variants start from the same tick
+    t0 = time.perf_counter()
+    for _ in range(PHASE_TICKS):
+        _step(m)
+    return PHASE_TICKS, time.perf_counter() - t0
+
+
+def bench_phase_play_every_tick(db):
+    return bench_phase_play(db, think_every=1)
+
+
+def _set_piece_cycles(db, tag, loc, prepare):
+    family = tag.split(".")[0] + "."
+    ticks, secs = 0, 0.0
+    for i in range(SET_PIECE_CYCLES):
+        m = _new_match(db, SEED + i)
+        _warm_to_open_play(m)
+        prepare(m)
+        m.ball.holder = None
+        m.ball.location = loc
+        m.state.controller.status = (tag, loc, "a")
+        t0 = time.perf_counter()
+        _step(m)
+        ticks += 1 + _run_until(m, lambda x: not _tag(x).startswith(family), SET_PIECE_MAX_TICKS)
+        secs += time.perf_counter() - t0
+    return ticks, secs
+
+
+def bench_scrum_cycle(db):
+    def prepare(m):
+        m.pending_scrum = {"put_in": "a"}
+    return _set_piece_cycles(db, "scrum.start", (40.0, 30.0, 0.0), prepare)
+
+
+def bench_lineout_cycle(db):
+    def prepare(m):
+        m.possession = "a"
+    return _set_piece_cycles(db, "lineout.start", (40.0, 0.0, 0.0), prepare)
+
+
+def bench_full_match(db):
+    m = _new_match(db)
+    t0 = time.perf_counter()
+    result = m.run_headless()
+    return result["ticks"], time.perf_counter() - t0
+
+
+SCENARIOS = {
+    "kickoff_to_ruck": bench_kickoff_to_ruck,
+    "phase_play": bench_phase_play,
+    "phase_play.every_tick": bench_phase_play_every_tick,
+    "scrum_cycle": bench_scrum_cycle,
+    "lineout_cycle": bench_lineout_cycle,
+    "full_match": bench_full_match,
+}
+
+
+# -----------------------
+# micro → ns per call
+# -----------------------
+def _calibrate(fn) -> int:
+    """Loop count for one repeat of fn to run at least MICRO_MIN_S."""
+    n = 1
+    while True:
+        t0 = time.perf_counter_ns()
+        for _ in range(n):
+            fn()
+        if time.perf_counter_ns() - t0 >= MICRO_MIN_S * 1e9 or n >= 1 << 22:
+            return n
+        n *= 2
+
+
+def _time_calls(cases: dict) -> dict:
+    """
+    {name: (calls, best ns/call)}. The repeats go round-robin over the cases,
+    so a slow stretch of the machine hits one repeat of each case rather than
+    every repeat of one.
+    """
+    loops = {name: _calibrate(fn) for name, fn in cases.items()}
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(MICRO_REPEATS):
+        for name, fn in cases.items():
+            n = loops[name]
+            t0 = time.perf_counter_ns()
+            for _ in range(n):
+                fn()
+            best[name] = min(best[name], (time.perf_counter_ns() - t0) / n)
+    return {name: (loops[name], best[name]) for name in cases}
+
+
+def micro_benchmarks(db) -> dict:
+    m = _new_match(db)
+    _warm_to_open_play(m)
+    status = m.state.controller.status
+    tag, loc, ctx = status
+    rng = m.rng
+    counter = iter(range(1 << 62))
+
+    cases = {
+        "build_context": lambda: build_context(m),
+        "choose_select": lambda: choose_select(m, status),
+        "Ball.update": lambda: m.ball.update(m),
+        "offside.update_flags": lambda: offside.update_flags(m, tag, loc, ctx),
+        "DeterministicRNG.randf": lambda: rng.randf("bench", next(counter), "10a"),
+    }
+    return {name: {"calls": calls, "ns_per_call": round(ns, 1)}
+            for name, (calls, ns) in _time_calls(cases).items()}
+
+
+# -----------------------
+# startup → ms in a fresh interpreter
+# -----------------------
+def _import_ms() -> float:
+    """Cumulative `import match` time from -X importtime (µs lines on stderr)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import match"],
+                          cwd=ENGINE, capture_output=True, text=True, check=True)
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == "match":
+            return int(parts[1]) / 1000.0
+    raise RuntimeError("`import match` missing from -X importtime output")
+
+
+def _first_tick_ms(db: str) -> float:
+    code = _COLD_START.format(db=str(Path(db).resolve()), team_a=TEAM_A, team_b=TEAM_B, seed=SEED)
+    t0 = time.time()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ENGINE, capture_output=True, text=True, check=True)
+    return (float(proc.stdout.strip().splitlines()[-1]) - t0) * 1000.0
+
+
+def startup_benchmarks(db) -> dict:
+    return {
+        "import_match": {"ms": round(min(_import_ms() for _ in range(STARTUP_REPEATS)), 1)},
+        "first_tick": {"ms": round(min(_first_tick_ms(db) for _ in range(STARTUP_REPEATS)), 1)},
+    }
+
+
+# -----------------------
+# driver
+# -----------------------
+def run(db: str, only=None, micro: bool = True, startup: bool = True) -> dict:
+    results = {
+        "meta": {
+            "engine_version": ENGINE_VERSION,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "seed": SEED,
+        },
+        "scenarios": {},
+        "micro": {},
+        "startup": {},
+    }
+    if startup:
+        results["startup"] = startup_benchmarks(db)
+    with _quiet():
+        for name, fn in SCENARIOS.items():
+            if only and name not in only:
+                continue
+            repeats = 1 if name == "full_match" else SCENARIO_REPEATS
+            runs = [fn(db) for _ in range(repeats)]
+            ticks, secs = min(runs, key=lambda r: r[1])
+            results["scenarios"][name] = {
+                "ticks": ticks,
+                "seconds": round(secs, 4),
+                "ticks_per_s": round(ticks / secs, 1) if secs else None,
+            }
+        if micro:
+            results["micro"] = micro_benchmarks(db)
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float, micro_threshold: float | None = None) -> list:
+    """
+    Regression lines (empty = pass). Higher ticks/s and lower ns/call are better.
+    micro_threshold applies to the micro section (default: threshold).
+    A measurement the baseline lacks is a failure, not a silent pass.
+    """
+    micro_threshold = threshold if micro_threshold is None else micro_threshold
+    bad = []
+    for name, cur in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base or not base.get("ticks_per_s"):
+            bad.append(_missing("scenarios", name))
+            continue
+        if not cur.get("ticks_per_s"):
+            continue
+        if cur["ticks"] != base["ticks"]:
+            bad.append(f"{name}: ran {cur['ticks']} ticks vs {base['ticks']} in baseline "
+                       f"(simulation changed; regenerate the baseline with --save)")
+            continue
+        change = cur["ticks_per_s"] / base["ticks_per_s"] - 1.0
+        if change < -threshold:
+            bad.append(f"{name}: {cur['ticks_per_s']:.1f} ticks/s vs {base['ticks_per_s']:.1f} ({change:+.1%})")
+    for name, cur in current["micro"].items():
+        base = baseline.get("micro", {}).get(name)
+        if not base:
+            bad.append(_missing("micro", name))
+            continue
+        change = cur["ns_per_call"] / base["ns_per_call"] - 1.0
+        if change > micro_threshold:
+            bad.append(f"{name}: {cur['ns_per_call']:.0f} ns/call vs {base['ns_per_call']:.0f} ({change:+.1%})")
+    for name, cur in current.get("startup", {}).items():
+        base = baseline.get("startup", {}).get(name)
+        if not base:
+            bad.append(_missing("startup", name))
+            continue
+        change = cur["ms"] / base["ms"] - 1.0
+        if change > threshold:
+            bad.append(f"{name}: {cur['ms']:.1f} ms vs {base['ms']:.1f} ({change:+.1%})")
+    return bad
+
+
+def _missing(section: str, name: str) -> str:
+    return f"{name}: no {section} entry in baseline (regenerate it with --save)"
+
+
+def _print_table(results: dict, baseline: dict | None = None) -> None:
+    print(f"{'scenario':<24}{'ticks':>8}{'seconds':>10}{'ticks/s':>11}{'Δ':>9}")
+    for name, r in results["scenarios"].items():
+        delta = ""
+        base = (baseline or {}).get("scenarios", {}).get(name)
+        if base and base.get("ticks_per_s") and r.get("ticks_per_s"):
+            delta = f"{r['ticks_per_s'] / base['ticks_per_s'] - 1.0:+.1%}"
+        print(f"{name:<24}{r['ticks']:>8}{r['seconds']:>10.3f}{r['ticks_per_s'] or 0:>11.1f}{delta:>9}")
+    fast, every = results["scenarios"].get("phase_play"), results["scenarios"].get("phase_play.every_tick")
+    if fast and every and fast.get("ticks_per_s") and every.get("ticks_per_s"):
+        print(f"think scheduler (every {THINK_EVERY_TICKS} vs every tick): "
+              f"phase_play ×{fast['ticks_per_s'] / every['ticks_per_s']:.2f}")
+    if results["micro"]:
+        print(f"{'micro':<26}{'ns/call':>12}{'Δ':>9}")
+        for name, r in results["micro"].items():
+            delta = ""
+            base = (baseline or {}).get("micro", {}).get(name)
+            if base:
+                delta = f"{r['ns_per_call'] / base['ns_per_call'] - 1.0:+.1%}"
+            print(f"{name:<26}{r['ns_per_call']:>12.1f}{delta:>9}")
+    if results.get("startup"):
+        print(f"{'startup':<26}{'ms':>12}{'Δ':>9}")
+        for name, r in results["startup"].items():
+            delta = ""
+            base = (baseline or {}).get("startup", {}).get(name)
+            if base:
+                delta = f"{r['ms'] / base['ms'] - 1.0:+.1%}"
+            print(f"{name:<26}{r['ms']:>12.1f}{delta:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Match engine throughput benchmarks")
+    parser.add_argument("--db", default=str(DEFAULT_DB), help="Squad database (default: database/GameData.db)")
+    parser.add_argument("--only", default=None, help="Comma separated scenario names to run")
+    parser.add_argument("--no-micro", action="store_true", help="Skip the per-call microbenchmarks")
+    parser.add_argument("--no-startup", action="store_true", help="Skip the fresh-interpreter startup timings")
+    parser.add_argument("--save", default=None, help="Write results JSON here (e.g. a new baseline)")
+    parser.add_argument("--compare", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.20, help="Allowed slowdown fraction before failing")
+    parser.add_argument("--micro-threshold", type=float, default=0.40,
+                        help="Allowed ns/call growth for the micro section (noisier than the scenarios)")
+    args = parser.parse_args()
+
+    only = set(args.only.split(",")) if args.only else None
+    unknown = (only or set()) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+
+    results = run(args.db, only=only, micro=not args.no_micro, startup=not args.no_startup)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+    _print_table(results, baseline)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, indent=2)
+            fh.write("\n")
+
+    if baseline is not None:
+        bad = compare(results, baseline, args.threshold, args.micro_threshold)
+        limits = f"{args.threshold:.0%}, micro {args.micro_threshold:.0%}"
+        if bad:
+            print(f"\nregressions (> {limits}):", file=sys.stderr)
+            for line in bad:
+                print(f"  {line}", file=sys.stderr)
+            sys.exit(1)
+        print(f"\nno regressions beyond {limits}")
+
+
+if __name__ == "__main__":
+    main()
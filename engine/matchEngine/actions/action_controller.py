@@ -1,29 +1,61 @@
 from typing import Optional, Tuple
-from . import pass_action, kick, movement, catch, ground, tackle , offload,tackled,clearout, jackal, picked, feed, hook , jump, throw, deliver  # make sure these files exist
+from . import movement     # every tick moves players; the other sections load on first use
+
+from constants import BATCH_MOVEMENT
+from utils.core.lazy import lazy_module
 
 XYZ    = Tuple[float, float, float]
 Action = Tuple[str, Optional[str]]  # ("section","subtype"), e.g. ("pass","flat")
 
 _SECTION_TO_MODULE = {
-    "pass":   pass_action,
-    "kick":   kick,
+    "pass":   lazy_module(f"{__package__}.pass_action"),
+    "kick":   lazy_module(f"{__package__}.kick"),
     "move":   movement,
-    "catch":  catch,
-    "ground": ground,
-    "tackle": tackle,  
-    "offload": offload,
-    "tackled": tackled,
-    "clearout": clearout,
-    "jackal":   jackal,
-    "picked": picked,
-    "feed" : feed,
-    "hook": hook,
-    "jump": jump,
-    "throw": throw,
-    "deliver": deliver
+    "catch":  lazy_module(f"{__package__}.catch"),
+    "ground": lazy_module(f"{__package__}.ground"),
+    "tackle": lazy_module(f"{__package__}.tackle"),
+    "offload": lazy_module(f"{__package__}.offload"),
+    "tackled": lazy_module(f"{__package__}.tackled"),
+    "clearout": lazy_module(f"{__package__}.clearout"),
+    "jackal":   lazy_module(f"{__package__}.jackal"),
+    "picked": lazy_module(f"{__package__}.picked"),
+    "feed" : lazy_module(f"{__package__}.feed"),
+    "hook": lazy_module(f"{__package__}.hook"),
+    "jump": lazy_module(f"{__package__}.jump"),
+    "throw": lazy_module(f"{__package__}.throw"),
+    "deliver": lazy_module(f"{__package__}.deliver")
 }
 
 def do_action(match, player_id, action, location, target):
     section, subtype = action
     mod = _SECTION_TO_MODULE[section]
     return mod.do_action(match, player_id, subtype, location, target)
+
+
+def do_actions(match, calls):
+    """
+    Run a tick's [(pid, action, _, target), ...] in order. Consecutive "move"
+    calls are integrated together by movement.do_actions_batch; the batch is
+    flushed before any other action (which may read movers' positions) and
+    whenever a player would move twice, so the result matches calling
+    do_action one by one.
+    """
+    moves, movers = [], set()
+
+    def flush():
+        if moves:
+            movement.do_actions_batch(match, moves)
+            moves.clear()
+            movers.clear()
+
+    for pid, action, _ignored, target in calls:
+        p = match.get_player_by_code(pid)
+        if action[0] == "move" and BATCH_MOVEMENT and p is not None:
+            if pid in movers:
+                flush()
+            moves.append((p, target))
+            movers.add(pid)
+            continue
+        flush()
+        do_action(match, pid, action, p.location, target)
+    flush()
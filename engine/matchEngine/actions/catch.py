@@ -3,7 +3,7 @@
 
 from typing import Optional, Tuple, Callable
 import math
-import random
+from utils.core.rng import stream
 from utils.laws import advantage as adv_law
 
 XYZ = Tuple[float, float, float]
@@ -14,7 +14,7 @@ def do_action(
     subtype: Optional[str],
     location: XYZ,
     target: XYZ,
-    rng: Callable[[], float] = random.random,
+    rng: Optional[Callable[[], float]] = None,
 ) -> bool:
     """
     Attempt to catch the ball.
@@ -50,7 +50,7 @@ def do_action(
         
     catch_success = max(0.0, min(1.0, catch_success))
 
-    roll = rng() 
+    roll = (rng or stream(match, "catch", catcher_id))()
 
     # Resolve outcome
     if roll <= catch_success:
@@ -18,8 +18,10 @@ def do_action(match, passer_id: str, subtype: Optional[str], location: XYZ, targ
     ball.set_action("hook")
     ball.release()
 
-    # Preserve x/y; lock z to 0 for start and end
-    x0, y0, _ = location
+    # Preserve x/y; lock z to 0 for start and end. The flight starts where the
+    # ball lies (start_parabola_to), so time it from there: timed from the
+    # hooker's feet a near-zero T sent the ball skidding off at thousands of m/s
+    x0, y0 = bx, by
     x1, y1, _ = target
     start = (x0, y0, 0.0)
     end   = (x1, y1, 0.0)
@@ -1,8 +1,8 @@
 from typing import Optional, Tuple
 import math
-import random
 
 from . import catch
+from utils.core.rng import stream
 from utils.actions.jump_helpers import (
     standing_jump,
     running_jump,
@@ -42,7 +42,7 @@ def do_action(match, player_id: str, subtype: Optional[str], location: XYZ, targ
     base = player.norm_attributes.get("handling", 0.5)
     success_prob = max(0.0, min(1.0, base * (1.0 - ratio)))
 
-    if random.random() <= success_prob:
+    if stream(match, "jump", player_id).random() <= success_prob:
         return catch.do_action(match, player_id, None, location, target)
     else:
         return catch.do_action(match, player_id, "drop", location, target)
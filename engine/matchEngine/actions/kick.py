@@ -1,6 +1,6 @@
 from typing import Optional, Tuple
-from math import hypot, isfinite, cos, sin, tau
-import random
+from math import hypot, isfinite
+from utils.core.rng import stream
 
 XYZ = Tuple[float, float, float]
 
@@ -114,10 +114,11 @@ def do_action(match, kicker_id: str, subtype: Optional[str], location: XYZ, targ
     range_m = 28.0 + 44.0 * power
     kick_success = 0.1 + 0.9 * ((1.0 - (distance_m / max(range_m, 1e-6)) ** 2) * (1.0 + kicking))
     kick_success = max(0.0, min(1.0, kick_success))
-    rnd = random.random()
+    rs = stream(match, "kick", kicker_id)
+    rnd = rs.random()
     if rnd > kick_success:
         error = rnd - kick_success
-        if random.random() < 0.5:
+        if rs.random() < 0.5:
             error = -error
         misplaced = error * distance_m
         if abs(error) < 0.2:
@@ -168,13 +169,3 @@ def do_action(match, kicker_id: str, subtype: Optional[str], location: XYZ, targ
 
     ball.start_parabola_to((land_x, land_y, 0.0), T=T, H=H, gamma=gamma)
     return True
-def slice_kick(location: XYZ, range_m: float) -> tuple[XYZ, float]:
-    """Return a random target within ``range_m/3`` and a high-arc gamma."""
-    sx, sy, _ = location
-    radius = max(range_m, 0.0) / 3.0
-    ang = random.random() * tau
-    dist = random.random() * radius
-    x = sx + cos(ang) * dist
-    y = sy + sin(ang) * dist
-    # gamma > 85° -> use a large curvature factor
-    return (x, y, 0.0), 1.7
\ No newline at end of file
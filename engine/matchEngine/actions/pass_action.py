@@ -2,7 +2,7 @@
 
 from constants import EPS
 import math
-import random
+from utils.core.rng import stream
 
 from utils.actions import pass_helpers
 from utils.laws import advantage as adv_law
@@ -78,10 +78,11 @@ def do_action(match, passer_id: str, subtype: Optional[str], location: XYZ, targ
     success = pass_helpers.pass_success(dist, range_, passing) + success_bonus
     success = max(0.0, min(1.0, success))
 
-    roll = random.random()
+    rs = stream(match, "pass", passer_id)
+    roll = rs.random()
     if roll > success:
         error = roll - success
-        if random.random() < 0.5:
+        if rs.random() < 0.5:
             error = -error
         max_lateral = math.tan(scope / 2.0) * dist if scope else dist
         lateral = max(-max_lateral, min(max_lateral, (error * dist) / 3.0))
@@ -55,6 +55,10 @@ def run_match(db_path: str, team_a: int, team_b: int, ticks: int, log_file: Path
     The Match class already emits a JSON blob per tick to stdout via
     ``dump_tick_json``. We redirect stdout to ``log_file`` so the entire match
     can be analysed later.
+
+    This stays on the JSON log rather than a .dorr replay (utils/core/replay):
+    the tables count ``current_action`` (run / idle from movement), while replay
+    frames carry one interned ``action`` per player.
     """
     log_file = Path(log_file)
     with (
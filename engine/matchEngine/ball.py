@@ -2,6 +2,9 @@
 
 import math
 
+TICK_S = 0.05   # default tick length for predictions (Match.tick_rate)
+
+
 class Ball:
     """
     Minimal ball model driven by actions & simple transit profiles.
@@ -14,6 +17,10 @@ class Ball:
       - transit: dict describing movement from location -> target (parabola / linear / skid / none)
       - action: "passed" | "caught" | "kicked" | None  (last thing that happened to the ball)
       - status / last_status: small wrapper {action, holder, location}; only updates when action changes
+
+    Closed-form prediction (no state change, O(1)): location_at(t), time_to_height(z),
+    landing_point(), rest_point(). They follow the same per-tick integration as update(),
+    including the skid after the bounce, so chasers can plan on where the ball will be.
     """
 
     # --- defaults for simple movement/bounce ---
@@ -24,6 +31,12 @@ class Ball:
     SKID_STOP_SPEED    = 0.8   # below this, stop skidding
     BOUNCE_SPEED_KEEP  = 0.55  # how much horizontal speed remains after bounce
 
+    __slots__ = (
+        "location", "holder", "target", "true_holder", "has_bounced", "transit",
+        "action", "_last_action", "status", "last_status", "_pred",
+        "kick_success", "kick_range_m", "kick_distance_m",
+    )
+
     def __init__(self, location=(50.0, 35.0, 0.0), holder=None):
         self.location: tuple[float,float,float] = tuple(map(float, location))
         self.holder: str | None = holder
@@ -45,6 +58,25 @@ class Ball:
         self.status: dict | None = None
         self.last_status: dict | None = None
 
+        # (transit, {name: prediction}) – landing / rest predictions for the current transit
+        self._pred = (None, {})
+
+        # last kick's calculate_kick_success() outcome (actions/kick.py)
+        self.kick_success: float | None = None
+        self.kick_range_m: float | None = None
+        self.kick_distance_m: float | None = None
+
+    def reset(self, location=(50.0, 35.0, 0.0)) -> None:
+        """Dead ball on `location` with no action history (kick-off at half time)."""
+        self.location = tuple(map(float, location))
+        self.holder = None
+        self.target = None
+        self.transit = None
+        self.has_bounced = False
+        self.action = self._last_action = None
+        self.status = self.last_status = None
+        self._pred = (None, {})
+
     # -----------------------
     # basic holder helpers
     # -----------------------
@@ -153,17 +185,8 @@ class Ball:
             self.transit["t"] += dt
             T   = self.transit["T"]
             s   = min(1.0, max(0.0, self.transit["t"] / T))
-            gma = self.transit["gamma"]
-            s2  = s ** gma
-
-            x0, y0, z0 = self.transit["start"]
+            x, y, z = _parabola_at(self.transit, s)
             xt, yt, zt = self.transit["target"]
-            # straight-line planar interpolation
-            x = x0 + (xt - x0) * s
-            y = y0 + (yt - y0) * s
-            # dome height
-            H  = self.transit["H"]
-            z  = max(0.0, H * 4.0 * s2 * (1.0 - s2))  # clamps to ground
 
             self.location = (x, y, z)
 
@@ -173,16 +196,8 @@ class Ball:
                 on_open_play = getattr(getattr(match, "current_state", None), "name", "") == "open_play"
                 if on_open_play:
                     self.has_bounced = True
-                # compute simple landing planar velocity from last small step (for skid)
-                eps = 1e-3
-                prev_s = max(0.0, 1.0 - eps)
-                prev_s2 = prev_s ** gma
-                x_prev = x0 + (xt - x0) * prev_s
-                y_prev = y0 + (yt - y0) * prev_s
-                vx = (x - x_prev) / max(eps * T, 1e-6)
-                vy = (y - y_prev) / max(eps * T, 1e-6)
-                vx *= self.BOUNCE_SPEED_KEEP
-                vy *= self.BOUNCE_SPEED_KEEP
+                # simple landing planar velocity from the last small step (for skid)
+                vx, vy = self._landing_velocity(self.transit)
 
                 # start skid after bounce
                 self.location = (xt, yt, 0.0)
@@ -233,5 +248,157 @@ class Ball:
         # keep status wrapper consistent (but only changes when action changed externally)
         self._commit_status_if_action_changed()
 
+    # -----------------------
+    # closed-form prediction
+    # -----------------------
+    def _landing_velocity(self, tr: dict) -> tuple[float, float]:
+        """Skid velocity right after a parabola lands (finite difference over the last 0.1% of the arc)."""
+        T = tr["T"]
+        x0, y0, _ = tr["start"]
+        xt, yt, _ = tr["target"]
+        eps = 1e-3
+        prev_s = max(0.0, 1.0 - eps)
+        x, y, _ = _parabola_at(tr, 1.0)
+        x_prev = x0 + (xt - x0) * prev_s
+        y_prev = y0 + (yt - y0) * prev_s
+        vx = (x - x_prev) / max(eps * T, 1e-6)
+        vy = (y - y_prev) / max(eps * T, 1e-6)
+        return vx * self.BOUNCE_SPEED_KEEP, vy * self.BOUNCE_SPEED_KEEP
+
+    def _skid_ticks(self, speed: float, dt: float) -> int:
+        """Number of skid steps update() takes before the ball stops."""
+        if speed <= self.SKID_STOP_SPEED:
+            return 0
+        return max(1, math.ceil((speed - self.SKID_STOP_SPEED) / (self.SKID_FRICTION * dt)))
+
+    def _skid_at(self, x: float, y: float, vx: float, vy: float, n: float, dt: float):
+        """
+        Position after n skid ticks from (x, y) with velocity (vx, vy).
+        Each tick takes speed -= FRICTION*dt, then moves speed*dt, so n ticks cover
+        dt * (n*v0 - FRICTION*dt * n(n+1)/2) along the initial heading.
+        """
+        speed = math.hypot(vx, vy)
+        n = min(max(0.0, n), self._skid_ticks(speed, dt))
+        if n <= 0.0:
+            return (x, y, 0.0)
+        fd = self.SKID_FRICTION * dt
+        dist = dt * (n * speed - fd * n * (n + 1) / 2.0)
+        return (x + vx / speed * dist, y + vy / speed * dist, 0.0)
+
+    def _flight_ticks(self, tr: dict, dt: float) -> int:
+        """Ticks until a parabola lands (the landing tick included)."""
+        return max(1, math.ceil((tr["T"] - tr["t"]) / dt - 1e-9))
+
+    def location_at(self, t: float, dt: float = TICK_S) -> tuple[float, float, float]:
+        """Where the ball will be `t` seconds from now if nobody touches it (held → current spot)."""
+        tr = self.transit
+        n = max(0.0, t / dt)
+        if self.is_held() or not tr or n == 0.0:
+            return self.location
+        ttype = tr.get("type")
+
+        if ttype == "parabola":
+            n_land = self._flight_ticks(tr, dt)
+            if n < n_land:
+                return _parabola_at(tr, min(1.0, max(0.0, (tr["t"] + n * dt) / tr["T"])))
+            xt, yt, _ = tr["target"]
+            vx, vy = self._landing_velocity(tr)
+            return self._skid_at(xt, yt, vx, vy, n - n_land, dt)
+
+        if ttype == "linear":
+            x, y, z = self.location
+            xt, yt, zt = tr["target"]
+            d = math.sqrt((xt - x) ** 2 + (yt - y) ** 2 + (zt - z) ** 2)
+            step = max(0.0, float(tr["speed"])) * dt * n
+            if step >= d:
+                return (xt, yt, zt)
+            k = step / d
+            return (x + (xt - x) * k, y + (yt - y) * k, z + (zt - z) * k)
 
-   
+        if ttype == "skid":
+            x, y, _ = self.location
+            return self._skid_at(x, y, float(tr.get("vx", 0.0)), float(tr.get("vy", 0.0)), n, dt)
+
+        return self.location
+
+    def time_to_height(self, z: float, descending: bool = True, dt: float = TICK_S) -> float | None:
+        """
+        Seconds until the ball is next at height `z` (on the way down by default),
+        or None if it will not be (held, rolling, apex below z, already past it).
+        """
+        tr = self.transit
+        if self.is_held() or not tr:
+            return None
+        ttype = tr.get("type")
+        if ttype == "parabola":
+            H = tr["H"]
+            if z <= 0.0:
+                return self._flight_ticks(tr, dt) * dt if descending else None
+            if H <= 0.0 or z > H:
+                return None
+            # z = 4H u(1-u), u = s^gamma → u = (1 ± sqrt(1 - z/H)) / 2
+            root = math.sqrt(max(0.0, 1.0 - z / H))
+            u = (1.0 + root) / 2.0 if descending else (1.0 - root) / 2.0
+            t_abs = (u ** (1.0 / tr["gamma"])) * tr["T"]
+            return t_abs - tr["t"] if t_abs >= tr["t"] else None
+        if ttype == "linear":
+            x, y, z0 = self.location
+            zt = tr["target"][2]
+            if (descending and not (z0 >= z >= zt)) or (not descending and not (z0 <= z <= zt)):
+                return None
+            d = math.dist((x, y, z0), tr["target"])
+            spd = max(1e-6, float(tr["speed"]))
+            frac = 0.0 if z0 == zt else (z0 - z) / (z0 - zt)
+            return frac * d / spd
+        if ttype == "skid":
+            return 0.0 if z <= 0.0 else None
+        return None
+
+    def _cached(self, name: str, build):
+        tr, cache = self._pred
+        if tr is not self.transit:
+            cache = {}
+            self._pred = (self.transit, cache)
+        if name not in cache:
+            cache[name] = build()
+        return cache[name]
+
+    def landing_point(self) -> tuple[float, float, float] | None:
+        """First ground contact of the current kick arc (None unless a parabola is in flight)."""
+        tr = self.transit
+        if self.is_held() or not tr or tr.get("type") != "parabola":
+            return None
+        return self._cached("landing", lambda: (tr["target"][0], tr["target"][1], 0.0))
+
+    def rest_point(self, dt: float = TICK_S) -> tuple[float, float, float]:
+        """Where the ball stops if nobody touches it (after the bounce and skid)."""
+        tr = self.transit
+        if self.is_held() or not tr:
+            return self.location
+
+        def build():
+            ttype = tr.get("type")
+            if ttype == "parabola":
+                xt, yt, _ = tr["target"]
+                vx, vy = self._landing_velocity(tr)
+                return self._skid_at(xt, yt, vx, vy, float("inf"), dt)
+            if ttype == "linear":
+                return tuple(tr["target"])
+            if ttype == "skid":
+                x, y, _ = self.location
+                return self._skid_at(x, y, float(tr.get("vx", 0.0)), float(tr.get("vy", 0.0)), float("inf"), dt)
+            return self.location
+
+        # a skid's rest point moves with the ball's rounding each tick; only cache arcs
+        return self._cached("rest", build) if tr.get("type") == "parabola" else build()
+
+
+def _parabola_at(tr: dict, s: float) -> tuple[float, float, float]:
+    """Arc position at normalised time s: planar lerp, dome z = 4H s'(1 - s') with s' = s^gamma."""
+    x0, y0, _ = tr["start"]
+    xt, yt, _ = tr["target"]
+    s2 = s ** tr["gamma"]
+    x = x0 + (xt - x0) * s
+    y = y0 + (yt - y0) * s
+    H = tr["H"]
+    return (x, y, max(0.0, H * 4.0 * s2 * (1.0 - s2)))  # clamps to ground
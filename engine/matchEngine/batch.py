@@ -0,0 +1,143 @@
+# matchEngine/batch.py
+"""
+Multi-match runner for seasons / tournaments.
+
+Fixtures are (team_a_id, team_b_id) pairs from `national_teams`. Matches are
+spread over a ProcessPoolExecutor (one worker per core by default); each worker
+loads every squad it may need ONCE in its initializer, then plays headless
+matches from memory. Results are yielded as they complete.
+
+    python3 engine/matchEngine/batch.py --round-robin --out season.jsonl
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import permutations
+from typing import Iterable, Iterator, List, Tuple
+
+from constants import THINK_EVERY_TICKS
+from match import Match
+from utils.db.db_loader import load_team_from_db
+
+Fixture = Tuple[int, int]
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "database", "GameData.db")
+
+# per-worker squad store: {team_id: (team_name, raw_players)}
+_SQUADS: dict = {}
+_DB_PATH: str | None = None
+_THINK_EVERY: int = THINK_EVERY_TICKS
+
+
+def all_team_ids(db_path: str) -> List[int]:
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT nation_team_id FROM national_teams ORDER BY nation_team_id").fetchall()
+    finally:
+        conn.close()
+    return [int(r[0]) for r in rows]
+
+
+def round_robin(team_ids: Iterable[int], double: bool = True) -> List[Fixture]:
+    """Every pairing once (or home and away when double=True)."""
+    ids = list(team_ids)
+    pairs = list(permutations(ids, 2))
+    if not double:
+        pairs = [(a, b) for a, b in pairs if a < b]
+    return pairs
+
+
+def _init_worker(db_path: str, team_ids: Tuple[int, ...], think_every: int) -> None:
+    global _DB_PATH, _THINK_EVERY
+    _DB_PATH = db_path
+    _THINK_EVERY = think_every
+    _SQUADS.clear()
+    for tid in team_ids:
+        _SQUADS[tid] = load_team_from_db(db_path, tid)
+
+
+def _play(index: int, fixture: Fixture, seed: int | None) -> dict:
+    a_id, b_id = fixture
+    match = Match(_DB_PATH, a_id, b_id, seed=seed, squads=_SQUADS, think_every=_THINK_EVERY)
+    result = match.run(headless=True)
+    result["index"] = index
+    result["fixture"] = [a_id, b_id]
+    # the summary records match.seed (drawn at random when seed is None)
+    if result.get("seed") is None:
+        result["seed"] = seed
+    return result
+
+
+def run_fixtures(db_path: str, fixtures: Iterable[Fixture], workers: int | None = None,
+                 seed: int | None = None, think_every: int = THINK_EVERY_TICKS) -> Iterator[dict]:
+    """
+    Play all fixtures in parallel; yields each result dict as soon as it finishes
+    (completion order, not fixture order — use result["index"] to re-order).
+    Match i is seeded with seed + i when a base seed is given. think_every is the
+    support-player re-plan interval (choice/think.py); 1 plans every tick.
+    """
+    fixtures = [(int(a), int(b)) for a, b in fixtures]
+    if not fixtures:
+        return
+    team_ids = tuple(sorted({tid for pair in fixtures for tid in pair}))
+    workers = max(1, min(workers or os.cpu_count() or 1, len(fixtures)))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(db_path, team_ids, think_every)) as pool:
+        futures = [
+            pool.submit(_play, i, fx, None if seed is None else seed + i)
+            for i, fx in enumerate(fixtures)
+        ]
+        for fut in as_completed(futures):
+            yield fut.result()
+
+
+def _parse_fixtures(spec: str) -> List[Fixture]:
+    """'2:1,1:2' -> [(2, 1), (1, 2)]"""
+    out = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        a, b = part.split(":")
+        out.append((int(a), int(b)))
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulate many fixtures headlessly in parallel")
+    parser.add_argument("--db", default=os.path.normpath(DEFAULT_DB),
+                        help="Squad database (default: database/GameData.db)")
+    parser.add_argument("--fixtures", default=None, help="Comma separated team id pairs, e.g. '2:1,1:2'")
+    parser.add_argument("--round-robin", action="store_true", help="Home and away between every team in national_teams")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=None, help="Base seed; match i uses seed + i")
+    parser.add_argument("--think-every", type=int, default=THINK_EVERY_TICKS,
+                        help=f"Support-player re-plan interval in ticks (default {THINK_EVERY_TICKS}; 1 plans every tick)")
+    parser.add_argument("--out", default=None, help="Write one JSON result per line here (default: stdout)")
+    args = parser.parse_args()
+
+    if args.fixtures:
+        fixtures = _parse_fixtures(args.fixtures)
+    elif args.round_robin:
+        fixtures = round_robin(all_team_ids(args.db))
+    else:
+        parser.error("pass --fixtures or --round-robin")
+
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for result in run_fixtures(args.db, fixtures, workers=args.workers, seed=args.seed,
+                                     think_every=args.think_every):
+            out.write(json.dumps(result, separators=(",", ":"), ensure_ascii=False) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,19 @@
 from typing import List, Tuple, Optional
 from utils.actions.catch_windows import best_catcher
 from utils.player.locked_defender import update as update_locked_defender  # ⬅️ NEW
-from choice.general.kick_chase import plan as kick_chase_plan
 from states.open_play import OPEN_PLAY_TAGS
-from .individual import ball_holder_choices as bh_choices
-from .individual import locked_defender_choices as ld_choices
-from choice.general.attack_choices import plan as attack_plan
-from choice.general.defender_choices import plan as defend_plan
-from choice.open_play import scramble as op_scramble
-from choice.open_play import phase as op_phase
-from choice.open_play import joue as op_joue
+from choice.think import support_calls
+from utils.core.lazy import lazy_module
+
+# planners load when play first reaches them (utils/core/lazy)
+bh_choices = lazy_module("choice.individual.ball_holder_choices")
+ld_choices = lazy_module("choice.individual.locked_defender_choices")
+kick_chase = lazy_module("choice.general.kick_chase")
+attack_choices = lazy_module("choice.general.attack_choices")
+defender_choices = lazy_module("choice.general.defender_choices")
+op_scramble = lazy_module("choice.open_play.scramble")
+op_phase = lazy_module("choice.open_play.phase")
+op_joue = lazy_module("choice.open_play.joue")
 XYZ    = Tuple[float, float, float]
 Action = Tuple[str, Optional[str]]
 DoCall = Tuple[str, Action, XYZ, XYZ]
@@ -52,9 +56,10 @@ def select(match, state_tuple) -> List[DoCall]:
         if tag.startswith("open_play.scramble"):
             return op_scramble.plan(match, state_tuple)
         if tag.startswith("open_play.kick_chase"):
-            return kick_chase_plan(match, state_tuple)
+            return kick_chase.plan(match, state_tuple)
         if tag.startswith("open_play.phase_play"):
-            return op_phase.plan(match, state_tuple)
+            # phase shapes are all off-ball players → re-planned at the think rate
+            return list(support_calls(match, "phase", tag, lambda: op_phase.plan(match, state_tuple)))
         if tag.startswith("open_play.line_break"):
             return op_joue.plan(match, state_tuple)      # TODO: dedicated plan later
         if tag.startswith("open_play.turnover"):
@@ -85,21 +90,20 @@ def select(match, state_tuple) -> List[DoCall]:
             ploc = match.get_player_by_code(ld_id).location
             calls.append((ld_id, action, _xyz(ploc), _xyz(target)))
 
-    # 3) Team plans
+    # 3) Team plans (support players; re-planned at the think rate, see choice/think.py)
     already = {pid for (pid, *_rest) in calls}
-    for pid, action, _l, t in [*(attack_plan(match, state_tuple) or []),
-                               *(defend_plan(match, state_tuple) or [])]:
+    team_calls = support_calls(match, "team", tag, lambda: [*(attack_choices.plan(match, state_tuple) or []),
+                                                           *(defender_choices.plan(match, state_tuple) or [])])
+    # (on re-used ticks this loop is most of the work: one lookup per call)
+    hp = match.get_player_by_code(holder) if holder else None
+    for pid, action, _l, t in team_calls:
         if pid in already:
             continue
-        ploc = match.get_player_by_code(pid).location
-        # optional offside retreat (ensure your player object really has .flags)
-        if getattr(match.get_player_by_code(pid), "flags", {}).get("offside", False):
-            hid = _holder_id(match)
-            same_team_as_holder = (hid and
-                match.get_player_by_code(pid).team is match.get_player_by_code(hid).team)
-            if not same_team_as_holder:
-                action, t = ("move", None), (match.ball.location[0] - match.get_player_by_code(pid).team.direction*0.8,
-                                             ploc[1], 0.0)
-        calls.append((pid, action, _xyz(ploc), _xyz(t)))
+        p = match.get_player_by_code(pid)
+        ploc = p.location
+        # offside retreat, except for the holder's own side
+        if p.flags.get("offside", False) and (hp is None or p.team is not hp.team):
+            action, t = ("move", None), (match.ball.location[0] - p.team.direction*0.8, ploc[1], 0.0)
+        calls.append((pid, action, ploc, _xyz(t)))
 
     return calls
@@ -2,6 +2,7 @@
 from typing import List, Tuple, Optional
 from constants import FORWARDS, BACKS
 from states.open_play import OPEN_PLAY_TAGS
+from utils.core.context import tick_context
 
 XYZ    = Tuple[float, float, float]
 Action = Tuple[str, Optional[str]]
@@ -17,22 +18,15 @@ def _xyz(p) -> XYZ:
 def plan(match, state_tuple) -> List[DoCall]:
     tag, _loc, _ctx = state_tuple
 
-    # who’s attacking?
-    team = match.team_a if getattr(match.team_a, "in_possession", False) \
-        else (match.team_b if getattr(match.team_b, "in_possession", False) else None)
-
-    # ⬇️ Fallback: infer from ball.holder
-    if team is None:
-        hid = getattr(match.ball, "holder", None)
-        if isinstance(hid, str) and len(hid) >= 1:
-            team = match.team_a if hid[-1] == "a" else match.team_b
-
-    if team is None:
+    # who’s attacking? (in_possession, falling back to ball.holder)
+    tc = tick_context(match)
+    team_code = tc.attacking
+    if team_code is None:
         return []
 
-    team_code = "a" if team is match.team_a else "b"
-    holder_id = getattr(match.ball, "holder", None)
-    bx, by, _ = _xyz(getattr(match.ball, "location", None))
+    team = tc.team(team_code)
+    holder_id = tc.holder
+    bx, by, _ = _xyz(tc.ball_xyz)
 
     t = (getattr(team, "tactics", None) or {})
     attack_dir   = float(t.get("attack_dir", +1.0))
@@ -47,15 +41,7 @@ def plan(match, state_tuple) -> List[DoCall]:
     # who’s attacking? (unchanged prelude) ...
     # ... resolve team, team_code, holder_id, bx/by, tactics, etc.
 
-    def _eligible(p) -> bool:
-        if p.team_code != team_code: return False
-        if holder_id and f"{p.sn}{p.team_code}" == holder_id: return False
-        sf = p.state_flags
-        if sf.get("locked_defender", False): return False
-        if sf.get("tackling", False) or sf.get("being_tackled", False): return False
-        return True
-
-    elig = [p for p in match.players if _eligible(p)]
+    elig = [p for p in tc.support(team_code) if not (holder_id and f"{p.sn}{p.team_code}" == holder_id)]
     if not elig:
         return []
 
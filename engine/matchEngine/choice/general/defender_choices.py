@@ -1,6 +1,7 @@
 # matchEngine/choice/general/defender_choices.py
 from typing import List, Tuple, Optional
 from states.open_play import OPEN_PLAY_TAGS  # (gated upstream; ok to keep)
+from utils.core.context import tick_context
 
 XYZ    = Tuple[float, float, float]
 Action = Tuple[str, Optional[str]]
@@ -22,24 +23,17 @@ def plan(match, state_tuple) -> List[DoCall]:
     """
     tag, _loc, _ctx = state_tuple
 
-    # --- Who is attacking? ---
-    atk_team = match.team_a if getattr(match.team_a, "in_possession", False) \
-        else (match.team_b if getattr(match.team_b, "in_possession", False) else None)
-
-    # Fallback: infer from holder code like "10a"/"15b"
-    if atk_team is None:
-        hid = getattr(match.ball, "holder", None)
-        if isinstance(hid, str) and hid:
-            atk_team = match.team_a if hid.endswith("a") else match.team_b
-
-    if atk_team is None:
+    # --- Who is attacking? (in_possession, falling back to ball.holder) ---
+    tc = tick_context(match)
+    atk_code = tc.attacking
+    if atk_code is None:
         return []
 
     # --- Defending side + params ---
-    def_team = match.team_b if atk_team is match.team_a else match.team_a
-    def_code = "b" if def_team is match.team_b else "a"
+    def_code = "b" if atk_code == "a" else "a"
+    atk_team, def_team = tc.team(atk_code), tc.team(def_code)
 
-    bx, by, _ = _xyz(getattr(match.ball, "location", None))
+    bx, by, _ = _xyz(tc.ball_xyz)
     atk_tac = (getattr(atk_team, "tactics", None) or {})
     def_tac = (getattr(def_team, "tactics", None) or {})
 
@@ -51,18 +45,10 @@ def plan(match, state_tuple) -> List[DoCall]:
     line_x = bx + attack_dir * line_depth
 
     # --- Eligible defenders ---
-    def _eligible(p) -> bool:
-        if p.team_code != def_code: return False
-        sf = p.state_flags
-        if sf.get("locked_defender", False): return False
-        if sf.get("tackling", False) or sf.get("being_tackled", False): return False
-        return True
-
-    defenders = [p for p in match.players if _eligible(p)]
+    defenders = sorted(tc.support(def_code), key=lambda p: p.rn)
     if not defenders:
         return []
 
-    defenders.sort(key=lambda p: p.rn)
     n = len(defenders)
 
     # --- Targets spaced symmetrically around ball.y ---
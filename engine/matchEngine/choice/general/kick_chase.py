@@ -1,7 +1,10 @@
 # matchEngine/choice/team/kick_chase.py
 from typing import List, Tuple, Optional
-from utils.actions.catch_windows import can_catch, best_catcher
+from utils.actions.catch_windows import can_catch, best_catcher, catch_point
 from utils.actions.jump_helpers import lateral_catch_radius
+from utils.positioning.spatial_index import index_of
+from utils.core.context import tick_context
+from choice.think import support_calls
 XYZ    = Tuple[float, float, float]
 Action = Tuple[str, Optional[str]]
 DoCall = Tuple[str, Action, XYZ, XYZ]   # (player_id, action, location, target)
@@ -12,14 +15,19 @@ def _xyz(p) -> XYZ:
         if len(p) == 2: return (float(p[0]), float(p[1]), 0.0)
         if len(p) >= 3: return (float(p[0]), float(p[1]), float(p[2]))
     return (0.0, 0.0, 0.0)
+CATCH_HEIGHT = 1.6  # m; same ceiling as the best_catcher call in plan()
+
 def _live_ball_point(ball) -> XYZ:
     """
-    While the ball is in the air, chase its transit target (drop zone).
-    After it lands (bounced/skid/idle), chase the live ball.location.
+    While the ball is in the air, chase the point where it drops to catch height.
+    While it skids after the bounce, chase where it will stop; otherwise the live ball.
     """
     tr = getattr(ball, "transit", None) or {}
     if tr.get("type") == "parabola":
-        return _xyz(tr.get("target", getattr(ball, "location", None)))
+        cp = catch_point(ball, max_height=CATCH_HEIGHT)
+        return _xyz(cp[1] if cp else ball.landing_point())
+    if tr.get("type") == "skid":
+        return _xyz(ball.rest_point())
     return _xyz(getattr(ball, "location", None))
 
 def _team_code_of(team, match) -> str:
@@ -36,6 +44,13 @@ def _infer_receiving_team(match):
     # Fallback: which side has the nearest player to where the ball is headed?
     tgt = getattr(match.ball, "target", None) or getattr(match.ball, "location", None)
     bx, by, _ = _live_ball_point(match.ball)
+    index = index_of(match)
+    if index is not None:
+        ha = index.nearest((bx, by), team="a", k=1)
+        hb = index.nearest((bx, by), team="b", k=1)
+        da = ha[0][1] if ha else 1e18
+        db = hb[0][1] if hb else 1e18
+        return match.team_a if da <= db else match.team_b
     best = {"a": (1e18, None), "b": (1e18, None)}
     for p in getattr(match, "players", []):
         px, py, _ = _xyz(p.location)
@@ -45,6 +60,7 @@ def _infer_receiving_team(match):
             best[code] = (d2, p)
     return match.team_a if best["a"][0] <= best["b"][0] else match.team_b
 CATCH_RADIUS = 1.0  # meters
+JUMP_PREFILTER_R = 3.0  # m; upper bound on lateral_catch_radius (≈1.8 m for a 2.1 m player)
 def plan(match, state_tuple) -> List[DoCall]:
     tag, _loc, _ctx = state_tuple
     if not (isinstance(tag, str) and (tag == "open_play.kick_chase" or tag.startswith("open_play.kick_chase."))):
@@ -56,14 +72,18 @@ def plan(match, state_tuple) -> List[DoCall]:
 
     # quick single-player catch (fast path)
     if 2.0 < ball_loc[2] <= 3.5:
-        for p in match.players:
+        index = index_of(match)
+        jumpers = match.players
+        if index is not None:
+            jumpers = sorted(index.within(ball_loc, JUMP_PREFILTER_R), key=lambda pp: pp._row)
+        for p in jumpers:
             radius = lateral_catch_radius(p)
             px, py, _ = _xyz(p.location)
             dx, dy = ball_loc[0] - px, ball_loc[1] - py
             if dx * dx + dy * dy <= radius * radius:
                 return [(f"{p.sn}{p.team_code}", ("jump", None),
                         (px, py, 0.0), ball_loc)]
-    catcher = best_catcher(match.players, ball_loc, radius=1.0, max_height=1.6)
+    catcher = best_catcher(match.players, ball_loc, radius=1.0, max_height=CATCH_HEIGHT)
     if catcher and getattr(match.ball, "holder", None) is None:
         return [(f"{catcher.sn}{catcher.team_code}", ("catch", None),
                 _xyz(catcher.location), (ball_loc[0], ball_loc[1], 0.0))]
@@ -80,14 +100,20 @@ def plan(match, state_tuple) -> List[DoCall]:
     recv_code = _team_code_of(recv_team, match)
     def_code  = _team_code_of(def_team, match)
 
-    recv_players = [p for p in match.players if getattr(p, "team_code", None) == recv_code]
-    def_players  = [p for p in match.players if getattr(p, "team_code", None) == def_code]
+    tc = tick_context(match)
+    recv_players = tc.players(recv_code)
+    def_players  = tc.players(def_code)
 
     def _dist2(p):
         px, py, _ = _xyz(p.location)
         return (px - bx)**2 + (py - by)**2
 
-    fielder = min(recv_players, key=_dist2) if recv_players else None
+    index = index_of(match)
+    if index is not None:
+        hits = index.nearest((bx, by), team=recv_code, k=1)
+        fielder = hits[0][0] if hits else None
+    else:
+        fielder = min(recv_players, key=_dist2) if recv_players else None
 
     calls: List[DoCall] = []
 
@@ -97,19 +123,26 @@ def plan(match, state_tuple) -> List[DoCall]:
     recv_dir = float((getattr(recv_team, "tactics", {}) or {}).get("attack_dir", +1.0))
     def_dir  = float((getattr(def_team,  "tactics", {}) or {}).get("attack_dir", +1.0))
 
-    for p in recv_players:
-        if p is fielder:
-            continue
-        px, py, pz = _xyz(p.location)
-        tx = bx - recv_dir * 5.0
-        ty = py + (by - py) * 0.20
-        calls.append((f"{p.sn}{p.team_code}", ("move", None), (px, py, pz), match.pitch.clamp_position((tx, ty, 0.0))))
-
-    for p in def_players:
-        px, py, pz = _xyz(p.location)
-        tx = bx + def_dir * 5.0
-        ty = py + (by - py) * 0.15
-        calls.append((f"{p.sn}{p.team_code}", ("move", None), (px, py, pz), match.pitch.clamp_position((tx, ty, 0.0))))
-
+    def chase_lines() -> List[DoCall]:
+        lines: List[DoCall] = []
+        for p in recv_players:
+            if p is fielder:
+                continue
+            px, py, pz = _xyz(p.location)
+            tx = bx - recv_dir * 5.0
+            ty = py + (by - py) * 0.20
+            lines.append((f"{p.sn}{p.team_code}", ("move", None), (px, py, pz), match.pitch.clamp_position((tx, ty, 0.0))))
+
+        for p in def_players:
+            px, py, pz = _xyz(p.location)
+            tx = bx + def_dir * 5.0
+            ty = py + (by - py) * 0.15
+            lines.append((f"{p.sn}{p.team_code}", ("move", None), (px, py, pz), match.pitch.clamp_position((tx, ty, 0.0))))
+        return lines
+
+    # everyone but the fielder re-plans at the think rate; the lines hang off the
+    # drop point, which stays put while the ball is in the air (choice/think.py)
+    key = f"kick_chase.{fielder.sn}{fielder.team_code}" if fielder else "kick_chase"
+    calls.extend(support_calls(match, key, tag, chase_lines, anchor=(bx, by)))
     return calls
 
@@ -1,10 +1,12 @@
 
 # matchEngine/choice/individual/ball_holder_choices.py
 from typing import Optional, Tuple, List
-import math, random
+import math
 
 from constants import RUN_PROBE_LEN, EPS, TRYLINE_A_X, TRYLINE_B_X
 from utils.actions.pass_helpers import pass_range, pass_scope
+from utils.core.context import tick_context
+from utils.core.rng import stream
 
 XYZ    = Tuple[float, float, float]
 Action = Tuple[str, Optional[str]]
@@ -47,8 +49,9 @@ def choose(match, holder_id: str, state_tuple) -> Tuple[Optional[Action], Option
             
             
     # --- 2) Under pressure → evade or short probe ---
+    rs = stream(match, "holder", holder_id)
     if _nearest_defender_distance(holder, match) < 5.0:
-        if random.random() < 0.5:
+        if rs.random() < 0.5:
             return (("move", None), _evade_target(holder, attack_dir, match))
         else:
             return (("move", None), match.pitch.clamp_position(
@@ -59,7 +62,7 @@ def choose(match, holder_id: str, state_tuple) -> Tuple[Optional[Action], Option
  
     recvs = _legal_receivers(match, holder, attack_dir, range_, scope)
     if recvs:
-        r = random.choice(recvs)
+        r = rs.choice(recvs)
         rx, ry, rz = r.location
         
         dist = math.hypot(rx - x, ry - y)
@@ -72,7 +75,7 @@ def choose(match, holder_id: str, state_tuple) -> Tuple[Optional[Action], Option
         return (("pass", subtype), match.pitch.clamp_position((rx, ry, rz if rz else 1.0)))
 
     # --- 4) Kick option ---
-    kick_subtype = random.choice(["exit", "bomb", "chip", "grubber"])
+    kick_subtype = rs.choice(["exit", "bomb", "chip", "grubber"])
     k_target = _kick_target_for(holder, match, kick_subtype, attack_dir)
     return (("kick", kick_subtype), k_target)
 
@@ -83,14 +86,7 @@ def _attack_dir_for(player, match) -> float:
                  else match.team_b.tactics["attack_dir"])
 
 def _nearest_defender_distance(holder, match) -> float:
-    hx, hy, _ = holder.location
-    best = 1e9
-    for p in match.players:
-        if p.team_code == holder.team_code: continue
-        px, py, _ = p.location
-        d = math.hypot(px - hx, py - hy)
-        if d < best: best = d
-    return best
+    return tick_context(match).nearest_opponent_dist(holder)
 
 def _nearest_legal_receiver_within(match, holder, attack_dir: float, max_range: float):
     hx, hy, _ = holder.location
@@ -157,5 +153,5 @@ def _kick_target_for(holder, match, subtype: str, attack_dir: float) -> XYZ:
 
 def _evade_target(holder, attack_dir: float, match) -> XYZ:
     x, y, _ = holder.location
-    lateral = 3.0 * (1 if (random.random() < 0.5) else -1)  # ±3m
+    lateral = 3.0 * (1 if (stream(match, "holder.evade", holder.code).random() < 0.5) else -1)  # ±3m
     return match.pitch.clamp_position((x + 2.0 * attack_dir, y + lateral, 0.0))
\ No newline at end of file
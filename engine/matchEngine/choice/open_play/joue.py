@@ -5,6 +5,7 @@ from choice.general.defender_choices import plan as defend_plan
 from choice.individual import ball_holder_choices as bh_choices
 from choice.individual import locked_defender_choices as ld_choices
 from utils.player.locked_defender import update as update_locked_defender
+from choice.think import support_calls
 
 Do = Tuple[str, Tuple[str, Optional[str]], tuple, tuple]  # (pid, (action, subtype), from_xyz, to_xyz)
 
@@ -42,9 +43,9 @@ def plan(match, state_tuple) -> List[Do]:
     # 3) Team-level shaping (general open-play, not phase-shape)
     already = {pid for (pid, *_rest) in calls}
 
-    team_calls: List[Do] = []
-    team_calls += attack_plan(match, state_tuple) or []
-    team_calls += defend_plan(match, state_tuple) or []
+    # support players re-plan at the think rate (choice/think.py), not every tick
+    team_calls: List[Do] = support_calls(match, "team", tag, lambda: [*(attack_plan(match, state_tuple) or []),
+                                                                       *(defend_plan(match, state_tuple) or [])])
 
     for pid, action, loc_from, loc_to in team_calls:
         if pid in already:
@@ -14,7 +14,9 @@ if the player is the first player in and a defender the ruck they will jackal el
  """
 # engine/matchEngine/choice/ruck/forming.py
 from typing import List, Tuple, Optional
-import random
+from utils.core.rng import stream
+from utils.positioning.spatial_index import index_of
+from utils.core.context import tick_context
 DoCall = Tuple[str, Tuple[str, Optional[str]], Tuple[float,float,float], Tuple[float,float,float]]
 
 R_ENTER = 1.0     # within 1m => enter ruck (attack side non-DH)
@@ -33,6 +35,12 @@ def _engagement_score(match, atk: str, bx: float, by: float) -> float:
     """Very simple heuristic you can swap later."""
     # attackers near base – defenders near base
     a = d = 0
+    index = index_of(match)
+    if index is not None:
+        for p in index.within((bx, by), 2.5):
+            if p.team_code == atk: a += 1
+            else: d += 1
+        return (a - d) * 0.6
     for p in match.players:
         d2 = _d2(p.location[0], p.location[1], bx, by)
         if d2 <= (2.5*2.5):
@@ -70,8 +78,9 @@ def plan(match, state_tuple) -> List[DoCall]:
     
 
     # attacker side logic
-    attackers = [p for p in match.players if p.team_code == atk]
-    defenders = [p for p in match.players if p.team_code != atk]
+    tc = tick_context(match)
+    attackers = tc.players(atk)
+    defenders = tc.players("b" if atk == "a" else "a")
 
     # if no attacker near base, nearest attacker moves to base
     if not any(_d2(p.location[0], p.location[1], bx, by) <= R2 for p in attackers):
@@ -156,7 +165,8 @@ def plan(match, state_tuple) -> List[DoCall]:
             )
         att_val = sum(_val(p) for p in atk_rs[: len(barge_ds) + 1])
         def_val = sum(_val(p) for p in barge_ds)
-        round_score = att_val * (random.random() ** (1 / 3)) - def_val * (random.random() ** (1 / 3))
+        rs = stream(match, "ruck.barge", atk)
+        round_score = att_val * (rs.random() ** (1 / 3)) - def_val * (rs.random() ** (1 / 3))
         match._barge_score = getattr(match, "_barge_score", 0.0) + round_score
         match._barge_round = getattr(match, "_barge_round", 0) + 1
         for p in barge_ds:
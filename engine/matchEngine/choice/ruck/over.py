@@ -1,7 +1,9 @@
 # engine/matchEngine/choice/ruck/over.py
 from typing import List, Tuple, Optional
 from utils.positioning.mental.phase import phase_attack_targets, phase_defence_targets
+from choice.think import support_calls
 from utils.player.dh_assign import assign_dh_for_over
+from utils.core.context import tick_context
 
 DoCall = Tuple[str, Tuple[str, Optional[str]], Tuple[float,float,float], Tuple[float,float,float]]
 
@@ -16,16 +18,10 @@ def _wait_limit_ticks(match) -> int:
     tps = getattr(match, "ticks_per_second", 5)
     return int(5 * max(1, tps))
 
-def _team_ready(match, atk: str, base_xy, dh_id: Optional[str]) -> bool:
-    bx, by = base_xy
-    targets = phase_attack_targets(match, atk, (bx, by))
+def _team_ready(match, atk: str, targets, dh_id: Optional[str]) -> bool:
     ready = 0
     total = 0
-    for p in match.players:
-        if p.team_code != atk: 
-            continue
-        if p.state_flags.get("in_ruck", False):
-            continue
+    for p in tick_context(match).players(atk, without="in_ruck"):
         pid = f"{p.sn}{p.team_code}"
         if dh_id and pid == dh_id:
             continue
@@ -38,6 +34,11 @@ def _team_ready(match, atk: str, base_xy, dh_id: Optional[str]) -> bool:
     # 10/15 in place (or 2/3 of available non-ruck, non-DH players)
     return (ready >= 10) or (total and ready / total >= 0.66)
 
+def _shapes(match, tag, atk: str, deff: str, base_xy):
+    """(attack, defence) phase targets; they only depend on the ball, so re-planned at the think rate."""
+    return support_calls(match, f"ruck.over.{atk}", tag, lambda: (
+        phase_attack_targets(match, atk, base_xy), phase_defence_targets(match, deff, base_xy)))
+
 def plan(match, state_tuple) -> List[DoCall]:
     bx, by, _ = _xyz(getattr(match.ball, "location", None))
     base_xy = (bx, by)
@@ -54,12 +55,8 @@ def plan(match, state_tuple) -> List[DoCall]:
     calls: List[DoCall] = []
 
     # players not in ruck: move to phase shapes
-    atk_targets = phase_attack_targets(match, atk, base_xy)
-    for p in match.players:
-        if p.team_code != atk: 
-            continue
-        if p.state_flags.get("in_ruck", False):
-            continue
+    atk_targets, def_targets = _shapes(match, state_tuple[0], atk, deff, base_xy)
+    for p in tick_context(match).players(atk, without="in_ruck"):
         pid = f"{p.sn}{p.team_code}"
         if dh_id and pid == dh_id:
             continue
@@ -68,10 +65,7 @@ def plan(match, state_tuple) -> List[DoCall]:
             continue
         calls.append((pid, ("move", None), _xyz(p.location), tgt))
 
-    def_targets = phase_defence_targets(match, deff, base_xy)
-    for p in match.players:
-        if p.team_code != deff or p.state_flags.get("in_ruck", False):
-            continue
+    for p in tick_context(match).players(deff, without="in_ruck"):
         calls.append((f"{p.sn}{p.team_code}", ("move", None), _xyz(p.location), def_targets.get(p, _xyz(p.location))))
 
     # DH waits until ready or timeout, then PICK
@@ -79,7 +73,7 @@ def plan(match, state_tuple) -> List[DoCall]:
         dh = match.get_player_by_code(dh_id)
         px, py, _ = _xyz(dh.location)
         close = _d2((px,py), base_xy) <= (1.5*1.5)
-        ready = _team_ready(match, atk, base_xy, dh_id)
+        ready = _team_ready(match, atk, atk_targets, dh_id)
         timeout = match._ruck_over_wait >= _wait_limit_ticks(match)
 
         if not close:
@@ -1,5 +1,6 @@
 # choice/ruck/start.py
 from typing import List, Tuple, Optional
+from utils.core.context import tick_context
 DoCall = Tuple[str, Tuple[str, Optional[str]], Tuple[float,float,float], Tuple[float,float,float]]
 
 def _xyz(p): 
@@ -11,7 +12,7 @@ def plan(match, state_tuple) -> List[DoCall]:
     deff = "b" if atk == "a" else "a"
 
     def nearest(code, n):
-        ps = [p for p in match.players if p.team_code == code]
+        ps = list(tick_context(match).players(code))
         ps.sort(key=lambda p:(p.location[0]-bx)**2 + (p.location[1]-by)**2)
         return ps[:n]
 
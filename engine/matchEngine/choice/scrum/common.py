@@ -1,8 +1,8 @@
 from typing import List, Tuple, Dict, Optional
-import random
 
 from team.team_controller import team_by_code, set_possession
 from utils.probs.scale import scale_factor_lookup
+from utils.core.rng import stream
 
 # -----------------------------
 # Team & formation helpers
@@ -264,12 +264,13 @@ def compute_stage_3(match, atk_code: str, s: ScrumScore) -> None:
 
     def_code = other(atk_code)
 
-    atk_term = (pack_weight(atk_code) / 1000.0) * prop_scrum_sum(atk_code) * random.random()
-    def_term = (pack_weight(def_code) / 1000.0) * prop_scrum_sum(def_code) * random.random()
+    rs = stream(match, "scrum.stage3", atk_code)
+    atk_term = (pack_weight(atk_code) / 1000.0) * prop_scrum_sum(atk_code) * rs.random()
+    def_term = (pack_weight(def_code) / 1000.0) * prop_scrum_sum(def_code) * rs.random()
 
     s.value += atk_term - def_term
 
-    if random.random() < 0.5:
+    if rs.random() < 0.5:
         s.lock_out = True
 
    
@@ -18,15 +18,7 @@ def get_options(match, state_tuple) -> List[Option]:
 
 
 def _push_event(match, next_tag: str, loc, ctx) -> None:
-    try:
-        if hasattr(event, "push"):
-            event.push(match, next_tag, loc, ctx)
-        elif hasattr(event, "emit"):
-            event.emit(match, next_tag, loc, ctx)
-        else:
-            setattr(match, "next_state_tag", (next_tag, loc, ctx))
-    except Exception:
-        setattr(match, "next_state_tag", (next_tag, loc, ctx))
+    event.push(match, next_tag, loc, ctx)
 
 
 def apply_choice(match, state_tuple, choice: str) -> None:
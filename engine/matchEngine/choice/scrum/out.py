@@ -5,11 +5,15 @@ Mirrors ruck/out but for scrums.
 
 from typing import List, Tuple, Optional
 from utils.positioning.mental.phase import phase_attack_targets, phase_defence_targets
+from choice.think import support_calls
+from utils.core.context import tick_context
+from utils.player.state_arrays import flag_mask
 import math
 DoCall = Tuple[str, Tuple[str, Optional[str]], Tuple[float,float,float], Tuple[float,float,float]]
 READY_DIST = 5.0
 READY_D2   = READY_DIST * READY_DIST
 PRESENT_HOLD_TICKS = 18  # ~0.9s @ 20Hz; tweak to taste
+_SCRUM_DONE = flag_mask("in_scrum", "being_tackled", "tackling")
 
 def _xyz(p): 
     return tuple(p) if isinstance(p,(list,tuple)) else (0.0,0.0,0.0)
@@ -62,13 +66,9 @@ def _assign_first_receiver(match, atk: str, dh_id: str, base_xy) -> Optional[obj
     return r
 
 
-def _team_ready(match, atk: str, base_xy, dh_id: Optional[str]) -> bool:
-    bx, by = base_xy
-    targets = phase_attack_targets(match, atk, (bx, by))
+def _team_ready(match, atk: str, targets, dh_id: Optional[str]) -> bool:
     ready = total = 0
-    for p in match.players:
-        if p.team_code != atk or p.state_flags.get("in_scrum", False):
-            continue
+    for p in tick_context(match).players(atk, without="in_scrum"):
         pid = f"{p.sn}{p.team_code}"
         if dh_id and pid == dh_id:
             continue
@@ -92,9 +92,7 @@ def _choose_receiver(match, atk: str, dh_id: str):
     dx, dy, _ = _xyz(dh.location)
     best = None
     best_d2 = 1e9
-    for p in match.players:
-        if p.team_code != atk or p.state_flags.get("in_scrum", False):
-            continue
+    for p in tick_context(match).players(atk, without="in_scrum"):
         pid = f"{p.sn}{p.team_code}"
         if pid == dh_id:
             continue
@@ -105,6 +103,11 @@ def _choose_receiver(match, atk: str, dh_id: str):
             best_d2, best = d2, p
     return best
 
+def _shapes(match, tag, atk: str, deff: str, base_xy):
+    """(attack, defence) phase targets; they only depend on the ball, so re-planned at the think rate."""
+    return support_calls(match, f"scrum.out.{atk}", tag, lambda: (
+        phase_attack_targets(match, atk, base_xy), phase_defence_targets(match, deff, base_xy)))
+
 def plan(match, state_tuple) -> List[DoCall]:
     bx, by, _ = _xyz(getattr(match.ball, "location", None))
     atk = getattr(match, "possession", "a")
@@ -117,10 +120,8 @@ def plan(match, state_tuple) -> List[DoCall]:
     calls: List[DoCall] = []
 
     # attackers not in scrum → shapes
-    atk_targets = phase_attack_targets(match, atk, (bx, by))
-    for p in match.players:
-        if p.team_code != atk or p.state_flags.get("in_scrum", False):
-            continue
+    atk_targets, def_targets = _shapes(match, state_tuple[0], atk, deff, (bx, by))
+    for p in tick_context(match).players(atk, without="in_scrum"):
         pid = f"{p.sn}{p.team_code}"
         if dh_id and pid == dh_id:
             continue
@@ -129,10 +130,7 @@ def plan(match, state_tuple) -> List[DoCall]:
             calls.append((pid, ("move", None), _xyz(p.location), tgt))
 
     # defenders not in scrum → shapes
-    def_targets = phase_defence_targets(match, deff, (bx, by))
-    for p in match.players:
-        if p.team_code != deff or p.state_flags.get("in_scrum", False):
-            continue
+    for p in tick_context(match).players(deff, without="in_scrum"):
         tgt = def_targets.get(p)
         if tgt:
             calls.append((f"{p.sn}{p.team_code}", ("move", None), _xyz(p.location), tgt))
@@ -140,7 +138,7 @@ def plan(match, state_tuple) -> List[DoCall]:
     # DH gating similar to ruck/out
     _assign_first_receiver(match, atk, dh_id, (bx, by))
     if dh_id and getattr(match.ball, "holder", None) == dh_id:
-        ready = _team_ready(match, atk, (bx, by), dh_id)
+        ready = _team_ready(match, atk, atk_targets, dh_id)
         timeout = match._scrum_out_wait >= _wait_limit_ticks(match)
         receiver = _choose_receiver(match, atk, dh_id) if (ready or timeout) else None
 
@@ -162,8 +160,6 @@ def plan(match, state_tuple) -> List[DoCall]:
 
     # clear scrum flags once out logic runs
     for p in match.players:
-        p.state_flags["in_scrum"] = False
-        p.state_flags["being_tackled"] = False
-        p.state_flags["tackling"] = False
+        p.state_flags.clear_bits(_SCRUM_DONE)
 
     return calls
\ No newline at end of file
@@ -0,0 +1,108 @@
+# matchEngine/choice/think.py
+"""
+Decision-rate scheduler for support (off-ball) players.
+
+The ball holder, the locked defender and catch contenders decide every tick
+in choice_controller / the open-play routers. The team-shape plans for the
+other ~28 players (attack_plan + defend_plan, phase shapes, the ruck / scrum
+out shapes, kick-chase lines) only change when the picture does, so they are
+re-planned when:
+
+  - THINK_EVERY_TICKS ticks have passed since the last plan,
+  - the state tag, ball holder or possession changed,
+  - any player's locked_defender / tackling / being_tackled / in_ruck /
+    hold_for_pass flag changed (eligibility for the plans),
+  - the ball moved more than THINK_BALL_MOVE_M since the last plan.
+
+In between, the cached calls are re-issued, so players keep moving to the
+targets they last chose. attack_plan counts hold_for_pass down every time it
+runs; on a re-used tick the scheduler does that countdown for the players the
+last plan held, so a pass hold lasts the same number of ticks either way.
+"""
+
+from typing import Callable, Dict, List
+
+from constants import THINK_BALL_MOVE_M, THINK_EVERY_TICKS
+from utils.player.state_arrays import FLAG_BITS, arrays_of
+
+_ELIGIBILITY_BITS = 0
+for _name in ("locked_defender", "tackling", "being_tackled", "in_ruck", "hold_for_pass"):
+    _ELIGIBILITY_BITS |= FLAG_BITS[_name]
+_HOLD_BIT = FLAG_BITS["hold_for_pass"]
+
+
+class ThinkScheduler:
+    def __init__(self, every: int = THINK_EVERY_TICKS, ball_move_m: float = THINK_BALL_MOVE_M):
+        self.every = max(1, int(every))
+        self.ball_move2 = float(ball_move_m) ** 2
+        self._plans: Dict[str, tuple] = {}     # key -> (tick, snapshot, ball_xy, calls, held players)
+        self.planned = 0                       # counters for profiling / tests
+        self.reused = 0
+
+    def _snapshot(self, match, tag, store):
+        flags = (store.flags & _ELIGIBILITY_BITS).tobytes()
+        return (
+            tag,
+            getattr(match.ball, "holder", None),
+            getattr(match, "possession", None),
+            getattr(match.team_a, "in_possession", None),
+            getattr(match.team_b, "in_possession", None),
+            flags,
+        )
+
+    def support_calls(self, match, key: str, tag, compute: Callable[[], List], anchor=None) -> List:
+        """
+        compute() → the support players' calls; cached per `key` until a re-plan is due.
+        anchor: the (x, y) the plan is laid out from, if not the ball (e.g. a kick's drop point).
+        """
+        store = arrays_of(match)
+        if store is None or self.every == 1:
+            return compute()
+        store.refresh_flags()
+        snap = self._snapshot(match, tag, store)
+        bx, by = anchor if anchor is not None else match.ball.location[:2]
+        tick = match.tick_count
+
+        entry = self._plans.get(key)
+        if entry is not None:
+            last_tick, last_snap, (lx, ly), calls, held = entry
+            if (
+                snap == last_snap
+                and tick - last_tick < self.every
+                and (bx - lx) * (bx - lx) + (by - ly) * (by - ly) <= self.ball_move2
+            ):
+                for p in held:
+                    _tick_hold(p)
+                self.reused += 1
+                return calls
+
+        holding = _holds(match, store)
+        calls = compute()
+        held = [p for p, v in holding if _hold(p) < v]
+        self._plans[key] = (tick, snap, (bx, by), calls, held)
+        self.planned += 1
+        return calls
+
+
+def _hold(p) -> int:
+    return int(p.state_flags.get("hold_for_pass", 0) or 0)
+
+
+def _tick_hold(p) -> None:
+    """Same countdown as attack_plan's _tick_hold."""
+    v = _hold(p)
+    if v > 0:
+        p.state_flags["hold_for_pass"] = v - 1
+
+
+def _holds(match, store) -> list:
+    """[(player, hold ticks left)] for players with a running hold_for_pass."""
+    if not (store.flags & _HOLD_BIT).any():
+        return []
+    return [(p, _hold(p)) for p in match.players if _hold(p) > 0]
+
+
+def support_calls(match, key: str, tag, compute: Callable[[], List], anchor=None) -> List:
+    """Route through the match's scheduler, or plan every tick without one (test doubles)."""
+    think = getattr(match, "think", None)
+    return compute() if think is None else think.support_calls(match, key, tag, compute, anchor)
@@ -1,5 +1,7 @@
 # matchEngine/constants.py
 
+ENGINE_VERSION = "1.0.0"  # keep in step with package.json; stamped into replay headers
+
 # ------------------------------------------------------------------------------
 # Core Pitch Dimensions (in meters)
 # ------------------------------------------------------------------------------
@@ -116,6 +118,7 @@ OFFSIDE_OPENPLAY_BUFFER = 1.0     # meters behind last feet / last kick point
 # Scoring
 POINTS = {"try": 5, "conv": 2, "pen": 3, "dg": 3}
 
+HALF_LENGTH_S = 40 * 60.0        # regulation time per half (seconds)
 CONVERSION_WINDOW_S = 45.0       # time allowed to attempt kick at goal
 CONVERSION_SPOT_OFFSET_X = 0.0   # x is try spot; ball placed on y of try
 CONVERSION_DEFAULT_DIST = 25.0   # meters back from try line (fallback if you want)
@@ -127,7 +130,23 @@ FIFTY22_TARGET_MINX = 78.0       # must go out past opponent 22 via bounce
 
 POST_GAP = 2.5
 CROSSBAR = 3.0
-GameSpeed =2
+# movement model calibration: players cover MOVE_DT_SCALE × tick_rate seconds of
+# motion per tick. Physics only – watch speed is Match.run(speed=...), which
+# scales wall-clock pacing and never the simulation.
+MOVE_DT_SCALE = 2
+BATCH_MOVEMENT = True   # integrate a tick's move calls in one NumPy step (actions/movement.do_actions_batch)
+
+
 
 
+# Decision-rate scheduler (choice/think.py): support players re-plan every
+# THINK_EVERY_TICKS ticks, or at once on a holder / tag / possession / flag
+# change or when the ball moved more than THINK_BALL_MOVE_M. Between plans a
+# cached target is at most ~1 m off a fresh one. 1 = plan every tick
+# (Match(think_every=1), batch.py --think-every 1), the reference behaviour.
+THINK_EVERY_TICKS = 5
+THINK_BALL_MOVE_M = 1.0
 
+# StateController keeps the last N (tick, last_action, curr_action, tag) resolutions
+# (states/transitions.TransitionTrace) for post-match analysis.
+TRANSITION_TRACE_SIZE = 512
@@ -0,0 +1,329 @@
+# matchEngine/daemon.py
+"""
+Resident match engine driven over stdio.
+
+One process serves match after match: modules, compiled tables, squad and
+formation caches stay warm, so load_match is a few milliseconds instead of an
+interpreter start. Both directions use the tick_stream framing
+
+    u8 type | u32 payload_len | payload        (little-endian)
+
+  stdin   REQUEST (16)  JSON {"id": any, "cmd": str, "args": {...}}
+  stdout  REPLY   (17)  JSON {"id", "ok": true, "result": ...} or {"id", "ok": false, "error": str}
+          EVENT   (18)  JSON {"event": "full_time" | "stopped" | "error", "tick", "time", "score"}
+          ROSTER / STRING / KEYFRAME / DELTA frames exactly as utils/core/tick_stream
+          (a new roster after load_match and substitute)
+
+Commands (args):
+  load_match     team_a, team_b, [seed], [db]    new match, first keyframe sent at once
+  run            [ticks], [fps]                  play in real time at the current speed
+  pause                                          stop the clock (frames stop)
+  set_speed      speed                           wall-clock pacing only, physics unchanged
+  step           [n=1]                           play n ticks now, paused or not
+  substitute     off ("10a"), player_id | player (db_loader dict)
+  set_tactics    team ("a" / "b"), tactics {...}
+  snapshot                                       -> {"snapshot": id, "tick"}
+  restore        snapshot
+  invalidate_cache [db], [team]                  drop cached squads (after the UI edits them)
+  status
+  quit
+
+Requests are read on a thread and handled between ticks, so pause / speed
+changes apply on the next tick. Stray engine prints go to stderr.
+
+    python3 engine/matchEngine/daemon.py --db tmp/temp.db
+"""
+
+import argparse
+import contextlib
+import inspect
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import traceback
+
+from match import Match
+from utils.core.frames import FrameClock
+from utils.core.tick_stream import BinaryTickWriter, DEFAULT_KEYFRAME_EVERY
+from utils.db.db_loader import invalidate_squad_cache, load_player_from_db
+
+MSG_REQUEST, MSG_REPLY, MSG_EVENT = 16, 17, 18
+
+DEFAULT_DB = "tmp/temp.db"
+ENGINE_TACTICS = {"attack_dir"}      # owned by the engine (swapped at half time)
+
+_HEAD = struct.Struct("<BI")
+
+
+class DaemonError(Exception):
+    """A request the daemon refuses; reported in the reply, the process keeps serving."""
+
+
+def read_message(fp):
+    """(type, payload) from a binary stream, or None at EOF."""
+    head = fp.read(_HEAD.size)
+    if len(head) < _HEAD.size:
+        return None
+    msg_type, n = _HEAD.unpack(head)
+    payload = fp.read(n)
+    if len(payload) < n:
+        return None
+    return msg_type, payload
+
+
+class EngineDaemon:
+    def __init__(self, inp, out, db_path: str = DEFAULT_DB, keyframe_every: int = DEFAULT_KEYFRAME_EVERY):
+        self.inp = inp
+        self.out = out
+        self.db_path = db_path
+        self.keyframe_every = keyframe_every
+        self.requests: "queue.Queue" = queue.Queue()
+        self.match = None
+        self.writer = None
+        self.clock = None
+        self.running = False
+        self.speed = 1.0
+        self.fps = None
+        self.ticks_left = None          # run(ticks=N) budget, None = until paused / full time
+        self.snapshots = {}
+        self.closed = False
+
+    # -----------------------
+    # io
+    # -----------------------
+    def _write(self, msg_type: int, payload: bytes) -> None:
+        self.out.write(_HEAD.pack(msg_type, len(payload)))
+        self.out.write(payload)
+        self.out.flush()
+
+    def _json(self, msg_type: int, blob: dict) -> None:
+        self._write(msg_type, json.dumps(blob, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+    def _read_loop(self) -> None:
+        while True:
+            msg = read_message(self.inp)
+            if msg is None:
+                self.requests.put({"id": None, "cmd": "quit"})
+                return
+            msg_type, payload = msg
+            if msg_type != MSG_REQUEST:
+                continue
+            try:
+                self.requests.put(json.loads(payload.decode("utf-8")))
+            except ValueError as exc:
+                self.requests.put({"id": None, "cmd": "_bad", "args": {"error": str(exc)}})
+
+    # -----------------------
+    # loop
+    # -----------------------
+    def serve(self) -> None:
+        threading.Thread(target=self._read_loop, name="daemon-stdin", daemon=True).start()
+        next_t = time.monotonic()
+        while not self.closed:
+            if not self.running:
+                self.handle(self.requests.get())
+                next_t = time.monotonic()
+                continue
+            # requests that arrive before the next tick is due are handled first
+            try:
+                req = self.requests.get(timeout=max(0.0, next_t - time.monotonic()))
+            except queue.Empty:
+                req = None
+            if req is not None:
+                self.handle(req)
+                continue
+            try:
+                self._tick()
+            except Exception as exc:
+                # a broken tick stops the clock; the process keeps serving
+                traceback.print_exc(file=sys.stderr)
+                self.running = False
+                self._json(MSG_EVENT, {"event": "error", "error": f"{type(exc).__name__}: {exc}", **self._where()})
+                continue
+            budget = self.match.tick_rate / max(self.speed, 1e-6)
+            next_t = max(next_t + budget, time.monotonic() - budget)
+
+    def handle(self, req: dict) -> None:
+        rid, cmd = req.get("id"), req.get("cmd")
+        fn = COMMANDS.get(cmd)
+        args = req.get("args") or {}
+        try:
+            if fn is None:
+                raise DaemonError(f"unknown command {cmd!r}")
+            try:
+                inspect.signature(fn).bind(self, **args)
+            except TypeError as exc:
+                raise DaemonError(f"bad arguments for {cmd}: {exc}") from None
+            result = fn(self, **args)
+        except (DaemonError, ValueError, KeyError) as exc:
+            self._json(MSG_REPLY, {"id": rid, "ok": False, "error": str(exc)})
+        except Exception as exc:
+            traceback.print_exc(file=sys.stderr)
+            self._json(MSG_REPLY, {"id": rid, "ok": False, "error": f"{type(exc).__name__}: {exc}"})
+        else:
+            self._json(MSG_REPLY, {"id": rid, "ok": True, "result": result})
+
+    def _tick(self) -> None:
+        m = self.match
+        if m.period["status"] == "full_time":
+            self.running = False
+            return
+        self.clock.before_tick()
+        m._advance_clock()
+        if m.period["status"] != "full_time":
+            m.state.tick()
+        for _ in self.clock.due():
+            self.writer.write_tick()
+        if self.ticks_left is not None:
+            self.ticks_left -= 1
+            if self.ticks_left <= 0:
+                self.running = False
+                self._json(MSG_EVENT, {"event": "stopped", **self._where()})
+        if m.period["status"] == "full_time":
+            self.running = False
+            self._json(MSG_EVENT, {"event": "full_time", **self._where()})
+
+    def _where(self) -> dict:
+        m = self.match
+        return {"tick": m.tick_count, "time": round(m.match_time, 2), "score": dict(m.scoreboard)}
+
+    def _need_match(self):
+        if self.match is None:
+            raise DaemonError("no match loaded (send load_match first)")
+        return self.match
+
+    def _new_writer(self) -> None:
+        """Fresh roster header, then a keyframe straight away."""
+        self.writer = BinaryTickWriter(self.match, self.out, keyframe_every=self.keyframe_every)
+        self.writer.write_tick()
+
+    # -----------------------
+    # commands
+    # -----------------------
+    def cmd_load_match(self, team_a, team_b, seed=None, db=None):
+        self.running = False
+        self.snapshots.clear()
+        self.match = Match(db or self.db_path, int(team_a), int(team_b), seed=seed)
+        self.clock = FrameClock(self.match, fps=self.fps)
+        self._new_writer()
+        m = self.match
+        return {"teams": {"a": m.team_a.name, "b": m.team_b.name}, "seed": m.seed, "tick": m.tick_count}
+
+    def cmd_run(self, ticks=None, fps=None):
+        m = self._need_match()
+        if fps is not None:
+            self.fps = float(fps)
+            self.clock = FrameClock(m, fps=self.fps)
+        self.ticks_left = int(ticks) if ticks is not None else None
+        self.running = m.period["status"] != "full_time"
+        return {"running": self.running, **self._where()}
+
+    def cmd_pause(self):
+        self.running = False
+        return self._where() if self.match is not None else {}
+
+    def cmd_set_speed(self, speed):
+        speed = float(speed)
+        if speed <= 0:
+            raise DaemonError("speed must be positive")
+        self.speed = speed
+        return {"speed": speed}
+
+    def cmd_step(self, n=1):
+        m = self._need_match()
+        ticks_left, self.ticks_left = self.ticks_left, None
+        for _ in range(max(0, int(n))):
+            if m.period["status"] == "full_time":
+                break
+            self._tick()
+        self.ticks_left = ticks_left
+        return self._where()
+
+    def cmd_substitute(self, off, player_id=None, player=None):
+        m = self._need_match()
+        if player is None:
+            if player_id is None:
+                raise DaemonError("substitute needs player_id or player")
+            player = load_player_from_db(self.db_path, int(player_id))
+        on = m.substitute(off, player)
+        self._new_writer()
+        return {"on": on.name, "code": on.code, "sn": on.sn}
+
+    def cmd_set_tactics(self, team, tactics):
+        m = self._need_match()
+        if team not in ("a", "b"):
+            raise DaemonError(f"team must be 'a' or 'b', not {team!r}")
+        locked = ENGINE_TACTICS & set(tactics)
+        if locked:
+            raise DaemonError(f"tactics set by the engine: {', '.join(sorted(locked))}")
+        target = m.team_a if team == "a" else m.team_b
+        target.tactics.update(tactics)
+        return {"tactics": target.tactics}
+
+    def cmd_snapshot(self):
+        m = self._need_match()
+        sid = len(self.snapshots) + 1
+        while sid in self.snapshots:
+            sid += 1
+        self.snapshots[sid] = m.snapshot()
+        return {"snapshot": sid, "tick": m.tick_count}
+
+    def cmd_restore(self, snapshot):
+        m = self._need_match()
+        snap = self.snapshots.get(int(snapshot))
+        if snap is None:
+            raise DaemonError(f"no snapshot {snapshot!r}")
+        m.restore(snap)
+        self.clock = FrameClock(m, fps=self.fps)      # the frame schedule restarts at the restored tick
+        self.writer.write_tick()
+        return self._where()
+
+    def cmd_invalidate_cache(self, db=None, team=None):
+        dropped = invalidate_squad_cache(db or self.db_path, None if team is None else int(team))
+        return {"dropped": dropped}
+
+    def cmd_status(self):
+        if self.match is None:
+            return {"loaded": False}
+        return {"loaded": True, "running": self.running, "speed": self.speed,
+                "half": self.match.period["half"], **self._where()}
+
+    def cmd_quit(self):
+        self.running = False
+        self.closed = True
+        return {}
+
+    def cmd__bad(self, error):
+        raise DaemonError(f"malformed request: {error}")
+
+
+COMMANDS = {
+    name[len("cmd_"):]: fn for name, fn in vars(EngineDaemon).items() if name.startswith("cmd_")
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Resident match engine over a framed stdio protocol")
+    parser.add_argument("--db", default=DEFAULT_DB, help="Squad database (default: tmp/temp.db)")
+    parser.add_argument("--keyframe-every", type=int, default=DEFAULT_KEYFRAME_EVERY,
+                        help="Frames between binary keyframes")
+    args = parser.parse_args()
+
+    daemon = EngineDaemon(sys.stdin.buffer, sys.stdout.buffer, db_path=args.db,
+                          keyframe_every=args.keyframe_every)
+    # the framed protocol owns the real stdout; engine debug prints go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        daemon.serve()
+    # the stdin reader may still be blocked in read(); interpreter shutdown
+    # would abort on its buffer lock, so leave without it once output is out
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
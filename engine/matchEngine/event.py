@@ -1,46 +1,109 @@
 # matchEngine/events.py
 
 """
-Events: minimal whistle-layer.
-- Maintains a new_event tuple: (type, location, team)
-- Called by state_controller; everything else (ball/controller) stays separate.
+Events: minimal whistle-layer, one EventBus per match (match.events).
+
+- push(match, type, location, team) queues an Event; nothing is overwritten,
+  so two infringements in one tick are both kept.
+- StateController._event_check drains the bus once per tick: the highest
+  priority event (try > penalty > scrum > lineout > anything else; FIFO within
+  a priority) becomes the state, the rest stay inspectable on bus.last_drained.
+- Everything else (ball/controller) stays separate.
 """
 
-from typing import Optional, Tuple, Any
+from typing import Any, List, NamedTuple, Optional
 
-# global current event tuple
-new_event: Optional[Tuple[str, tuple[float, float], Any]] = None
+# lower = more important; keyed by the event family (first dotted part, "_given" stripped)
+PRIORITY = {
+    "try": 0, "penalty_try": 0,
+    "penalty": 1,
+    "scrum": 2,
+    "lineout": 3,
+}
+DEFAULT_PRIORITY = 4
 
 
-def set_event(event_type: str,
-              location: tuple[float, float],
-              team: Any) -> None:
-    """
-    Create/overwrite the global new_event tuple.
+class Event(NamedTuple):
+    type: str                    # e.g. "penalty.offside", "restart.goal_line_drop", "scrum.out"
+    location: Any                # (x, y) or (x, y, z) on pitch
+    team: Any                    # team object or code receiving the restart
+    priority: int = DEFAULT_PRIORITY
+    seq: int = 0                 # push order, tie-break within a priority
 
-    Args:
-        event_type: str, e.g. "penalty_given", "scrum_given",
-                    "lineout_given", "ball_dead", "try_given"
-        location: (x, y) tuple on pitch
-        team: team object or team code receiving the restart
-    """
-    global new_event
-    new_event = (event_type, location, team)
+    @property
+    def status(self) -> tuple:
+        """The (tag, location, ctx) tuple StateController.status expects."""
+        return (self.type, self.location, self.team)
 
 
-def get_event() -> Optional[Tuple[str, tuple[float, float], Any]]:
-    """Return the current new_event (None if none set)."""
-    return new_event
+def priority_of(event_type: str) -> int:
+    family = str(event_type).split(".", 1)[0]
+    if family.endswith("_given"):
+        family = family[: -len("_given")]
+    return PRIORITY.get(family, DEFAULT_PRIORITY)
 
 
-def clear_event() -> None:
-    """Reset event to None (after controller has handled it)."""
-    global new_event
-    new_event = None
+class EventBus:
+    def __init__(self):
+        self.pending: List[Event] = []
+        self.last_drained: List[Event] = []
+        self._seq = 0
 
+    def push(self, event_type: str, location, team, priority: Optional[int] = None) -> Event:
+        evt = Event(event_type, location, team,
+                    priority_of(event_type) if priority is None else int(priority), self._seq)
+        self._seq += 1
+        self.pending.append(evt)
+        return evt
 
+    def peek(self) -> Optional[Event]:
+        """Highest-priority pending event (not removed)."""
+        return min(self.pending, key=_order) if self.pending else None
 
+    def drain(self) -> List[Event]:
+        """All pending events, highest priority first; the bus is left empty."""
+        out = sorted(self.pending, key=_order)
+        self.pending = []
+        self.last_drained = out
+        return out
 
+    def clear(self) -> None:
+        self.pending = []
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def __iter__(self):
+        return iter(sorted(self.pending, key=_order))
+
+
+def _order(evt: Event):
+    return (evt.priority, evt.seq)
+
+
+def bus_of(match) -> EventBus:
+    """The match's bus (attached on first use for test doubles)."""
+    bus = getattr(match, "events", None)
+    if bus is None:
+        bus = match.events = EventBus()
+    return bus
+
+
+def push(match, event_type: str, location, team, priority: Optional[int] = None) -> Event:
+    """Queue a whistle event on `match`'s bus."""
+    return bus_of(match).push(event_type, location, team, priority)
+
+
+def peek(match) -> Optional[Event]:
+    return bus_of(match).peek()
+
+
+def drain(match) -> List[Event]:
+    return bus_of(match).drain()
+
+
+def clear(match) -> None:
+    bus_of(match).clear()
 
 
 """"""
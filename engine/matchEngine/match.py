@@ -1,11 +1,27 @@
 import json
+import os
+import sys
 import time
+import contextlib
 from utils.core.logger import dump_tick_json
-from setup import setup_match
+from setup import setup_match, build_player
 from states.base_state import BaseState
 
 # utils (per your tree)
-from utils.core.logger import log_tick , dump_tick_json
+from utils.core.logger import log_tick , dump_tick_json, dump_frame_json
+from utils.core.summary import MatchSummary
+from utils.core.tick_stream import BinaryTickWriter, DEFAULT_KEYFRAME_EVERY
+from utils.core.replay import ReplayWriter
+from utils.core.profiler import TickProfiler, profiler_from_env
+from utils.core.rng import DeterministicRNG
+from utils.core import snapshot as snapshots
+from utils.core.fastforward import FastForward
+from utils.core.frames import FrameClock
+from utils.player.state_arrays import PlayerStateArrays
+from utils.positioning.spatial_index import SpatialIndex
+from choice.think import ThinkScheduler
+from event import EventBus
+from constants import HALF_LENGTH_S, THINK_EVERY_TICKS
 
 
       # detect_* live here
@@ -20,15 +36,27 @@ class Match:
     Ultra-thin orchestrator:
       - Delegates per-tick decisions & ball physics to BaseState.tick()
       - Keeps clocks, advantage, scoring, and serialisation
-      - Converts law outcomes into a single whistle event via event.set_event(...)
+      - Converts law outcomes into whistle events on its own bus via event.push(match, ...)
     """
 
-    def __init__(self, db_path, team_a_id, team_b_id, seed: int | None = None, debug: dict | None = None):
+    def __init__(self, db_path, team_a_id, team_b_id, seed: int | None = None, debug: dict | None = None,
+                 squads: dict | None = None, profile: bool = False, think_every: int = THINK_EVERY_TICKS):
         # tick / time
         self.tick_count = 0
         self.match_time = 0.0
         self.tick_rate  = 0.05
+        self.ticks_skipped = 0         # idle ticks jumped by utils/core/fastforward
+        self.wake = None               # (at, until) idle wait a handler declared this tick (fastforward.idle_until)
 
+        # every stochastic draw goes through self.rng → a seed reproduces the match
+        self.seed = int(seed) if seed is not None else int.from_bytes(os.urandom(6), "little")
+        self.rng = DeterministicRNG(self.seed)
+        self.team_ids = (team_a_id, team_b_id)
+
+        # opt-in per-stage tick profiler (None = off; BaseState.tick branches on it once)
+        self.profiler = TickProfiler() if profile else profiler_from_env()
+        if self.profiler is not None:
+            self.profiler.install_signal()
         
         # debug toggles (only used inside logger helpers)
         self.debug = {"decisions": True, "routing": True, "laws": True}
@@ -38,21 +66,30 @@ class Match:
         # period/clock
         self.period = {"half": 1, "time": 0.0, "added_time": 0.0, "stoppage_accum": 0.0, "status": "live"}
 
-        # context flags kept for laws/advantage; routing is via events.set_event ##will proabbly be dropped 
+        # context flags kept for laws/advantage; routing is via event.push ##will proabbly be dropped 
         self.advantage = None
         self.last_touch_team = None
         self.last_restart_to = None
+        self.first_kickoff_to = None   # receiver of the opening kick-off (set by states/restart)
         self.last_kick = None
         self.conversion_ctx = None
         self.scoreboard = {"a": 0, "b": 0}
         self.offside = 0 #x point in whhcih the offside line is set 
+        self.offside_lines = None      # per-side offside lines of the last update (states/offside.py)
+        self.replay = None             # ReplayWriter while run() records one
         self.lineout_roles: tuple[str, str, str] | None = None
         # optional ruck meta placeholder
         
 
         # build world
         self.team_a, self.team_b, self.players, self.ball, self.pitch = setup_match(
-            db_path, team_a_id, team_b_id)
+            db_path, team_a_id, team_b_id, squads=squads)
+        self.registry = self.team_a.registry
+        self.player_arrays = PlayerStateArrays(self.players)
+        self.spatial_index = SpatialIndex(self.player_arrays)
+        self.events = EventBus()                 # whistle events for this match (event.py)
+        self.think = ThinkScheduler(think_every) # support-player re-plan rate (choice/think.py)
+        self.tick_ctx = None                     # memoized TickContext (utils/core/context.py)
         self.state = BaseState(self)
         # single state engine (handles decisions, action dispatch, and ball.update())
        
@@ -62,51 +99,216 @@ class Match:
     # ----------------------------
     #TODO move this to anywhere but match
     def get_player_by_code(self, code: str):
-        """e.g. '10a' -> Player or None"""
+        """e.g. '10a' -> Player or None (O(1) via the PlayerRegistry)"""
         if not code:
             return None
-        rn = int(code[:-1])
-        team_code = code[-1]
-        team = self.team_a if team_code == 'a' else self.team_b
-        return team.get_player_by_rn(rn)
-    
+        return self.registry.code(code)
+
+    def substitute(self, off_code: str, raw: dict):
+        """
+        Replace player `off_code` (e.g. "10a") with a new Player built from `raw`
+        (a db_loader player dict). The replacement takes over the squad and role
+        numbers (player codes are built from either across the engine), the
+        position, facing and flags. Returns the new Player.
+        """
+        off = self.get_player_by_code(off_code)
+        if off is None:
+            raise ValueError(f"no player {off_code!r} on the pitch")
+        raw = dict(raw, rn=off.rn, sn=off.sn)
+        on = build_player(raw, off.team_code, off.location)
+        on.target, on.action = off.target, off.action
+        on.orientation_deg = off.orientation_deg
+        on.current_speed = getattr(off, "current_speed", 0.0)
+        on.current_action = getattr(off, "current_action", None)
+        on.state_flags.update(off.state_flags)
+
+        team = self.team_a if off.team_code == "a" else self.team_b
+        team.squad[team.squad.index(off)] = on
+        self.players[self.players.index(off)] = on
+        self.registry.substitute(off, on)
+        if self.replay is not None:
+            self.replay.roster_changed()
+
+        # the replacement reuses the leaving player's row of the state arrays
+        store, row = self.player_arrays, off._row
+        store.players[row] = on
+        on._bind(store, row)
+        off._store, off._row = None, -1
+        store._move_params = None
+        store._dirty_pos.add(row)
+        store._dirty_flags.add(row)
+        store.refresh()
+
+        self.think._plans.clear()      # cached plans hold the old Player
+        self.tick_ctx = None
+        return on
+
      # 
    
     # matchEngine/match.py
-    def run(self, ticks=1000, realtime=True, speed=1.0):
-         
+    def run(self, ticks=1000, realtime=True, speed=1.0, headless=False,
+            stream="json", keyframe_every=DEFAULT_KEYFRAME_EVERY, replay_path=None,
+            fast_forward=None, fps=None, interpolate=False):
+        """
+        Stream mode (default): simulate `ticks` ticks and put frames on stdout,
+        JSON blobs, or with stream="binary" the utils/core/tick_stream protocol
+        (roster header, keyframes every `keyframe_every` frames, deltas in between).
+        fps: output frames per match second, independent of the fixed simulation
+        step (default one per tick); interpolate=True blends in-between frames.
+        JSON frames then carry velocity / target hints (utils/core/frames). The
+        binary stream carries no hints, so its fps is capped at the tick rate.
+        speed scales wall-clock pacing only (realtime=True); physics never changes.
+        Headless: play the full match (both halves, driven by self.period),
+        no frames, no pacing; returns the compact MatchSummary result dict.
+        replay_path: also record a seekable replay file (utils/core/replay).
+        fast_forward: jump over idle set-piece waits (utils/core/fastforward);
+        default on headless, off when streaming, always off while recording a
+        replay (its chunks need every tick).
+        """
+        replay = self.replay = ReplayWriter(self, replay_path) if replay_path else None
+        try:
+            if headless:
+                return self.run_headless(replay=replay, fast_forward=fast_forward is not False)
+            clock = FrameClock(self, fps=fps, interpolate=interpolate, upsample=stream != "binary")
+            if stream == "binary":
+                # frames own the real stdout; stray debug prints go to stderr
+                writer = BinaryTickWriter(self, sys.stdout.buffer, keyframe_every=keyframe_every)
+                with contextlib.redirect_stdout(sys.stderr):
+                    self._run_stream(ticks, realtime, speed, lambda alpha: writer.write_tick(),
+                                     replay, bool(fast_forward), clock)
+                return None
+            if clock.hints:
+                emit = lambda alpha: dump_frame_json(clock.frame_json(alpha))
+            else:
+                emit = lambda alpha: dump_tick_json(self)
+            self._run_stream(ticks, realtime, speed, emit, replay, bool(fast_forward), clock)
+        finally:
+            if replay is not None:
+                replay.close()
+                self.replay = None
+            if self.profiler is not None:
+                self.profiler.dump()
+
+    def _run_stream(self, ticks, realtime, speed, emit, replay=None, fast_forward=False, clock=None):
+        """`ticks` fixed simulation steps; emit(alpha) for each output frame the clock has due."""
+        ff = FastForward() if fast_forward and replay is None else None
+        clock = clock or FrameClock(self)
+        budget = self.tick_rate / max(speed, 1e-6)       # wall-clock seconds per tick
         for _ in range(ticks):
             t0 = time.time()
-            if self.tick_count >= 1000: break
+            if self.period["status"] == "full_time": break
 
+            clock.before_tick()
             # advance clocks here (don’t rely on BaseState to do it)
-            self.tick_count += 1
-            self.match_time += self.tick_rate
-            self.period["time"] += self.tick_rate
+            self._advance_clock()
 
             self.state.tick()
-           
-            # emit JSON to STDOUT — no bare except swallowing errors
-         
-                
-                
 
-            dump_tick_json(self)
+            for alpha in clock.due():
+                if realtime:
+                    # in-between frames are spread over the tick's wall-clock slot
+                    delay = budget * alpha - (time.time() - t0)
+                    if delay > 0:
+                        time.sleep(delay)
+                emit(alpha)
+            if replay is not None:
+                replay.write_tick()
+            wake = ff.after_tick(self) if ff is not None else None
+            if wake is not None:
+                ff.jump(self, wake)
+                clock.skip()
+                emit(1.0)      # one frame stands for the whole idle stretch
             #import sys, math; tr=self.ball.transit or {}; pace=(tr.get("speed") if tr.get("type")=="linear" else ((math.hypot(tr["target"][0]-tr["start"][0], tr["target"][1]-tr["start"][1]) / tr["T"]) if tr.get("type")=="parabola" and tr.get("T") else None)); print(f"DBG target={self.ball.target} loc={self.ball.location} pace={pace}", file=sys.stderr, flush=True)
-            
+
             if realtime:
-                budget = self.tick_rate / max(speed, 1e-6)
                 delay = budget - (time.time() - t0)
                 if delay > 0:
                     time.sleep(delay)
 
+    def run_headless(self, replay=None, fast_forward=True) -> dict:
+        """
+        Simulate to full time with no serialisation (bar an optional ReplayWriter); stray debug prints go to devnull.
+        fast_forward: skip idle set-piece waits in one clock jump (not while recording a replay).
+        """
+        summary = MatchSummary(self)
+        ff = FastForward() if fast_forward and replay is None else None
+        with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+            while self.period["status"] != "full_time":
+                self._advance_clock(summary)
+                if self.period["status"] == "full_time":
+                    break
+                self.state.tick()
+                summary.observe(self)
+                if replay is not None:
+                    replay.write_tick()
+                wake = ff.after_tick(self) if ff is not None else None
+                if wake is not None:
+                    ff.jump(self, wake)
+        result = summary.result(self)
+        if self.profiler is not None:
+            result["profile"] = self.profiler.summary()
+        return result
+
+    # ----------------------------
+    # snapshots / what-if forks (utils/core/snapshot)
+    # ----------------------------
+    def snapshot(self):
+        """State image of this tick; restore() / fork() it as often as needed."""
+        return snapshots.take(self)
+
+    def restore(self, snap) -> None:
+        """Rewind this match to `snap`."""
+        snapshots.restore(self, snap)
 
+    def fork(self, snap=None) -> "Match":
+        """Independent copy continuing from `snap` (default: now), e.g. to try another tactic."""
+        return snapshots.fork(self, snap)
+
+    # ----------------------------
+    # clock / periods
+    # ----------------------------
+    def _advance_clock(self, summary=None):
+        self.tick_count += 1
+        self.match_time += self.tick_rate
+        self.period["time"] += self.tick_rate
+        if self.period["time"] >= self.half_limit():
+            self._end_half(summary)
+
+    def half_limit(self) -> float:
+        """Period time at which the current half ends."""
+        return HALF_LENGTH_S + self.period["added_time"]
+
+    def _end_half(self, summary=None):
+        """Half time: swap ends and restart with a kick-off; second half → full time."""
+        if self.period["half"] >= 2:
+            self.period["status"] = "full_time"
+            if summary is not None:
+                summary.note(self, "full_time", dict(self.scoreboard))
+            return
+
+        if summary is not None:
+            summary.note(self, "half_time", dict(self.scoreboard))
+        self.period.update(half=2, time=0.0, added_time=0.0, stoppage_accum=0.0, status="live")
+        for team in (self.team_a, self.team_b):
+            team.tactics["attack_dir"] = -float(team.tactics.get("attack_dir", 1.0))
+
+        # the side that received the first-half kick-off kicks off the second
+        first_to = self.first_kickoff_to or "a"
+        to = "b" if first_to == "a" else "a"
+        self.advantage = None
+        # a fresh ball: if the first half ended on a kick-off, the second one would
+        # otherwise repeat the same ball status and the controller would never move on
+        self.ball.reset((50.0, 35.0, 0.0))
+        self.state.controller.status = ("restart.kick_off", (50.0, 35.0, 0.0), to)
 
 
 if __name__ == "__main__":
     match = Match("tmp/temp.db", team_a_id=2, team_b_id=1, seed=42,
                   debug={"decisions": True, "routing": True, "laws": True})
-    match.run(ticks=1000)
+    replay_path = sys.argv[sys.argv.index("--replay") + 1] if "--replay" in sys.argv else None
+    fps = float(sys.argv[sys.argv.index("--fps") + 1]) if "--fps" in sys.argv else None
+    match.run(ticks=1000, stream="binary" if "--binary" in sys.argv else "json", replay_path=replay_path,
+              fps=fps, interpolate="--interpolate" in sys.argv)
 
 
     """"whole point of match.py be as small as possible - do nothing
@@ -1,11 +1,17 @@
 # matchEngine/pitch.py
 
+import numpy as np
+
 from constants import (
     PITCH_LENGTH, PITCH_WIDTH,
     DEADBALL_LINE_A_X, DEADBALL_LINE_B_X,
     TOUCHLINE_TOP_Y, TOUCHLINE_BOTTOM_Y
 )
 
+_CLAMP_LO = np.array([DEADBALL_LINE_A_X, TOUCHLINE_BOTTOM_Y, -np.inf])
+_CLAMP_HI = np.array([DEADBALL_LINE_B_X, TOUCHLINE_TOP_Y, np.inf])
+
+
 class Pitch:
     def __init__(self, length=PITCH_LENGTH, width=PITCH_WIDTH):
         self.length = length
@@ -41,5 +47,10 @@ class Pitch:
         y = min(max(y, TOUCHLINE_BOTTOM_Y), TOUCHLINE_TOP_Y)
         return (x, y, z)
 
+    def clamp_positions(self, xyz):
+        """clamp_position for an (n, 3) NumPy array, in place; returns it."""
+        np.maximum(xyz, _CLAMP_LO, out=xyz)
+        return np.minimum(xyz, _CLAMP_HI, out=xyz)
+
     def __repr__(self):
         return f"<Pitch {self.length}m x {self.width}m>"
@@ -1,6 +1,17 @@
 # matchEngine/player.py
+from utils.player.state_arrays import PlayerFlags
+
 
 class Player:
+    # fixed attribute set: 30 of these live for a whole match and are read every tick
+    __slots__ = (
+        "name", "_sn", "_rn", "team_code", "height", "weight",
+        "location", "target", "arrive_radius",
+        "attributes", "norm_attributes", "max_speed_mps", "accel_mps2",
+        "current_speed", "speed_mps", "action", "current_action",
+        "state_flags", "orientation_deg", "_store", "_row", "_registry",
+    )
+
     def __init__(self, name, sn, rn, team_code, location=(0.0, 0.0, 0.0),
                  attributes=None, norm_attributes=None, height=None, weight=None):
         self.name = name
@@ -40,8 +51,9 @@ class Player:
         self.speed_mps = self.max_speed_mps
 
         self.action = None  # e.g., 'run', 'pass', etc.
+        self.current_action = None        # "run" / "idle", set by movement
         # Phase 3: transient flags (reset each tick)
-        self.state_flags = {
+        self.state_flags = PlayerFlags({
     "being_tackled": False,
     "tackling": False,
     "off_feet": False,
@@ -57,12 +69,63 @@ class Player:
     "jackal_success":0.0,
     "counter_cooldown":0,
     "in_lineout": False,
-}
-        self.flags = self.state_flags          # ← alias so p.flags[...] works
-        self.code  = f"{self.rn}{self.team_code}"
-
+})
 
         self.orientation_deg = None
+
+        # row in match.player_arrays (PlayerStateArrays) once bound
+        self._store = None
+        self._row = -1
+        self._registry = None     # PlayerRegistry once registered
+
+    # alias so p.flags[...] works
+    @property
+    def flags(self):
+        return self.state_flags
+
+    @flags.setter
+    def flags(self, value):
+        self.state_flags = value
+
+    # rn / sn re-index the match's PlayerRegistry (and the arrays' rn column)
+    # when reassigned, e.g. on a role swap
+    @property
+    def rn(self):
+        return self._rn
+
+    @rn.setter
+    def rn(self, value):
+        old = getattr(self, "_rn", None)
+        self._rn = value
+        reg = getattr(self, "_registry", None)
+        if reg is not None and old != value:
+            reg.reindex(self, "rn", old)
+        store = getattr(self, "_store", None)
+        if store is not None:
+            store.rn[self._row] = int(value or 0)
+
+    @property
+    def sn(self):
+        return self._sn
+
+    @sn.setter
+    def sn(self, value):
+        old = getattr(self, "_sn", None)
+        self._sn = value
+        reg = getattr(self, "_registry", None)
+        if reg is not None and old != value:
+            reg.reindex(self, "sn", old)
+
+    @property
+    def code(self) -> str:
+        return f"{self._rn}{self.team_code}"
+
+    def _bind(self, store, row: int) -> None:
+        self._store = store
+        self._row = row
+        self.state_flags._store = store
+        self.state_flags._row = row
+
     def set_target(self, xyz): self.target = tuple(xyz) if xyz else None
     def clear_target(self):     self.target = None
     def has_arrived(self):
@@ -72,7 +135,10 @@ class Player:
         return (dx*dx + dy*dy) ** 0.5 <= self.arrive_radius
 
     def update_location(self, new_location):
+        """Single write path for location (keeps the state arrays row in sync)."""
         self.location = tuple(new_location)
+        if self._store is not None:
+            self._store._dirty_pos.add(self._row)
     
     def __repr__(self):
         return f"<Player {self.sn}{self.team_code} ({self.name}) at {self.location}>"
@@ -4,8 +4,7 @@ from actions.action_controller import do_action
 
 from team.team_controller import set_possession
 
-from shapes.lineout.five_man import generate_five_man_lineout_shape
-from shapes.lineout.five_man_backline import generate_phase_play_shape
+from shapes.library import formation, place
 from utils.actions.catch_windows import can_catch
 from constants import TOUCHLINE_BOTTOM_Y, TOUCHLINE_TOP_Y
 DoCall = Tuple[str, Tuple[str, Optional[str]], Tuple[float, float, float], Tuple[float, float, float]]
@@ -49,39 +48,10 @@ def handle_start(match, state_tuple) -> None:
     else: 
         touch_is_bottom = False
 
-    phase_shape = generate_phase_play_shape("default", attack_dir)
-    layout = generate_five_man_lineout_shape(
-         # or compute from pitch constants
-        touch_is_bottom=touch_is_bottom,
-        attack_dir=attack_dir, backline_positions= phase_shape
-       )
-  
-   
-    atk_layout = layout["team_a"]
-    def_layout = layout["team_b"]
-  
-
-    def _apply(team, sub_layout):
-        for rn, (lx, ly) in sub_layout.items():
-            try:
-                jersey = int(rn)
-            except (TypeError, ValueError):
-                continue
-            p = team.get_player_by_rn(jersey)
-            if not p:
-                continue
-            wx = bx + lx
-            wy = by + ly if touch_is_bottom else by - ly
-            
-            p.update_location(match.pitch.clamp_position((wx, wy, 0.0)))
-
-    
-    
-        
-     
-   
-    _apply(throwing_team, atk_layout)
-    _apply(defending_team, def_layout)
+    # template offsets are built once per (shape, attack_dir) in shapes/library;
+    # a top-touch lineout is the same shape mirrored in y
+    shape = formation(throwing_team.tactics.get("lineout_shape", "lineout.five_man"), attack_dir)
+    place(match, shape, (bx, by), (throwing_team, defending_team), mirror_y=not touch_is_bottom)
 
     hooker_code = f"2{throw}"
     jumper_code = f"4{throw}"
@@ -155,7 +125,7 @@ def handle_over(match, codes, state_tuple) -> None:
     
         do_action(match, sh_code, ("catch", None), ball.location, sh.location)
 
-    elif bz == 0 and ball.holder == None:
+    elif ball.location[2] == 0 and ball.holder == None:
         ball.set_action("lineout_exit")
 
 
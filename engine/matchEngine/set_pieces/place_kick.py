@@ -1,8 +1,9 @@
 # matchEngine/set_pieces/place_kick.py
 from typing import Optional, Tuple
-from constants import PITCH_WIDTH, PITCH_LENGTH, TRYLINE_A_X, TRYLINE_B_X 
+from constants import PITCH_WIDTH, PITCH_LENGTH, TRYLINE_A_X, TRYLINE_B_X, CONVERSION_WINDOW_S
 from actions import kick
 from set_pieces.restart import _spread_y, _rng  # reuse helpers
+from utils.core.fastforward import idle_until
 import event
 
 
@@ -63,6 +64,23 @@ def _stage_next_restart(match, receiving_code: str, exclude_ids: set[str] | None
         jitter_y = r.uniform(-2.0, 2.0)
         p.update_location(match.pitch.clamp_position((line_x, ys_k[i] + jitter_y, 0.0)))
 
+def lining_up(match) -> bool:
+    """
+    The kicker takes the conversion window (CONVERSION_WINDOW_S) before kicking.
+    True while it runs; nothing moves meanwhile, so the wait is declared to
+    utils/core/fastforward. A try too late in the half is converted at once.
+    """
+    ctx = match.conversion_ctx
+    if ctx is None:
+        if match.period["time"] + CONVERSION_WINDOW_S >= match.half_limit():
+            return False
+        ctx = match.conversion_ctx = {"due": match.match_time + CONVERSION_WINDOW_S}
+    if match.match_time < ctx["due"]:
+        idle_until(match, at=ctx["due"])
+        return True
+    match.conversion_ctx = None
+    return False
+
 def conversion(
     match,
     team_code: Optional[str] = None,
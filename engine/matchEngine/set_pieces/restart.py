@@ -14,6 +14,7 @@ from constants import (
     DROP_OUT_MAX,
 )
 from actions import kick
+from utils.core.rng import stream
 XYZ = Tuple[float, float, float]
 __all__ = ["kickoff"]
 
@@ -26,12 +27,8 @@ def _spread_y(n: int, margin: float = 5.0) -> List[float]:
     return [margin + i * step for i in range(n)]
 
 def _rng(match):
-    """Prefer the match's deterministic RNG; fallback to Python random."""
-    r = getattr(match, "rng", None)
-    if r and all(hasattr(r, m) for m in ("uniform", "random")):
-        return r
-    import random
-    return random
+    """Match's deterministic RNG stream (falls back to Python random without one)."""
+    return stream(match, "restart")
 
 def _player_code(sn: int, team_code: str) -> str:
     return f"{int(sn)}{team_code}"
@@ -11,10 +11,8 @@ from choice.scrum.drive import plan as drive_plan
 from choice.scrum.stable import plan as stable_plan
 from choice.scrum.out import plan as out_plan
 from choice.scrum.start import plan as start_plan
-from shapes.scrum.scrum import generate_scrum_shape
-from shapes.scrum.default import generate_phase_play_shape
+from shapes.library import formation, place
 from choice.scrum.common import ScrumScore, counter_shove_check, outcome_from_score
-import random
 # (Optional) if you want a "start" entry even though states maps START->crouch
 # from choice.scrum.start import plan as start_plan
 
@@ -84,26 +82,9 @@ def handle_start(match, state_tuple) -> None:
     defend_team = match.team_b if atk == "a" else match.team_a
     attack_dir = float(attack_team.tactics.get("attack_dir", 1.0))
 
-   # backline_style = match.tactics.get("backline_style", "default")
-    phase_shape = generate_phase_play_shape("default", attack_dir)
-    layout = generate_scrum_shape(attack_dir=attack_dir, backline_positions=phase_shape)
-
-    def _apply(team, sub_layout):
-        for rn, (lx, ly) in sub_layout.items():
-            try:
-                jersey = int(rn)
-            except (TypeError, ValueError):
-                continue
-            p = team.get_player_by_rn(jersey)
-            if not p:
-                continue
-            wx = bx + lx
-            wy = by + ly
-            p.update_location(match.pitch.clamp_position((wx, wy, 0.0)))
-
-    
-    _apply(attack_team, layout['team_a'])
-    _apply(defend_team, layout['team_b'])
+    # template offsets are built once per (shape, attack_dir) in shapes/library
+    shape = formation(attack_team.tactics.get("scrum_shape", "scrum.default"), attack_dir)
+    place(match, shape, (bx, by), (attack_team, defend_team))
     for rn in range(1, 9):
         atk_p = attack_team.get_player_by_rn(rn)
         if atk_p:
@@ -367,7 +348,11 @@ def handle_out(match, state_tuple) -> None:
     dh_id = f"9{atk}"
     dh = match.get_player_by_code(dh_id)
     if dh:
-        # Mark the active dummy-half for the plan's _current_dh_id()
+        # Mark the active dummy-half for the plan's _current_dh_id(); a flag left
+        # over from an earlier ruck would win that lookup and the pass never goes
+        for p in match.players:
+            if p is not dh and p.state_flags.get("dummy_half", False):
+                p.state_flags["dummy_half"] = False
         dh.state_flags["dummy_half"] = True
         # Ensure holder defaults to 9 while we're in the protected state
         if getattr(match.ball, "holder", None) != dh_id:
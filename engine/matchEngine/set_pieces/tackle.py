@@ -1,6 +1,7 @@
 """Resolve tackle outcomes based on player attributes."""
 
 from utils.probs.scale import balanced_score
+from utils.core.rng import stream
 
 
 def resolve_tackle(match, tackler, carrier):
@@ -26,7 +27,7 @@ def resolve_tackle(match, tackler, carrier):
     att = (footwork * strength * balance) 
     def_ = (tackling * bravery * determination) 
 
-    score = balanced_score(att, def_, 3)
+    score = balanced_score(att, def_, 3, rng=stream(match, "tackle", getattr(carrier, "code", 0)))
 
     if score > 0.5:
         outcome = "tackle_broken"
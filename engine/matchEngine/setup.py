@@ -9,48 +9,53 @@ from pitch import Pitch
 
 # utils is the sibling package: matchEngine/utils/...
 from utils.db.db_loader import load_team_from_db
-
-def setup_match(db_path, team_a_id, team_b_id):
-    team_a_name, raw_a_players = load_team_from_db(db_path, team_a_id)
-    team_b_name, raw_b_players = load_team_from_db(db_path, team_b_id)
+from utils.player.registry import PlayerRegistry
+
+def build_player(raw, team_code, location):
+    """Player from a db_loader dict (attributes are copied: the loader's are shared read-only)."""
+    return Player(
+        name=raw["name"],
+        sn=raw["sn"],
+        rn=raw["rn"],
+        team_code=team_code,
+        location=tuple(location),
+        attributes=dict(raw["attributes"]),
+        norm_attributes=dict(raw["norm_attributes"]),
+        height=raw["height"],
+        weight=raw["weight"],
+    )
+
+
+def setup_match(db_path, team_a_id, team_b_id, squads=None):
+    """`squads` (optional): {team_id: (team_name, raw_players)} preloaded by the
+    caller (e.g. batch workers) so the DB is only read when a team is missing."""
+    squads = squads or {}
+    team_a_name, raw_a_players = squads.get(team_a_id) or load_team_from_db(db_path, team_a_id)
+    team_b_name, raw_b_players = squads.get(team_b_id) or load_team_from_db(db_path, team_b_id)
 
     players = []
     team_a_players = []
     team_b_players = []
 
     for p in raw_a_players:
-        player = Player(
-            name=p["name"],
-            sn=p["sn"],
-            rn=p["rn"],
-            team_code="a",
-            location=(50.0, 35.0, 0.0),      # ← tuple
-            attributes=p["attributes"], 
-            norm_attributes=p["norm_attributes"],
-            height=p["height"],
-            weight=p["weight"],
-        )
+        player = build_player(p, "a", (50.0, 35.0, 0.0))
         players.append(player)
         team_a_players.append(player)
 
     for p in raw_b_players:
-        player = Player(
-            name=p["name"],
-            sn=p["sn"],
-            rn=p["rn"],
-            team_code="b",
-            location=(100.0, 35.0, 0.0),     # ← tuple
-            attributes=p["attributes"],
-            norm_attributes=p["norm_attributes"],
-            height=p["height"],
-            weight=p["weight"],
-        )
+        player = build_player(p, "b", (100.0, 35.0, 0.0))
         players.append(player)
         team_b_players.append(player)
 
     team_a = Team(name=team_a_name, squad=team_a_players, tactics={"attack_dir": +1.0})
     team_b = Team(name=team_b_name, squad=team_b_players, tactics={"attack_dir": -1.0})
 
+    # O(1) code / (team, rn) / (team, sn) lookups for everything downstream
+    registry = PlayerRegistry(players)
+    for code, team in (("a", team_a), ("b", team_b)):
+        team.code = code
+        team.registry = registry
+
     ball = Ball(location=(50.0, 35.0, 0.0), holder=None)
     pitch = Pitch()
 
@@ -0,0 +1,184 @@
+# shapes/library.py
+"""
+Memoized formation templates for set pieces and phase shapes.
+
+formation(name, attack_dir, **params) builds a shape once per
+(name, attack_dir, params) and keeps it as local-frame offset arrays per side
+("team_a" = attacking / throwing side, "team_b" = the other). place() then
+moves both sides to a mark in one translate-and-clamp step, so setting up a
+scrum or lineout costs the same however often it happens.
+
+Built-in shapes wrap the generators in shapes/scrum and shapes/lineout:
+
+    scrum.default       generate_scrum_shape + scrum backline  (params: backline, scrum kwargs)
+    lineout.five_man    generate_five_man_lineout_shape + lineout backline  (params: backline)
+    scrum_backline      scrum backline only  (params: option)
+    lineout_backline    lineout backline only  (params: option)
+
+Custom shapes need no code: drop a JSON file in shapes/custom/ and select it
+by name (e.g. team tactics "scrum_shape" / "lineout_shape"):
+
+    {"name": "scrum.wide",
+     "team_a": {"1": [-1.15, 2.2], "2": [-1.15, 0.0], ...},
+     "team_b": {"1": [1.15, -2.2], ...},
+     "backline": "scrum_backline"}
+
+Offsets are jersey number -> (x, y) metres from the mark for attack_dir +1;
+x is scaled by attack_dir like the built-in generators. "backline" (optional)
+names another shape whose positions are merged over these. register() adds a
+builder from code.
+"""
+
+import json
+import os
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from shapes.scrum.scrum import generate_scrum_shape
+from shapes.scrum.default import generate_phase_play_shape as scrum_backline
+from shapes.lineout.five_man import generate_five_man_lineout_shape
+from shapes.lineout.five_man_backline import generate_phase_play_shape as lineout_backline
+from utils.player.state_arrays import arrays_of
+
+CUSTOM_SHAPES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "custom")
+SIDES = ("team_a", "team_b")
+
+Layout = Dict[str, Dict[int, Tuple[float, float]]]
+
+
+class Formation:
+    """One shape for one attack_dir: jersey numbers and (n, 2) local offsets per side (read-only)."""
+
+    __slots__ = ("name", "rns", "local")
+
+    def __init__(self, name: str, layout: Layout):
+        self.name = name
+        self.rns: Dict[str, Tuple[int, ...]] = {}
+        self.local: Dict[str, np.ndarray] = {}
+        for side in SIDES:
+            rns, xy = [], []
+            for rn, (lx, ly) in (layout.get(side) or {}).items():
+                try:
+                    jersey = int(rn)
+                except (TypeError, ValueError):
+                    continue
+                rns.append(jersey)
+                xy.append((lx, ly))
+            arr = np.array(xy, dtype=np.float64).reshape(-1, 2)
+            arr.flags.writeable = False
+            self.rns[side] = tuple(rns)
+            self.local[side] = arr
+
+
+# -----------------------
+# registry
+# -----------------------
+def _scrum(attack_dir, backline="default", **shape):
+    return generate_scrum_shape(attack_dir=attack_dir,
+                                backline_positions=scrum_backline(backline, attack_dir), **shape)
+
+
+def _lineout(attack_dir, backline="default"):
+    # the top-touchline mirror is applied at placement (place(..., mirror_y=True))
+    return generate_five_man_lineout_shape(touch_is_bottom=True, attack_dir=attack_dir,
+                                           backline_positions=lineout_backline(backline, attack_dir))
+
+
+BUILDERS: Dict[str, Callable[..., Layout]] = {
+    "scrum.default": _scrum,
+    "lineout.five_man": _lineout,
+    "scrum_backline": lambda attack_dir, option="default": scrum_backline(option, attack_dir),
+    "lineout_backline": lambda attack_dir, option="default": lineout_backline(option, attack_dir),
+}
+
+_cache: Dict[tuple, Formation] = {}
+_custom_loaded = False
+
+
+def register(name: str, builder: Callable[..., Layout]) -> None:
+    """Add or replace a shape; builder(attack_dir, **params) -> {"team_a": {rn: (x, y)}, "team_b": {...}}."""
+    BUILDERS[name] = builder
+    for key in [k for k in _cache if k[0] == name]:
+        del _cache[key]
+
+
+def _json_builder(spec: dict) -> Callable[..., Layout]:
+    base = {side: {int(rn): (float(x), float(y)) for rn, (x, y) in (spec.get(side) or {}).items()}
+            for side in SIDES}
+    backline = spec.get("backline")
+
+    def build(attack_dir, **params):
+        layout = {side: {rn: (x * attack_dir, y) for rn, (x, y) in pts.items()}
+                  for side, pts in base.items()}
+        if backline:
+            extra = BUILDERS[backline](attack_dir, **params)
+            for side in SIDES:
+                layout[side].update(extra.get(side) or {})
+        return layout
+    return build
+
+
+def load_custom(directory: str = CUSTOM_SHAPES_DIR) -> None:
+    """Register every *.json shape in `directory` (missing directory = nothing to load)."""
+    global _custom_loaded
+    _custom_loaded = True
+    if not os.path.isdir(directory):
+        return
+    for fname in sorted(os.listdir(directory)):
+        if not fname.endswith(".json"):
+            continue
+        with open(os.path.join(directory, fname), encoding="utf-8") as fh:
+            spec = json.load(fh)
+        register(spec.get("name") or fname[:-len(".json")], _json_builder(spec))
+
+
+def formation(name: str, attack_dir: float, **params) -> Formation:
+    """The memoized Formation for (name, attack_dir, params)."""
+    key = (name, float(attack_dir), tuple(sorted(params.items())))
+    f = _cache.get(key)
+    if f is None:
+        if name not in BUILDERS and not _custom_loaded:
+            load_custom()
+        if name not in BUILDERS:
+            raise KeyError(f"unknown formation {name!r}")
+        f = _cache[key] = Formation(name, BUILDERS[name](float(attack_dir), **params))
+    return f
+
+
+# -----------------------
+# placement
+# -----------------------
+def place(match, shape: Formation, mark_xy, teams, mirror_y: bool = False) -> None:
+    """
+    Move each side's players (teams = (team for "team_a", team for "team_b"))
+    to mark + local offset (y negated when mirror_y), clamped to the pitch.
+    """
+    bx, by = mark_xy[0], mark_xy[1]
+    store = arrays_of(match)
+    players, parts, bound = [], [], store is not None
+    for side, team in zip(SIDES, teams):
+        hit = []
+        for i, rn in enumerate(shape.rns[side]):
+            p = team.get_player_by_rn(rn)
+            if p:
+                players.append(p)
+                hit.append(i)
+                bound = bound and getattr(p, "_store", None) is store
+        parts.append(shape.local[side][hit])
+    if not players:
+        return
+
+    world = np.zeros((len(players), 3), dtype=np.float64)
+    world[:, :2] = np.concatenate(parts)
+    if mirror_y:
+        world[:, 1] = -world[:, 1]
+    world[:, 0] += bx
+    world[:, 1] += by
+    match.pitch.clamp_positions(world)
+
+    if bound:
+        store.push_positions([p._row for p in players], world)
+        return
+    for p, xyz in zip(players, world.tolist()):
+        p.update_location(tuple(xyz))
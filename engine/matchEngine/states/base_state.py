@@ -1,18 +1,26 @@
 # states/base_state.py
+from time import perf_counter_ns
 from typing import Tuple, Any
 from states.controller import StateController
 from choice.choice_controller import select as choose_select
-from actions.action_controller import do_action
+from actions.action_controller import do_actions
 from states import restart, scoring, nudge, ruck, open_play,  scrum, lineout
 from team.team_controller import sync_flags
 from utils.laws import advantage as adv_law
 import boundaries
 
+HARD_HANDLERS = (restart, scoring, nudge, ruck, scrum, lineout)
+HARD_STAGES = tuple(f"hard.{mod.__name__.rsplit('.', 1)[-1]}" for mod in HARD_HANDLERS)
+
 def _team_attack_dir(match, code: str | None) -> float:
     team = match.team_a if code == "a" else match.team_b
     return float((getattr(team, "tactics", {}) or {}).get("attack_dir", +1.0))
 
 
+def _is_open_play(tag) -> bool:
+    return isinstance(tag, str) and (tag == "open_play" or tag.startswith("open_play."))
+
+
 def _holder_team(ball) -> str | None:
     hid = getattr(ball, "holder", None)
     return hid[-1] if isinstance(hid, str) else None
@@ -23,18 +31,91 @@ class BaseState:
         self.controller = StateController(match)
         
     def tick(self) -> Tuple[str, Any, Any]:
-        # 1) drive controller once
-       
+        if self.match.profiler is not None:
+            return self._tick_profiled(self.match.profiler)
 
+        # 1) drive controller once
         self.controller.tick()
         tag, loc, ctx = self.controller.status
-      
-               
-            
+
         # keep flags sane before anyone looks at them
         sync_flags(self.match)
 
         # Update advantage overlay each frame
+        tag, loc, ctx = self._update_advantage(tag, loc, ctx)
+
+        # 2) HARD handlers: own actions + early return
+        for mod in HARD_HANDLERS:
+            handler = getattr(mod, "maybe_handle", None)
+            if handler and handler(self.match, tag, loc, ctx):
+                self.match.ball.update(self.match)
+                sync_flags(self.match)
+                return self.controller.status
+
+        # 3) SOFT glue (open_play): may change ball/tag, but NO actions
+        boundaries.check(self.match)
+        tag, loc, ctx = self._open_play(tag, loc, ctx)
+
+        # 4) Execute choices **only** for open_play.*
+        if _is_open_play(tag):
+            do_actions(self.match, self._choose(tag, loc, ctx))
+
+        # 5) single physics step + resync
+        self.match.ball.update(self.match)
+        sync_flags(self.match)
+        return self.controller.status
+
+    def _tick_profiled(self, profiler) -> Tuple[str, Any, Any]:
+        """tick() with perf_counter_ns laps per stage (see utils/core/profiler)."""
+        clock = perf_counter_ns
+        laps = [("controller", clock())]
+        self.controller.tick()
+        tag, loc, ctx = self.controller.status
+
+        laps.append(("sync_flags", clock()))
+        sync_flags(self.match)
+
+        laps.append(("advantage", clock()))
+        tag, loc, ctx = self._update_advantage(tag, loc, ctx)
+        prof_tag = tag
+
+        handled = False
+        for mod, stage in zip(HARD_HANDLERS, HARD_STAGES):
+            laps.append((stage, clock()))
+            handler = getattr(mod, "maybe_handle", None)
+            if handler and handler(self.match, tag, loc, ctx):
+                handled = True
+                break
+
+        if not handled:
+            laps.append(("boundaries", clock()))
+            boundaries.check(self.match)
+
+            laps.append(("open_play", clock()))
+            tag, loc, ctx = self._open_play(tag, loc, ctx)
+
+            if _is_open_play(tag):
+                laps.append(("choose_select", clock()))
+                calls = self._choose(tag, loc, ctx)
+                laps.append(("do_actions", clock()))
+                do_actions(self.match, calls)
+
+        laps.append(("ball.update", clock()))
+        self.match.ball.update(self.match)
+        laps.append(("sync_flags.post", clock()))
+        sync_flags(self.match)
+        profiler.laps(prof_tag, laps, clock())
+        return self.controller.status
+
+    def _open_play(self, tag, loc, ctx):
+        op_handler = getattr(open_play, "maybe_handle", None)
+        if op_handler and op_handler(self.match, tag, loc, ctx):
+            # tag might have changed (e.g., to open_play.scramble) → re-tick
+            self.controller.tick()
+            tag, loc, ctx = self.controller.status
+        return tag, loc, ctx
+
+    def _update_advantage(self, tag, loc, ctx):
         adv_dir = _team_attack_dir(self.match, (self.match.advantage or {}).get("to"))
         adv, flag, outcome = adv_law.tick(
             self.match.advantage,
@@ -55,34 +136,8 @@ class BaseState:
             # ensure state machine sees new ball action (e.g. scrum or penalty)
                 self.controller.tick()
                 tag, loc, ctx = self.controller.status
+        return tag, loc, ctx
 
-        # 2) HARD handlers: own actions + early return
-        for mod in (restart, scoring, nudge, ruck,  scrum, lineout):
-            handler = getattr(mod, "maybe_handle", None)
-            if handler and handler(self.match, tag, loc, ctx):
-                self.match.ball.update(self.match)
-                sync_flags(self.match)
-                return self.controller.status
-
-        # 3) SOFT glue (open_play): may change ball/tag, but NO actions
-        boundaries.check(self.match)
-        op_handler = getattr(open_play, "maybe_handle", None)
-
-        if op_handler and op_handler(self.match, tag, loc, ctx):
-          
-            # tag might have changed (e.g., to open_play.scramble) → re-tick
-            self.controller.tick()
-            tag, loc, ctx = self.controller.status
-
-        # 4) Execute choices **only** for open_play.*
-        if isinstance(tag, str) and (tag == "open_play" or tag.startswith("open_play.")):
-            calls = choose_select(self.match, (tag, loc, ctx)) or []
-            if isinstance(calls, tuple):
-                calls = [calls]
-            for pid, action, _ignored, target in calls:
-                loc_p = self.match.get_player_by_code(pid).location
-                do_action(self.match, pid, action, loc_p, target)
-        # 5) single physics step + resync
-        self.match.ball.update(self.match)
-        sync_flags(self.match)
-        return self.controller.status
+    def _choose(self, tag, loc, ctx) -> list:
+        calls = choose_select(self.match, (tag, loc, ctx)) or []
+        return [calls] if isinstance(calls, tuple) else calls
@@ -2,10 +2,7 @@
 from typing import Dict, Tuple, Optional
 import event 
 from states.ActionMatrix import ACTION_MATRIX ,SAME # keep your import as-is
-
-WILDCARD = "_"            # <- underscore means "any last_action"
-
-DEFAULT_FALLBACK = SAME  # your safe default
+from states.transitions import TABLE, TransitionTrace, WILDCARD, DEFAULT_FALLBACK
 
 class StateController:
     def __init__(self, match):
@@ -13,7 +10,7 @@ class StateController:
         self.status = ("restart.kick_off",
                        getattr(match.ball, "location", (50.0, 35.0, 0.0)),
                        getattr(match.ball, "holder", None))
-        
+        self.trace = TransitionTrace()     # recent tag resolutions, see states/transitions.py
 
     def tick(self) -> None:
         if self._event_check():
@@ -22,11 +19,11 @@ class StateController:
         
 
     def _event_check(self) -> bool:
-        evt = event.get_event()
-        if not evt:
+        evts = event.drain(self.match)
+        if not evts:
             return False
-        self.status = evt
-        event.clear_event()
+        # highest priority wins; the rest stay on match.events.last_drained
+        self.status = evts[0].status
         return True
 
     def _status_check(self) -> None:
@@ -47,6 +44,7 @@ class StateController:
         curr_action = curr.get("action")
 
         state_tag = _resolve_state_tag(last_action, curr_action)
+        self.trace.record(getattr(self.match, "tick_count", None), last_action, curr_action, state_tag)
         if state_tag == SAME:
             state_tag = self.status[0] if isinstance(self.status, tuple) else DEFAULT_FALLBACK
 
@@ -60,31 +58,14 @@ class StateController:
 
 
 def _resolve_state_tag(last_action: Optional[str], curr_action: Optional[str]) -> str:
-
-    
     """
-    Priority:
+    Priority (compiled once in states/transitions.py):
       1) exact   : (last, curr)
       2) wildcard: ("_", curr)
-      3) default : DEFAULT_FALLBACK
+      3) wildcard: (last, "_")
+      4) default : DEFAULT_FALLBACK
     """
-    # exact match first
-   # states/controller.py
-def _resolve_state_tag(last_action, curr_action) -> str:
-    tag = ACTION_MATRIX.get((last_action, curr_action))
-    if tag:
-        return tag
-    # check (last, "_") BEFORE ("_", curr)
-    tag = ACTION_MATRIX.get((WILDCARD, curr_action))
-    if tag:
-        return tag
-    tag = ACTION_MATRIX.get((last_action, WILDCARD))
-    if tag:
-        return tag
-    return DEFAULT_FALLBACK
-
-
- 
+    return TABLE.resolve(last_action, curr_action)
 
 
 def _same_snapshot(a: dict, b: dict) -> bool:
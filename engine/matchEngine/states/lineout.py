@@ -10,7 +10,9 @@ OUT     = "lineout.out"
 
 LINEOUT_TAGS = {START, FORMING, OVER, OUT}
 
-from set_pieces.lineout import handle_start, handle_forming, handle_over, handle_out
+from utils.core.lazy import lazy_module
+
+_impl = lazy_module("set_pieces.lineout")     # imported on the first lineout
 
 def maybe_handle(match, tag, loc, ctx) -> bool:
     if not isinstance(tag, str) or not (tag == START or tag.startswith("lineout.")):
@@ -19,18 +21,18 @@ def maybe_handle(match, tag, loc, ctx) -> bool:
     codes = match.lineout_roles 
     if tag == START:
         
-        match.lineout_roles = handle_start(match, (tag, loc, ctx))
+        match.lineout_roles = _impl.handle_start(match, (tag, loc, ctx))
         return True
     if tag == FORMING:
        
-        handle_forming(match, codes, (tag, loc, ctx))
+        _impl.handle_forming(match, codes, (tag, loc, ctx))
         
         
         return True
     if tag == OVER:
-        handle_over(match, codes, (tag, loc, ctx))
+        _impl.handle_over(match, codes, (tag, loc, ctx))
         return True
     if tag == OUT:
-        handle_out(match, (tag, loc, ctx))
+        _impl.handle_out(match, (tag, loc, ctx))
         return True
     return False
\ No newline at end of file
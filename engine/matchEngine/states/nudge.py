@@ -11,10 +11,12 @@ NUDGE_TAGS = { QUICK_TAP, SLOW_TAP, CONVERSION, PEN_PUNT, FREE_KICK, AFTER }
 
 from typing import Optional
 import event
-from set_pieces.place_kick import conversion as do_conversion, conversion_transit
+from utils.core.lazy import lazy_module
+
+_place_kick = lazy_module("set_pieces.place_kick")    # imported on the first conversion
 success= False
 def conversion_now(match, to: Optional[str] = None) -> None:
-    do_conversion(match, team_code=to)
+    _place_kick.conversion(match, team_code=to)
     x, y, _ = match.ball.location
    
 
@@ -23,12 +25,13 @@ def maybe_handle(match, tag, loc, ctx) -> bool:
     if tag == AFTER:
         
       
-        conversion_transit(match, to, success)
+        _place_kick.conversion_transit(match, to, success)
         match.ball.update(match) 
         return True
     if tag == CONVERSION:
-        
-        
+        if _place_kick.lining_up(match):
+            match.ball.update(match)
+            return True
         side = conversion_now(match, to=to)
 
     
@@ -1,6 +1,23 @@
 # states/offside.py
+"""
+Offside flags and interference for every phase.
+
+update_flags / maybe_infringement run on the player state arrays when the match
+has them: each team's offside line is worked out once per call (ruck/maul
+hindmost bound feet, scrum mark ±5 m, lineout mark ±10 m, kick line from the
+kicker) and then every player is tested against it, and against the ball for
+interference, in one NumPy pass. The per-player loops below are the fallback
+for test doubles without a store and define the laws the array path mirrors.
+
+The lines of the last update are kept on match.offside_lines for the UI:
+    {"phase": "ruck", "law": "breakdown", "a": 41.5, "b": 39.0}
+"a"/"b" are the x a player of that side must not be past (buffer included),
+None when that side has no line (e.g. the receiving side of a kick).
+"""
 from typing import Tuple, Optional, Any
+import numpy as np
 import event
+from utils.player.state_arrays import FLAG_BITS, arrays_of
 
 # --------- tiny helpers (no Match/Player edits required) ---------
 def _all_players(match):
@@ -26,11 +43,163 @@ TEN_METRES = 10.0
 INTERFERENCE_RADIUS = 3.0
 LINEOUT_GAP = 10.0
 SCRUM_5M = 5.0
+RUCK_BUFFER = 0.5
+
+_OFFSIDE = FLAG_BITS["offside"]
+_IN_LINEOUT = FLAG_BITS["in_lineout"]
+
+
+def _phase(tag) -> str:
+    return tag.split(".")[0] if isinstance(tag, str) and "." in tag else (tag or "open_play")
+
 
 def update_flags(match, tag: str, loc: Tuple[float, float, float], ctx: Optional[Any]) -> None:
     """Set per-player offside flags based on the current phase/state tag."""
-    phase = tag.split(".")[0] if isinstance(tag, str) and "." in tag else (tag or "open_play")
+    phase = _phase(tag)
+    store = arrays_of(match)
+    if store is None:
+        _update_flags_scan(match, phase, loc)
+        return
 
+    lines, offside = evaluate(match, tag, loc)
+    current = (store.flags & _OFFSIDE) != 0
+    players = store.players
+    for r in np.flatnonzero(offside != current).tolist():
+        players[r].flags["offside"] = bool(offside[r])
+    match.offside_lines = lines
+
+
+def maybe_infringement(match, tag, loc, ctx) -> None:
+    """Raise an event for every offside player who materially interferes."""
+    ball_pos = getattr(match.ball, "location", loc)
+    for p, kind in interference_candidates(match, ball_pos):
+        event.push(match, kind, ball_pos, _code(p))
+
+
+# ---------- array evaluator ----------
+
+def evaluate(match, tag, loc):
+    """
+    (lines, offside) for the phase of `tag`: the match.offside_lines dict and a
+    bool mask over the store rows (match.players order). Flags are not written.
+    """
+    store = arrays_of(match)
+    store.refresh()
+    phase = _phase(tag)
+    x = store.pos[:, 0]
+    sign_a, sign_b = match.team_a.attack_sign, match.team_b.attack_sign
+    last = getattr(match.ball, "last_status", {}) or {}
+    kicker = match.get_player_by_code(last["holder"]) if last.get("holder") else None
+    kicker_sign = None
+    if kicker is not None:
+        kicker_sign = sign_a if kicker.team_code == "a" else sign_b
+
+    law, line_a, line_b, offside = None, None, None, None
+    if phase in ("ruck", "maul"):
+        bound = _breakdown_lines(match, sign_a, sign_b)
+        if bound is not None:
+            law = "breakdown"
+            line_a, line_b = (_line_past(l, s, RUCK_BUFFER) for l, s in zip(bound, (sign_a, sign_b)))
+    elif phase == "scrum":
+        mx = float(loc[0])
+        law = "scrum"
+        line_a, line_b = _line_past(mx, sign_a, SCRUM_5M), _line_past(mx, sign_b, SCRUM_5M)
+    elif phase in ("restart", "lineout"):
+        mx = float(loc[0])
+        law = "lineout"
+        line_a, line_b = _line_past(mx, sign_a, LINEOUT_GAP), _line_past(mx, sign_b, LINEOUT_GAP)
+
+    if law is not None:
+        past_a = (x > line_a) if sign_a > 0 else (x < line_a)
+        past_b = (x > line_b) if sign_b > 0 else (x < line_b)
+        offside = np.where(store.team_mask("a"), past_a, past_b)
+        if law == "lineout":
+            offside &= (store.flags & _IN_LINEOUT) == 0
+    else:
+        offside = np.zeros(len(store.players), dtype=bool)
+        if kicker is not None and _kicked(match.ball, last):
+            law = "kick"
+            kicker_x = kicker.location[0]
+            own = store.team_mask(kicker.team_code)
+            offside = own & (x > kicker_x if kicker_sign > 0 else x < kicker_x)
+            if kicker.team_code == "a":
+                line_a = kicker_x
+            else:
+                line_b = kicker_x
+
+    if kicker is not None:
+        _puts_onside(match.ball, last, store.team_mask(kicker.team_code), kicker.location[0],
+                     kicker_sign, x, offside)
+    return {"phase": phase, "law": law,
+            "a": None if line_a is None else float(line_a),
+            "b": None if line_b is None else float(line_b)}, offside
+
+
+def interference_candidates(match, ball_pos) -> list:
+    """[(player, event type)] for offside players close enough to the ball to interfere."""
+    store = arrays_of(match)
+    if store is None:
+        return _interference_scan(match, ball_pos)
+    aerial = getattr(match.ball, "holder", None) is None and getattr(match.ball, "in_air", False)
+    store.refresh_flags()
+    offside = (store.flags & _OFFSIDE) != 0
+    if not offside.any():
+        return []
+    d2 = store.dist2(ball_pos)
+    near = offside & (d2 <= INTERFERENCE_RADIUS ** 2)
+    hits = (offside & (d2 <= TEN_METRES ** 2)) if aerial else near
+
+    out = []
+    players = store.players
+    for r in np.flatnonzero(hits).tolist():
+        p = players[r]
+        if _is_retreating(match, p):
+            continue
+        out.append((p, "penalty.offside" if near[r] else "penalty.offside_10m"))
+    return out
+
+
+def _line_past(line_x: float, dirn: int, buffer: float) -> float:
+    """The x a player attacking `dirn` must not be past (same arithmetic as _is_past_line)."""
+    return (line_x + buffer) if dirn > 0 else (line_x - buffer)
+
+
+def _breakdown_lines(match, l_dir, r_dir):
+    """Hindmost bound x of each side, or None when one side has nobody bound."""
+    ruckers = _participants_in_contact(match)
+    l_x = [p.location[0] for p in ruckers if getattr(p, "team_code", None) == "a"]
+    r_x = [p.location[0] for p in ruckers if getattr(p, "team_code", None) != "a"]
+    if not l_x or not r_x:
+        return None
+    return (min(l_x) if l_dir > 0 else max(l_x)), (max(r_x) if r_dir > 0 else min(r_x))
+
+
+def _kicked(ball, last) -> bool:
+    """A kick is the last or current ball action."""
+    curr = getattr(ball, "status", {}) or {}
+    # your kick action sets "kicked" in actions/kick.py; include both spellings
+    return (last.get("action") in ("kick", "kicked")) or (curr.get("action") in ("kick", "kicked"))
+
+
+def _puts_onside(ball, last, own, kicker_x, dirn, x, offside) -> None:
+    """Array form of _apply_open_play_puts_onside for the kicker's side `own`; edits `offside` in place."""
+    # A) any onside teammate moves ahead of them
+    onside = own & ~offside
+    if onside.any():
+        lead_x = x[onside].max() if dirn > 0 else x[onside].min()
+        offside &= ~(own & (x <= lead_x if dirn > 0 else x >= lead_x))
+
+    # B) opponent touch → everyone onside
+    if last.get("touched_by_opposition", False) or getattr(ball, "touched_by_opposition", False):
+        offside &= ~own
+
+    # C) retreat behind kicker line
+    offside &= ~(own & (x <= kicker_x if dirn > 0 else x >= kicker_x))
+
+
+# ---------- per-player fallback ----------
+
+def _update_flags_scan(match, phase, loc) -> None:
     if phase in ("ruck", "maul"):
         _offside_breakdown(match)
     elif phase == "scrum":
@@ -43,12 +212,12 @@ def update_flags(match, tag: str, loc: Tuple[float, float, float], ctx: Optional
     # universal puts-onside (mostly open play)
     _apply_open_play_puts_onside(match)
 
-def maybe_infringement(match, tag, loc, ctx) -> None:
-    """If an offside player materially interferes, raise an event."""
-    ball_pos = getattr(match.ball, "location", loc)
+
+def _interference_scan(match, ball_pos) -> list:
     holder = getattr(match.ball, "holder", None)
     aerial = holder is None and getattr(match.ball, "in_air", False)
 
+    out = []
     for p in _all_players(match):
         if not p.flags.get("offside", False):
             continue
@@ -57,13 +226,13 @@ def maybe_infringement(match, tag, loc, ctx) -> None:
 
         # close to ball/receiver
         if _dist2(p.location, ball_pos) <= INTERFERENCE_RADIUS ** 2:
-            event.set_event(("penalty.offside", ball_pos, _code(p)))
-            return
+            out.append((p, "penalty.offside"))
+            continue
 
         # 10m protection for aerial ball
         if aerial and _dist2(p.location, ball_pos) <= (TEN_METRES ** 2):
-            event.set_event(("penalty.offside_10m", ball_pos, _code(p)))
-            return
+            out.append((p, "penalty.offside_10m"))
+    return out
 
 # ---------- Phase implementations ----------
 
@@ -92,9 +261,9 @@ def _offside_breakdown(match):
     for p in _all_players(match):
         team = _team_of(match, p)
         if team is left_team:
-            p.flags["offside"] = _is_past_line(p.location[0], l_line_x, l_dir, buffer=0.5)
+            p.flags["offside"] = _is_past_line(p.location[0], l_line_x, l_dir, buffer=RUCK_BUFFER)
         else:
-            p.flags["offside"] = _is_past_line(p.location[0], r_line_x, r_dir, buffer=0.5)
+            p.flags["offside"] = _is_past_line(p.location[0], r_line_x, r_dir, buffer=RUCK_BUFFER)
 
 def _offside_scrum(match, mark):
     """Scrum: ±5m behind hindmost foot (use mark.x)."""
@@ -18,6 +18,7 @@ OPEN_PLAY_TAGS = {
 
 from typing import Any, Tuple, Optional
 import event
+from utils.positioning.spatial_index import index_of, GRID_X0, GRID_X1
 
 
 # --- tunables (fast to tweak) ---
@@ -50,6 +51,12 @@ def _count_defenders_behind_holder(match, holder_id: str) -> int:
     if not holder: return 0
     hx, hy, _ = holder.location
     dirn = _attack_dir_of_holder(match, holder_id)
+    index = index_of(match)
+    if index is not None:
+        opp = "b" if holder.team_code == "a" else "a"
+        if dirn > 0:
+            return index.count_in_band(GRID_X0 - 1e6, hx + LINEBREAK_BUFFER_X, team=opp)
+        return index.count_in_band(hx - LINEBREAK_BUFFER_X, GRID_X1 + 1e6, team=opp)
     # “behind” means toward ball carrier’s own tryline (opposite attack dir)
     def is_behind(px):
         if dirn > 0:  # attacking +x → behind == px <= hx + buffer
@@ -26,9 +26,11 @@ import event  # same module used by StateController
 
 
 def kickoff_now(match, to: str = "a") -> None:
+    if getattr(match, "first_kickoff_to", None) is None:
+        match.first_kickoff_to = to
     do_kickoff(match, to=to)
     x, y, _ = match.ball.location
-    #event.set_event("open_play.kick_chase", (float(x), float(y)), to)
+    #event.push(match, "open_play.kick_chase", (float(x), float(y)), to)
 
 
 def drop_22_now(match, to: str = "a") -> None:
@@ -1,6 +1,6 @@
 # states/ruck.py
 from typing import Optional
-import random, event
+import event
 
 START   = "ruck.start"
 FORMING = "ruck.forming"
@@ -12,9 +12,11 @@ RUCK_TAGS = {START, FORMING, OVER, OUT}
 
 
 # states/ruck.py
-from set_pieces.ruck import handle_start, handle_forming, handle_over, handle_out
+from utils.core.lazy import lazy_module
 from constants import TRYLINE_A_X, TRYLINE_B_X
 
+_impl = lazy_module("set_pieces.ruck")        # imported on the first ruck
+
 
 def maybe_handle(match, tag, loc, ctx) -> bool:
     
@@ -28,19 +30,19 @@ def maybe_handle(match, tag, loc, ctx) -> bool:
             match.ball.set_action("grounded")
             match.ball.update(match)
         else:
-            handle_start(match, (tag, loc, ctx))
+            _impl.handle_start(match, (tag, loc, ctx))
 
         return True
 
     if tag == FORMING:
-        handle_forming(match, (tag, loc, ctx))
+        _impl.handle_forming(match, (tag, loc, ctx))
         return True
 
     if tag == OVER:
-        handle_over(match, (tag, loc, ctx))
+        _impl.handle_over(match, (tag, loc, ctx))
         return True
     if tag == OUT:
-        handle_out(match, (tag, loc, ctx))
+        _impl.handle_out(match, (tag, loc, ctx))
         return True
 
 
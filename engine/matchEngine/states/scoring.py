@@ -39,7 +39,7 @@ def maybe_handle(match, tag, loc, ctx) -> bool:
                 holder = getattr(b, "holder", None)
                 team = holder[-1] if isinstance(holder, str) else (ctx if isinstance(ctx, str) else "b")
                 if x <= TRYLINE_A_X or x >= TRYLINE_B_X:
-                    event.set_event("restart.goal_line_drop", (x, y), team)
+                    event.push(match, "restart.goal_line_drop", (x, y), team)
                     b.set_action("goal_line")
                 else:
                     b.set_action("dropped")
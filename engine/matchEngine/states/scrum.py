@@ -1,6 +1,6 @@
 # states/scrum.py
 from typing import Optional
-import random, event  # your project's event system
+import event  # your project's event system
 
 # Public tags
 START  = "scrum.start"
@@ -15,12 +15,10 @@ OUT    = "scrum.out"
 
 SCRUM_TAGS = {START, CROUCH, BIND, SET, FEED, DRIVE, STABLE, OUT}
 
-# Handlers are implemented in set_pieces.scrum
-from set_pieces.scrum import (
-    handle_start,
-    handle_crouch, handle_bind, handle_set,
-    handle_feed, handle_drive, handle_stable, handle_out
-)
+# Handlers are implemented in set_pieces.scrum (imported on the first scrum)
+from utils.core.lazy import lazy_module
+
+_impl = lazy_module("set_pieces.scrum")
 
 def maybe_handle(match, tag, loc, ctx) -> bool:
     """Dispatch scrum states using the same style as states/ruck.py."""
@@ -30,20 +28,20 @@ def maybe_handle(match, tag, loc, ctx) -> bool:
  
 
     if tag == START:
-        handle_start(match, (tag, loc, ctx)); return True
+        _impl.handle_start(match, (tag, loc, ctx)); return True
     if tag == CROUCH:
-        handle_crouch(match, (tag, loc, ctx)); return True
+        _impl.handle_crouch(match, (tag, loc, ctx)); return True
     if tag == BIND:
-        handle_bind(match, (tag, loc, ctx));   return True
+        _impl.handle_bind(match, (tag, loc, ctx));   return True
     if tag == SET:
-        handle_set(match, (tag, loc, ctx));    return True
+        _impl.handle_set(match, (tag, loc, ctx));    return True
     if tag == FEED:
-        handle_feed(match, (tag, loc, ctx));   return True
+        _impl.handle_feed(match, (tag, loc, ctx));   return True
     if tag == DRIVE:
-        handle_drive(match, (tag, loc, ctx));  return True
+        _impl.handle_drive(match, (tag, loc, ctx));  return True
     if tag == STABLE:
-        handle_stable(match, (tag, loc, ctx)); return True
+        _impl.handle_stable(match, (tag, loc, ctx)); return True
     if tag == OUT:
-        handle_out(match, (tag, loc, ctx));    return True
+        _impl.handle_out(match, (tag, loc, ctx));    return True
 
     return False
\ No newline at end of file
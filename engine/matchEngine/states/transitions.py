@@ -0,0 +1,110 @@
+# states/transitions.py
+"""
+Compiled (last_action, curr_action) -> state tag table for StateController.
+
+compile_rules() runs once at import over ActionMatrix.ACTION_RULES:
+  - every action string is interned to a small int (unknown actions share OTHER),
+  - duplicate keys (same tag) and conflicts (different tags) are reported with
+    warnings.warn and kept on the table; the last rule wins, as a dict would,
+  - the lookup order of the old _resolve_state_tag is folded into a flat list:
+        exact (last, curr)  >  ("_", curr)  >  (last, "_")  >  fallback
+    so resolve() is two dict gets and one list index.
+
+TransitionTrace is a fixed-size ring of (tick, last_action, curr_action, tag)
+kept per controller for post-match analysis (controller.trace.entries()).
+"""
+
+import warnings
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from constants import TRANSITION_TRACE_SIZE
+from states.ActionMatrix import ACTION_RULES, SAME
+
+WILDCARD = "_"            # <- underscore means "any last_action"
+DEFAULT_FALLBACK = SAME
+
+OTHER = 0                 # interned id of every action no rule mentions
+
+
+class _Unknown:
+    """Stands in for any action no rule mentions while filling the table."""
+
+
+class TransitionTable:
+    def __init__(self, ids: Dict, cells: List[str], duplicates: list, conflicts: list):
+        self.ids = ids                    # action -> id (OTHER for unknown)
+        self.cells = cells                # flat [last_id * width + curr_id] -> tag
+        self.width = len(ids) + 1
+        self.duplicates = duplicates      # [(key, tag)] repeated with the same tag
+        self.conflicts = conflicts        # [(key, old_tag, new_tag)]
+
+    def resolve(self, last_action: Optional[str], curr_action: Optional[str]) -> str:
+        ids = self.ids
+        return self.cells[ids.get(last_action, OTHER) * self.width + ids.get(curr_action, OTHER)]
+
+
+def compile_rules(rules: Iterable[Tuple[Tuple[Optional[str], Optional[str]], str]],
+                  fallback: str = DEFAULT_FALLBACK) -> TransitionTable:
+    matrix: Dict[Tuple, str] = {}
+    duplicates, conflicts = [], []
+    for key, tag in rules:
+        if key in matrix:
+            if matrix[key] == tag:
+                duplicates.append((key, tag))
+                warnings.warn(f"ActionMatrix: duplicate rule {key!r} -> {tag!r}", stacklevel=2)
+            else:
+                conflicts.append((key, matrix[key], tag))
+                warnings.warn(f"ActionMatrix: conflicting rules for {key!r}: "
+                              f"{matrix[key]!r} replaced by {tag!r}", stacklevel=2)
+        matrix[key] = tag
+
+    actions = []
+    for last, curr in matrix:
+        for a in (last, curr):
+            if a != WILDCARD and a not in actions:
+                actions.append(a)
+    ids = {a: i + 1 for i, a in enumerate(actions)}
+    universe = [(OTHER, _Unknown)] + [(i, a) for a, i in ids.items()]
+
+    def lookup(last, curr) -> str:
+        # same order as the dict lookups it replaces; _Unknown never has a rule of its own
+        for key in ((last, curr), (WILDCARD, curr), (last, WILDCARD)):
+            tag = matrix.get(key)
+            if tag:
+                return tag
+        return fallback
+
+    width = len(ids) + 1
+    cells = [fallback] * (width * width)
+    for li, last in universe:
+        for ci, curr in universe:
+            cells[li * width + ci] = lookup(last, curr)
+    return TransitionTable(ids, cells, duplicates, conflicts)
+
+
+class TransitionTrace:
+    """Ring buffer of (tick, last_action, curr_action, tag); oldest entries are overwritten."""
+
+    __slots__ = ("size", "buf", "n")
+
+    def __init__(self, size: int = TRANSITION_TRACE_SIZE):
+        self.size = max(1, int(size))
+        self.buf: list = [None] * self.size
+        self.n = 0
+
+    def record(self, tick, last_action, curr_action, tag) -> None:
+        self.buf[self.n % self.size] = (tick, last_action, curr_action, tag)
+        self.n += 1
+
+    def entries(self) -> list:
+        """Recorded transitions, oldest first (at most `size`)."""
+        if self.n <= self.size:
+            return self.buf[:self.n]
+        i = self.n % self.size
+        return self.buf[i:] + self.buf[:i]
+
+    def __len__(self) -> int:
+        return min(self.n, self.size)
+
+
+TABLE = compile_rules(ACTION_RULES)
@@ -19,6 +19,10 @@ DEFAULT_TACTICS: Dict[str, Any] = {
     "def_spacing_infield": 3.0,
     "def_pillar1_offset": (1.0, -1.0),
     "def_pillar2_offset": (1.0, +1.0),
+
+    # --- set-piece shapes (names in shapes/library, incl. shapes/custom/*.json) ---
+    "scrum_shape": "scrum.default",
+    "lineout_shape": "lineout.five_man",
 }
 
 def build_default(overrides: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -11,11 +11,17 @@ class Team:
         self.roles = dict(roles or DEFAULT_ROLES)    # {"kicker":"sn.10", ...}
         self.in_possession = False
         self.score = 0
+        self.code = None          # 'a' / 'b', set with the registry in setup_match
+        self.registry = None      # utils.player.registry.PlayerRegistry
 
     def get_player_by_sn(self, sn: int):
+        if self.registry is not None:
+            return self.registry.sn(self.code, sn)
         return next((p for p in self.squad if getattr(p, "sn", None) == sn), None)
 
     def get_player_by_rn(self, rn: int):
+        if self.registry is not None:
+            return self.registry.rn(self.code, rn)
         return next((p for p in self.squad if getattr(p, "rn", None) == rn), None)
 
     def __repr__(self):
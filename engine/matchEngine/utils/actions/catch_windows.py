@@ -25,7 +25,7 @@ def can_catch(player_or_loc: Any, ball_loc: Any, *, radius: float = 1.0, max_hei
     """
     # Optional state gating when Player-like is passed
     flags = getattr(player_or_loc, "state_flags", None)
-    if isinstance(flags, dict):
+    if flags is not None:
         if flags.get("off_feet", False):      return False
         if flags.get("being_tackled", False): return False
         if flags.get("tackling", False):      return False
@@ -39,6 +39,15 @@ def can_catch(player_or_loc: Any, ball_loc: Any, *, radius: float = 1.0, max_hei
     dx, dy = bx - px, by - py
     return (dx * dx + dy * dy) <= (radius * radius)
 
+def _catch_candidates(players, bx: float, by: float, radius: float):
+    """Prefilter by XY radius on the match's grid index when the players are bound to one."""
+    if isinstance(players, list) and players:
+        index = getattr(getattr(players[0], "_store", None), "spatial_index", None)
+        if index is not None:
+            near = index.within((bx, by), radius)
+            return [p for p in near if p in players]
+    return players
+
 def best_catcher(players: Iterable, ball_loc: Any, *,
                  radius: float = 1.0, max_height: float = 1.5,
                  team_preference: Optional[str] = None):
@@ -52,7 +61,7 @@ def best_catcher(players: Iterable, ball_loc: Any, *,
 
     best = None
     best_d2 = float("inf")
-    for p in players:
+    for p in _catch_candidates(players, bx, by, radius):
         if not can_catch(p, (bx, by, bz), radius=radius, max_height=max_height):
             continue
         px, py, _ = _xyz(p)
@@ -72,3 +81,13 @@ def best_catcher(players: Iterable, ball_loc: Any, *,
                 best, best_d2 = p, d2
 
     return best
+
+def catch_point(ball, max_height: float = 1.5) -> Optional[Tuple[float, XYZ]]:
+    """
+    (seconds from now, ball xyz) when a ball in flight first drops into catch
+    height on its way down, from the ball's closed-form trajectory; None if it won't.
+    """
+    t = ball.time_to_height(max_height)
+    if t is None:
+        return None
+    return t, ball.location_at(t)
@@ -1,8 +1,7 @@
 from math import cos, sin, radians
 
 from constants import (
-     KICK_PRESETS, LATERAL_DRIFT_MAX,
-    KICK_PRESETS, LATERAL_DRIFT_MAX,
+    LATERAL_DRIFT_MAX,
     DEADBALL_LINE_A_X, DEADBALL_LINE_B_X,
     TOUCHLINE_BOTTOM_Y, TOUCHLINE_TOP_Y,
 )
@@ -1,72 +1,238 @@
 # utils/context.py
-from math import atan2
-from typing import Dict
+"""
+Per-tick snapshot shared by the decision layers.
+
+tick_context(match) returns one TickContext per world state: it is memoized on
+the match and rebuilt only when the tick, a player position or flag, the ball
+(location / holder) or possession changed since it was built. Every fact on it
+is computed lazily on first use and then cached, so when attack_choices,
+defender_choices, ball_holder_choices, kick_chase and the ruck/scrum planners
+ask the same question within a tick it is answered once.
+
+The returned tuples are shared between consumers: treat them as read-only.
+build_context(match) still returns the dict snapshot, built from the same facts.
+"""
+from math import atan2, hypot, sqrt
+from typing import Dict, Optional, Tuple
+import numpy as np
 from constants import (
     MAX_DEF_CONSIDERED, MAX_PASS_CANDIDATES, MAX_CHASERS,
     TOUCHLINE_BOTTOM_Y, TOUCHLINE_TOP_Y,
 )
+from utils.player.state_arrays import arrays_of
+from utils.positioning.spatial_index import index_of
 
-def build_context(match) -> Dict:
-    """
-    Single per-tick snapshot for the decision layers.
-    """
+_UNSET = object()
+
+
+def _stamp(match):
+    """What a TickContext depends on; None (never reuse) for test doubles without a store."""
+    store = arrays_of(match)
+    if store is None:
+        return None
+    store.refresh()
     ball = match.ball
-    bx, by, bz = ball.location
-    holder = ball.holder
-    in_flight = bool(ball.in_flight)
+    return (
+        match.tick_count, store.pos_version, store.flags_version,
+        ball.holder, tuple(ball.location),
+        match.team_a.in_possession, match.team_b.in_possession,
+    )
 
-    def slim(team_code: str):
-        team = match.team_a if team_code == 'a' else match.team_b
-        arr = []
-        for p in sorted(team.squad, key=lambda pp: (pp.rn, pp.sn)):
-            x, y, _ = p.location
-            arr.append({"sn": p.sn, "rn": p.rn, "x": x, "y": y, "code": f"{p.sn}{p.team_code}", "obj": p})
-        return {
-            "dir": float(team.tactics.get("attack_dir", +1.0)),
-            "in_possession": bool(team.in_possession),
-            "players": arr,
-            "holder_sn": int(holder[:-1]) if holder and holder.endswith(team_code) else None,
-        }
 
-    teams = {"a": slim('a'), "b": slim('b')}
+def tick_context(match) -> "TickContext":
+    """The memoized TickContext for the current world state."""
+    stamp = _stamp(match)
+    ctx = getattr(match, "tick_ctx", None)
+    if ctx is None or stamp is None or ctx.stamp != stamp:
+        ctx = TickContext(match, stamp)
+        match.tick_ctx = ctx
+    return ctx
+
+
+class TickContext:
+    def __init__(self, match, stamp=None):
+        self.match = match
+        self.stamp = stamp
+        ball = match.ball
+        self.ball_xyz: Tuple[float, float, float] = tuple(ball.location)
+        self.holder: Optional[str] = ball.holder
+        self._memo: Dict = {}
+
+    def _get(self, key, build):
+        v = self._memo.get(key, _UNSET)
+        if v is _UNSET:
+            v = self._memo[key] = build()
+        return v
+
+    # -----------------------
+    # teams / possession
+    # -----------------------
+    def team(self, code: str):
+        return self.match.team_a if code == "a" else self.match.team_b
+
+    def attack_dir(self, code: str) -> float:
+        return float((getattr(self.team(code), "tactics", None) or {}).get("attack_dir", +1.0))
+
+    @property
+    def attacking(self) -> Optional[str]:
+        """Team in possession (team.in_possession, else the holder's side), or None."""
+        return self._get("attacking", self._attacking)
+
+    def _attacking(self):
+        m = self.match
+        if getattr(m.team_a, "in_possession", False):
+            return "a"
+        if getattr(m.team_b, "in_possession", False):
+            return "b"
+        hid = self.holder
+        if isinstance(hid, str) and hid:
+            return "a" if hid[-1] == "a" else "b"
+        return None
+
+    @property
+    def possession(self) -> Optional[str]:
+        """Side of the ball holder only (None when the ball is loose)."""
+        h = self.holder
+        return "a" if (h and h.endswith("a")) else ("b" if (h and h.endswith("b")) else None)
+
+    @property
+    def holder_player(self):
+        return self._get("holder_player", lambda: self.match.get_player_by_code(self.holder) if self.holder else None)
+
+    # -----------------------
+    # player groups (match.players order unless noted)
+    # -----------------------
+    def players(self, code: str, without: Optional[str] = None) -> tuple:
+        """On-field players of `code`, optionally without those whose `without` flag is set."""
+        def build():
+            if without is None:
+                return tuple(p for p in self.match.players if p.team_code == code)
+            return tuple(p for p in self.players(code) if not p.state_flags.get(without, False))
+        return self._get(("players", code, without), build)
+
+    def support(self, code: str) -> tuple:
+        """Players free to take a team-shape slot: not the locked defender, tackling or being tackled."""
+        def build():
+            out = []
+            for p in self.players(code):
+                sf = p.state_flags
+                if sf.get("locked_defender", False):
+                    continue
+                if sf.get("tackling", False) or sf.get("being_tackled", False):
+                    continue
+                out.append(p)
+            return tuple(out)
+        return self._get(("support", code), build)
+
+    def lines(self, code: str) -> tuple:
+        """Squad sorted by (rn, sn)."""
+        return self._get(("lines", code), lambda: tuple(sorted(self.team(code).squad, key=lambda pp: (pp.rn, pp.sn))))
 
-    poss_code = 'a' if (holder and holder.endswith('a')) else ('b' if (holder and holder.endswith('b')) else None)
-    zone = None
-    if poss_code:
-        dir_ = teams[poss_code]["dir"]
-        proj = bx if dir_ > 0 else (100.0 - bx)
+    # -----------------------
+    # spatial facts
+    # -----------------------
+    def nearest_opponent_dist(self, player) -> float:
+        """Distance from `player` to the nearest opponent (1e9 when there is none)."""
+        def build():
+            hx, hy, _ = player.location
+            index = index_of(self.match)
+            if index is not None:
+                opp = "b" if player.team_code == "a" else "a"
+                hits = index.nearest((hx, hy), team=opp, k=1)
+                return sqrt(hits[0][1]) if hits else 1e9
+            best = 1e9
+            for p in self.match.players:
+                if p.team_code == player.team_code: continue
+                px, py, _ = p.location
+                d = hypot(px - hx, py - hy)
+                if d < best: best = d
+            return best
+        return self._get(("nearest_opp", player.team_code, player.sn), build)
+
+    @property
+    def zone(self) -> Optional[str]:
+        return self._get("zone", self._zone)
+
+    def _zone(self):
+        poss_code = self.possession
+        if not poss_code:
+            return None
+        bx = self.ball_xyz[0]
+        proj = bx if self.attack_dir(poss_code) > 0 else (100.0 - bx)
         if proj <= 22:
-            zone = "own_22"
+            return "own_22"
         elif proj <= 50:
-            zone = "own_half"
+            return "own_half"
         elif proj <= 78:
-            zone = "opp_half" if proj > 50 else "mid"
-        else:
-            zone = "opp_22"
+            return "opp_half" if proj > 50 else "mid"
+        return "opp_22"
+
+    @property
+    def defense_map(self) -> Optional[Dict]:
+        """nearest_to_holder / line_density / edge_space of the side defending the holder's team."""
+        return self._get("defense_map", self._defense_map)
+
+    def _defense_map(self):
+        attacking = self.possession
+        if not attacking:
+            return None
+        if arrays_of(self.match) is not None:
+            return self._defense_map_arrays(attacking)
+        return self._defense_map_scan(attacking)
+
+    def _defense_map_arrays(self, attacking: str):
+        # same output as _defense_map_scan, vectorised over the state arrays
+        store = arrays_of(self.match)
+        bx, by, _ = self.ball_xyz
+        defending = 'b' if attacking == 'a' else 'a'
+        rows = np.flatnonzero(store.team_mask(defending))
+        if rows.size == 0:
+            return self._defense_map_scan(attacking)
+        dx = store.pos[rows, 0] - bx
+        dy = store.pos[rows, 1] - by
+        dist = np.hypot(dx, dy)
+        sns = np.array([store.players[r].sn for r in rows])
+        order = np.lexsort((sns, dist))[:MAX_DEF_CONSIDERED]
+        ang = np.arctan2(dy[order], dx[order])
+        nearest = [(int(sns[i]), float(dist[i]), float(dx[i]), float(dy[i]), float(a))
+                   for i, a in zip(order, ang)]
+
+        ys = dy + by
+        att_dir = self.attack_dir(attacking)
+        ahead = dx * att_dir
+        return {
+            "nearest_to_holder": nearest,
+            "line_density": int(np.count_nonzero((ahead > 0) & (ahead <= 12.0))),
+            "edge_space": {
+                "low":  max(0.0, by - float(ys.min())),
+                "high": max(0.0, float(ys.max()) - by),
+            },
+        }
 
-    def build_defense_map(attacking: str):
+    def _defense_map_scan(self, attacking: str):
+        bx, by, _ = self.ball_xyz
         defending = 'b' if attacking == 'a' else 'a'
-        defs = teams[defending]["players"]
+        defs = self.lines(defending)
 
         nearest = []
         for d in defs:
-            dx, dy = d["x"] - bx, d["y"] - by
+            dx, dy = d.location[0] - bx, d.location[1] - by
             dist = (dx*dx + dy*dy) ** 0.5
             ang = atan2(dy, dx)
-            nearest.append((d["sn"], dist, dx, dy, ang))
+            nearest.append((d.sn, dist, dx, dy, ang))
         nearest.sort(key=lambda t: (t[1], t[0]))  # stable
         nearest = nearest[:MAX_DEF_CONSIDERED]
 
-        max_def_y = max((p["y"] for p in defs), default=by)
-        min_def_y = min((p["y"] for p in defs), default=by)
+        max_def_y = max((p.location[1] for p in defs), default=by)
+        min_def_y = min((p.location[1] for p in defs), default=by)
         edge_space = {
             "low":  max(0.0, by - min_def_y),   # toward y=0
             "high": max(0.0, max_def_y - by),   # toward y=70
         }
 
         # simple 12m band ahead of ball from defense POV
-        att_dir = teams[attacking]["dir"]
-        line_density = sum(1 for d in defs if 0 < (d["x"] - bx) * att_dir <= 12.0)
+        att_dir = self.attack_dir(attacking)
+        line_density = sum(1 for d in defs if 0 < (d.location[0] - bx) * att_dir <= 12.0)
 
         return {
             "nearest_to_holder": nearest,
@@ -74,13 +240,45 @@ def build_context(match) -> Dict:
             "edge_space": edge_space,
         }
 
-    defense_map = build_defense_map(poss_code) if poss_code else None
+    @property
+    def edge_space(self) -> Optional[Dict]:
+        dm = self.defense_map
+        return dm["edge_space"] if dm else None
+
+    @property
+    def line_density(self) -> Optional[int]:
+        dm = self.defense_map
+        return dm["line_density"] if dm else None
+
+
+def build_context(match) -> Dict:
+    """
+    Single per-tick snapshot for the decision layers (dict form of tick_context).
+    """
+    tc = tick_context(match)
+    ball = match.ball
+    bx, by, bz = tc.ball_xyz
+    holder = tc.holder
+    in_flight = bool(getattr(ball, "in_flight", ball.transit))
+
+    def slim(team_code: str):
+        team = tc.team(team_code)
+        arr = []
+        for p in tc.lines(team_code):
+            x, y, _ = p.location
+            arr.append({"sn": p.sn, "rn": p.rn, "x": x, "y": y, "code": f"{p.sn}{p.team_code}", "obj": p})
+        return {
+            "dir": tc.attack_dir(team_code),
+            "in_possession": bool(team.in_possession),
+            "players": arr,
+            "holder_sn": int(holder[:-1]) if holder and holder.endswith(team_code) else None,
+        }
 
     return {
         "ball": {"x": bx, "y": by, "z": bz, "holder_code": holder, "in_flight": in_flight},
-        "teams": teams,
-        "zone": zone,
-        "defense_map": defense_map,
+        "teams": {"a": slim('a'), "b": slim('b')},
+        "zone": tc.zone,
+        "defense_map": tc.defense_map,
         "score_time": dict(match.period),
         "advantage": match.advantage,
         "caps": {
@@ -94,4 +292,4 @@ def build_context(match) -> Dict:
     }
 def update_prev_player_positions(match):
     for p in match.players:
-        p._prev_xy = (p.location[0], p.location[1])
\ No newline at end of file
+        p._prev_xy = (p.location[0], p.location[1])
@@ -0,0 +1,135 @@
+# utils/core/fastforward.py
+"""
+Fast-forward through idle dead-ball waits.
+
+A handler that has nothing to do until some point later declares it with
+idle_until(match, at=..., until=...) on every tick it waits:
+
+  - at:    match_time at which the handler acts again (e.g. the conversion
+           kicker's CONVERSION_WINDOW_S running out, set_pieces/place_kick),
+  - until: predicate on the match, true once the wait is over.
+
+FastForward.after_tick() consumes the declaration. The wait is only skipped
+once a declared tick left the match exactly where the previous one did and
+used nothing that depends on the clock:
+
+  - no advantage running (advantage reads match_time),
+  - no rng draw this tick (streams are keyed by tick_count),
+  - no pending whistle event, no controller transition, no think scheduler
+    activity (re-plans are due by tick count),
+  - the full state image (utils/core/snapshot, bar the clock fields) equals
+    the previous tick's.
+
+Then every tick up to the wake-up is the same no-op, so jump() advances the
+clocks in one step to the last tick before it (and never past the end-of-half
+boundary); the next regular tick is the one where the handler acts. Clock
+arithmetic is repeated per skipped tick so match_time / period time land on
+the exact same floats as a tick-by-tick run.
+
+A cheap fingerprint (tag, ball, player position / flag arrays, counters) is
+compared first, so the image is only taken while nothing visibly moves.
+"""
+
+from utils.core import snapshot as snapshots
+from utils.player.state_arrays import arrays_of
+
+# match attributes that advance every tick by themselves
+_CLOCK = {"tick_count", "match_time", "period", "ticks_skipped", "wake"}
+
+
+def idle_until(match, at=None, until=None) -> None:
+    """Declare this tick idle until match_time `at` and/or `until(match)` holds."""
+    match.wake = (at, until)
+
+
+def _same(a, b) -> bool:
+    """Structural equality; small state objects (e.g. ScrumScore) compare by attributes."""
+    if a is b:
+        return True
+    t = type(a)
+    if t is not type(b):
+        return False
+    if t is dict:
+        return a.keys() == b.keys() and all(_same(v, b[k]) for k, v in a.items())
+    if t is list or t is tuple:
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if hasattr(a, "__dict__") and not isinstance(a, type):
+        return _same(vars(a), vars(b))
+    eq = a == b
+    return eq if isinstance(eq, bool) else bool(eq.all())
+
+
+def _image(match):
+    snap = snapshots.take(match)
+    images = dict(snap.images)
+    images["match"] = {k: v for k, v in images["match"].items() if k not in _CLOCK}
+    period = dict(match.period)
+    period.pop("time", None)
+    return images, snap.flags, period
+
+
+class FastForward:
+    """Per-run idle detector; after_tick() once per tick, jump() when it returns a wake-up."""
+
+    def __init__(self):
+        self._print = None           # fingerprint after the previous tick
+        self._image = None           # state image after the previous tick (taken lazily)
+
+    def _fingerprint(self, match, tag):
+        store = arrays_of(match)
+        if store is not None:
+            store.refresh()
+            players = (store.pos.tobytes(), store.flags.tobytes())
+        else:
+            players = tuple((p.location, tuple(p.state_flags.items())) for p in match.players)
+        ball = match.ball
+        think = getattr(match, "think", None)
+        status = match.state.controller
+        return (
+            tag, status.status[1], status.status[2], status.trace.n,
+            ball.location, ball.holder, id(ball.status), players,
+            getattr(think, "planned", None), getattr(think, "reused", None),
+        )
+
+    def _clean(self, match) -> bool:
+        rng = match.rng
+        if rng._counter_tick == match.tick_count and rng._counters:
+            return False
+        return match.advantage is None and not match.events.pending
+
+    def after_tick(self, match):
+        """The declared (at, until) wake-up when the tick just played was an idle no-op, else None."""
+        wake, match.wake = match.wake, None
+        if wake is None or not self._clean(match):
+            self._print = self._image = None
+            return None
+        fp = self._fingerprint(match, match.state.controller.status[0])
+        if fp != self._print:
+            self._print, self._image = fp, None
+            return None
+        image = _image(match)
+        prev, self._image = self._image, image
+        if prev is None:
+            # first quiet tick: the previous image was never taken, compare next tick
+            return None
+        return wake if _same(prev, image) else None
+
+    def jump(self, match, wake) -> int:
+        """Advance the clocks over every idle tick before the wake-up (or half end); returns the count."""
+        at, until = wake
+        rate, period = match.tick_rate, match.period
+        limit = match.half_limit()
+        n = 0
+        while period["time"] + rate < limit and (at is None or match.match_time + rate < at):
+            clocks = match.tick_count, match.match_time, period["time"]
+            match.tick_count += 1
+            match.match_time += rate
+            period["time"] += rate
+            if until is not None and until(match):
+                # the tick the handler wakes on is played normally
+                match.tick_count, match.match_time, period["time"] = clocks
+                break
+            n += 1
+        match.ticks_skipped += n
+        self._print = self._image = None
+        return n
@@ -0,0 +1,105 @@
+# utils/core/frames.py
+"""
+Output frame schedule, independent of the simulation step.
+
+The simulation always advances in fixed ticks of match.tick_rate (20 Hz).
+FrameClock decides which output frames fall due after each tick, at `fps`
+frames per match second:
+
+    fps None / 20   one frame per tick (the classic stream)
+    fps 10          every second tick (slow machines)
+    fps 60          three frames per tick; with interpolate=True each one
+                    blends the previous and the current tick (smooth UI)
+
+due() returns one alpha per frame: the frame's position between the previous
+tick (0) and the tick just played (1). Frame k sits at tick k * sim_hz / fps
+from the start of the run, kept as an exact fraction so schedules never drift.
+
+JSON frames from frame_json() are serialize_tick() plus interpolation hints:
+per player and for the ball "velocity" (m/s over the last tick) and "target",
+with "alpha" / interpolated "time" and locations on in-between frames. The
+binary stream only decimates (its layout carries no hints): its clock is built
+with upsample=False, which caps fps at the simulation rate, since a frame above
+it would repeat the tick byte for byte.
+"""
+
+from fractions import Fraction
+from typing import List
+
+from utils.core.logger import serialize_tick
+
+
+def _frac(v: float) -> Fraction:
+    return Fraction(v).limit_denominator(1000)
+
+
+class FrameClock:
+    def __init__(self, match, fps: float | None = None, interpolate: bool = False, upsample: bool = True):
+        self.match = match
+        self.sim_hz = _frac(1.0 / match.tick_rate)
+        self.fps = _frac(fps) if fps else self.sim_hz
+        if self.fps <= 0:
+            raise ValueError("fps must be positive")
+        if not upsample:
+            self.fps = min(self.fps, self.sim_hz)
+        self.step = self.sim_hz / self.fps        # ticks per output frame
+        self.interpolate = bool(interpolate)
+        self.hints = fps is not None or self.interpolate
+        self._base = match.tick_count
+        self._k = 0                               # output frames scheduled so far
+        self._prev = None                         # (ball xyz, player xyz list) before the tick
+
+    def before_tick(self) -> None:
+        """Remember where things were, for velocities and in-between frames."""
+        if self.hints:
+            m = self.match
+            self._prev = (m.ball.location, [p.location for p in m.players])
+
+    def due(self) -> List[float]:
+        """Alphas in (0, 1] of the output frames between the previous tick and now."""
+        n = self.match.tick_count - self._base
+        out = []
+        while (self._k + 1) * self.step <= n:
+            self._k += 1
+            out.append(float(self._k * self.step - (n - 1)))
+        return out
+
+    def skip(self) -> None:
+        """Drop frames scheduled before now (after a fast-forward jump)."""
+        n = self.match.tick_count - self._base
+        self._k = int(n / self.step)
+        self._prev = None
+
+    # -----------------------
+    # JSON frames
+    # -----------------------
+    def frame_json(self, alpha: float = 1.0) -> dict:
+        m = self.match
+        out = serialize_tick(m)
+        if not self.hints:
+            return out
+        rate = m.tick_rate
+        prev = self._prev
+        ball_prev, players_prev = prev if prev is not None else (m.ball.location, [p.location for p in m.players])
+
+        ball = out["ball"]
+        ball["velocity"] = _velocity(ball_prev, m.ball.location, rate)
+        ball["target"] = getattr(m.ball, "target", None)
+        for row, p, before in zip(out["players"], m.players, players_prev):
+            row["velocity"] = _velocity(before, p.location, rate)
+            row["target"] = p.target
+        if alpha < 1.0 and self.interpolate:
+            out["alpha"] = round(alpha, 4)
+            out["time"] = m.match_time - (1.0 - alpha) * rate
+            ball["location"] = _lerp(ball_prev, m.ball.location, alpha)
+            for row, p, before in zip(out["players"], m.players, players_prev):
+                row["location"] = _lerp(before, p.location, alpha)
+        return out
+
+
+def _velocity(a, b, dt: float):
+    return [round((b[0] - a[0]) / dt, 3), round((b[1] - a[1]) / dt, 3)]
+
+
+def _lerp(a, b, t: float):
+    return tuple(x + (y - x) * t for x, y in zip(a, b))
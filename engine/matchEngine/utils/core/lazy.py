@@ -0,0 +1,47 @@
+# utils/core/lazy.py
+"""
+Deferred imports for handler / planner / action modules.
+
+    _impl = lazy_module("set_pieces.scrum")     # nothing imported yet
+    _impl.handle_start(match, status)           # first attribute access imports it
+
+A match only pays for the set pieces and planners it reaches, and
+`import match` stays cheap (benchmarks/bench_engine.py tracks it). numpy is
+not deferred: Match() needs it for the player state arrays, so a first tick
+always pays its import. Attribute
+reads go through the live module, so module globals that change later (or
+are patched in tests) are always seen.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """Module stand-in; imported on the first attribute read."""
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_module", None)
+
+    def _load(self):
+        mod = self._module
+        if mod is None:
+            mod = importlib.import_module(self._name)
+            object.__setattr__(self, "_module", mod)
+        return mod
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    return LazyModule(name)
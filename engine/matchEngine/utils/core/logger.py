@@ -54,7 +54,7 @@ LEGACY_PREFIX = "__IPC__::match-tick::"
 
 def serialize_tick(match):
     # mirror the original shape as closely as possible
-    return {
+    out = {
         "tick": match.tick_count,
         "time": match.match_time,
         "score": match.scoreboard,
@@ -76,10 +76,19 @@ def serialize_tick(match):
         ],
         "state": _state_tag(match),  # falls back to current_state.name like before
     }
+    lines = getattr(match, "offside_lines", None)
+    if lines:
+        out["offside"] = lines       # {"phase", "law", "a": x | None, "b": x | None} for drawing
+    return out
 
 
 def dump_tick_json(match, *, flush=True):
     blob = serialize_tick(match)  # or serialize_tick_legacy(...) if you prefer that shape
+    return dump_frame_json(blob, flush=flush)
+
+
+def dump_frame_json(blob, *, flush=True):
+    """One JSON line on stdout (a serialize_tick blob, or a utils/core/frames frame)."""
     print(json.dumps(blob, separators=(",", ":"), ensure_ascii=False), flush=flush)
     return blob
 
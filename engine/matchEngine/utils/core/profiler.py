@@ -0,0 +1,152 @@
+# utils/core/profiler.py
+"""
+Opt-in per-subsystem tick profiler (Match(profile=True) or DOR_PROFILE=1).
+
+BaseState.tick() branches once on `match.profiler`; when set, the tick runs
+through BaseState._tick_profiled(), which laps perf_counter_ns() at the start
+of each stage (controller, sync_flags, advantage, every hard handler module,
+boundaries, open_play, choose_select, do_actions, ball.update,
+sync_flags.post) and records the laps here, keyed by (state tag, stage).
+
+Each key keeps a log2 histogram over the whole match plus a rolling window of
+the last WINDOW samples for recent percentiles. summary() returns a dict,
+report() formats it; Match dumps the report to stderr at the end of a run and
+on SIGUSR1 (where the platform has it). The signal handler is installed once
+per process and dumps every live profiler (batch workers, the daemon).
+"""
+
+import os
+import sys
+import weakref
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+WINDOW = 1000              # samples kept per key for rolling percentiles
+N_BUCKETS = 40             # log2(ns) buckets: 1 ns .. ~18 min
+TICK = "tick"              # pseudo-stage for the whole tick
+
+_signal_profilers = weakref.WeakSet()    # profilers dumped on SIGUSR1
+_signal_installed = False
+
+
+class _Hist:
+    __slots__ = ("n", "total", "max", "buckets", "recent")
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * N_BUCKETS
+        self.recent = deque(maxlen=WINDOW)
+
+    def add(self, ns: int) -> None:
+        self.n += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        self.buckets[min(N_BUCKETS - 1, ns.bit_length())] += 1
+        self.recent.append(ns)
+
+    def percentile(self, q: float) -> int:
+        """Rolling percentile over the last WINDOW samples (ns)."""
+        if not self.recent:
+            return 0
+        s = sorted(self.recent)
+        return s[min(len(s) - 1, int(q * len(s)))]
+
+    def as_dict(self) -> dict:
+        return {
+            "n": self.n,
+            "total_ms": self.total / 1e6,
+            "mean_us": (self.total / self.n / 1e3) if self.n else 0.0,
+            "p50_us": self.percentile(0.50) / 1e3,
+            "p95_us": self.percentile(0.95) / 1e3,
+            "max_us": self.max / 1e3,
+            # {upper bound in µs: count} for the non-empty log2 buckets
+            "hist": {round((1 << b) / 1e3, 3): c for b, c in enumerate(self.buckets) if c},
+        }
+
+
+class TickProfiler:
+    def __init__(self):
+        self.hists: Dict[Tuple[str, str], _Hist] = {}
+        self.ticks = 0
+
+    def add(self, tag, stage: str, ns: int) -> None:
+        key = (tag if isinstance(tag, str) else str(tag), stage)
+        h = self.hists.get(key)
+        if h is None:
+            h = self.hists[key] = _Hist()
+        h.add(ns)
+
+    def laps(self, tag, laps, t_end: int) -> None:
+        """laps: [(stage, t_start_ns), ...] in order; each stage runs until the next start."""
+        for (stage, t0), (_next, t1) in zip(laps, laps[1:] + [(None, t_end)]):
+            self.add(tag, stage, t1 - t0)
+        self.add(tag, TICK, t_end - laps[0][1])
+        self.ticks += 1
+
+    # -----------------------
+    # output
+    # -----------------------
+    def summary(self) -> dict:
+        """{"ticks", "by_stage": {stage: stats}, "by_tag": {tag: {stage: stats}}}"""
+        by_stage: Dict[str, _Hist] = {}
+        by_tag: Dict[str, dict] = {}
+        for (tag, stage), h in self.hists.items():
+            by_tag.setdefault(tag, {})[stage] = h.as_dict()
+            agg = by_stage.get(stage)
+            if agg is None:
+                agg = by_stage[stage] = _Hist()
+            agg.n += h.n
+            agg.total += h.total
+            agg.max = max(agg.max, h.max)
+            agg.buckets = [a + b for a, b in zip(agg.buckets, h.buckets)]
+            agg.recent.extend(h.recent)
+        return {
+            "ticks": self.ticks,
+            "by_stage": {s: h.as_dict() for s, h in by_stage.items()},
+            "by_tag": by_tag,
+        }
+
+    def report(self, top: int = 12) -> str:
+        s = self.summary()
+        lines = [f"tick profile: {s['ticks']} ticks"]
+        stages = sorted(s["by_stage"].items(), key=lambda kv: -kv[1]["total_ms"])
+        lines.append(f"  {'stage':<22}{'total ms':>10}{'mean µs':>10}{'p95 µs':>10}{'max µs':>10}")
+        for name, st in stages:
+            lines.append(f"  {name:<22}{st['total_ms']:>10.1f}{st['mean_us']:>10.1f}{st['p95_us']:>10.1f}{st['max_us']:>10.1f}")
+        tags = sorted(s["by_tag"].items(), key=lambda kv: -kv[1].get(TICK, {}).get("total_ms", 0.0))
+        lines.append(f"  {'state tag (whole tick)':<30}{'n':>8}{'total ms':>10}{'mean µs':>10}{'p95 µs':>10}")
+        for tag, stages_ in tags[:top]:
+            st = stages_.get(TICK)
+            if st:
+                lines.append(f"  {tag:<30}{st['n']:>8}{st['total_ms']:>10.1f}{st['mean_us']:>10.1f}{st['p95_us']:>10.1f}")
+        return "\n".join(lines)
+
+    def dump(self, fp=None) -> None:
+        print(self.report(), file=fp or sys.stderr, flush=True)
+
+    def install_signal(self) -> None:
+        """Dump on SIGUSR1 along with every other registered profiler (POSIX, main thread only)."""
+        global _signal_installed
+        _signal_profilers.add(self)
+        if _signal_installed:
+            return
+        import signal
+        import threading
+
+        sig = getattr(signal, "SIGUSR1", None)
+        if sig is None or threading.current_thread() is not threading.main_thread():
+            return
+        signal.signal(sig, _dump_registered)
+        _signal_installed = True
+
+
+def _dump_registered(_signum, _frame) -> None:
+    for profiler in list(_signal_profilers):
+        profiler.dump()
+
+
+def profiler_from_env() -> Optional[TickProfiler]:
+    return TickProfiler() if os.environ.get("DOR_PROFILE") in ("1", "true", "yes") else None
@@ -0,0 +1,221 @@
+# utils/core/replay.py
+"""
+Replay container (.dorr) written alongside a match.
+
+    magic "DORREPL1" | u32 header_len | header JSON
+    chunk* : zlib( tick_stream messages ) – each chunk starts with a KEYFRAME and
+             covers exactly `keyframe_every` ticks, so it decodes on its own
+    index  : zlib( JSON {"chunks": [[first_tick, time, offset, length], ...],
+                         "transitions": [[tick, tag], ...], "strings": {...},
+                         "rosters": [[from_tick, roster], ...]} )
+    trailer: u64 index_offset | u32 index_len | magic "DORRIDX1"
+
+header = {seed, team_ids, teams, engine_version, tick_rate, keyframe_every, roster}
+
+A substitution (Match.substitute) writes a ROSTER message and a keyframe into
+the running chunk and adds the new roster to the index's "rosters", so a
+chunk decoded on its own starts from the roster in effect at its first tick.
+
+Seeking a tick is O(1): chunk = (tick - first_tick) // keyframe_every, one
+chunk is decompressed and decoded. State-tag transitions (controller.status[0]
+changes) are indexed by tick, so "the 14th ruck" is one list lookup.
+"""
+
+import bisect
+import io
+import json
+import struct
+import zlib
+from typing import Iterator, List, Optional
+
+from constants import ENGINE_VERSION
+from utils.core.logger import _state_tag
+from utils.core.tick_stream import BinaryTickWriter, TickDecoder, iter_messages
+
+MAGIC = b"DORREPL1"
+INDEX_MAGIC = b"DORRIDX1"
+DEFAULT_REPLAY_KEYFRAME_EVERY = 100     # ticks per chunk (5 s at 20 Hz)
+
+_U32 = struct.Struct("<I")
+_TRAILER = struct.Struct("<QI8s")
+
+
+class ReplayWriter:
+    def __init__(self, match, path: str, keyframe_every: int = DEFAULT_REPLAY_KEYFRAME_EVERY, level: int = 6):
+        self.match = match
+        self.level = level
+        self.fh = open(path, "wb")
+        self._frames = BinaryTickWriter(match, io.BytesIO(), keyframe_every=keyframe_every, write_roster=False)
+        self.chunks: List[list] = []
+        self.transitions: List[list] = []
+        self.rosters: List[list] = []
+        self._last_tag = None
+        self._chunk_first = None
+
+        header = {
+            "seed": getattr(match, "seed", None),
+            "team_ids": list(getattr(match, "team_ids", (None, None))),
+            "teams": {"a": match.team_a.name, "b": match.team_b.name},
+            "engine_version": ENGINE_VERSION,
+            "tick_rate": match.tick_rate,
+            "keyframe_every": self._frames.keyframe_every,
+            "roster": self._frames.roster_header(),
+        }
+        blob = json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        self.fh.write(MAGIC + _U32.pack(len(blob)) + blob)
+
+    def _flush_chunk(self) -> None:
+        buf = self._frames.out
+        if self._chunk_first is None or not buf.tell():
+            return
+        data = zlib.compress(buf.getvalue(), self.level)
+        self.chunks.append([*self._chunk_first, self.fh.tell(), len(data)])
+        self.fh.write(data)
+
+    def write_tick(self) -> None:
+        m = self.match
+        if self._frames.next_is_keyframe:
+            self._flush_chunk()
+            self._frames.out = io.BytesIO()
+            self._chunk_first = (m.tick_count, round(m.match_time, 4))
+        tag = _state_tag(m)
+        if tag != self._last_tag:
+            self.transitions.append([m.tick_count, tag])
+            self._last_tag = tag
+        self._frames.write_tick()
+
+    def roster_changed(self) -> None:
+        """Players were substituted since the last frame; the next frame uses the new roster."""
+        self._frames.set_roster()
+        self.rosters.append([self.match.tick_count + 1, self._frames.roster_header()])
+
+    def close(self) -> None:
+        if self.fh.closed:
+            return
+        self._flush_chunk()
+        index = {
+            "chunks": self.chunks,
+            "transitions": self.transitions,
+            "strings": self._frames.string_table,
+            "rosters": self.rosters,
+        }
+        blob = zlib.compress(json.dumps(index, separators=(",", ":")).encode("utf-8"), self.level)
+        offset = self.fh.tell()
+        self.fh.write(blob)
+        self.fh.write(_TRAILER.pack(offset, len(blob), INDEX_MAGIC))
+        self.fh.close()
+
+
+class Replay:
+    """Random-access reader for a .dorr file."""
+
+    def __init__(self, path: str):
+        self.fh = open(path, "rb")
+        if self.fh.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path!r} is not a replay file")
+        (n,) = _U32.unpack(self.fh.read(_U32.size))
+        self.header = json.loads(self.fh.read(n).decode("utf-8"))
+
+        self.fh.seek(-_TRAILER.size, io.SEEK_END)
+        offset, length, magic = _TRAILER.unpack(self.fh.read(_TRAILER.size))
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{path!r} has no index (match still running or file truncated)")
+        self.fh.seek(offset)
+        index = json.loads(zlib.decompress(self.fh.read(length)).decode("utf-8"))
+        self.chunks = index["chunks"]
+        self.transitions = index["transitions"]
+        self.strings = {int(k): v for k, v in index["strings"].items()}
+        self.rosters = index.get("rosters", [])
+        self._roster_ticks = [r[0] for r in self.rosters]
+        self._chunk_times = [c[1] for c in self.chunks]
+
+    def close(self) -> None:
+        self.fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -----------------------
+    # decoding
+    # -----------------------
+    def _decoder(self, first_tick: int) -> TickDecoder:
+        i = bisect.bisect_right(self._roster_ticks, first_tick) - 1
+        r = self.rosters[i][1] if i >= 0 else self.header["roster"]
+        return TickDecoder(r["players"], self.strings, r["pos_scale"], r["orient_scale"])
+
+    def _chunk_ticks(self, i: int) -> Iterator[dict]:
+        first, _t, offset, length = self.chunks[i]
+        self.fh.seek(offset)
+        data = zlib.decompress(self.fh.read(length))
+        dec = self._decoder(first)
+        for msg, payload in iter_messages(io.BytesIO(data)):
+            tick = dec.decode(msg, payload)
+            if tick is not None:
+                yield tick
+
+    def chunk_for_tick(self, tick: int) -> int:
+        if not self.chunks:
+            raise IndexError("empty replay")
+        i = (tick - self.chunks[0][0]) // self.header["keyframe_every"]
+        return max(0, min(len(self.chunks) - 1, i))
+
+    # -----------------------
+    # seeking
+    # -----------------------
+    def seek(self, tick: int) -> Optional[dict]:
+        """Frame at `tick` (decodes one chunk)."""
+        for frame in self._chunk_ticks(self.chunk_for_tick(tick)):
+            if frame["tick"] == tick:
+                return frame
+        return None
+
+    def frames(self, start_tick: Optional[int] = None, end_tick: Optional[int] = None) -> Iterator[dict]:
+        """Frames in [start_tick, end_tick], decoding only the chunks involved."""
+        if not self.chunks:
+            return
+        first = 0 if start_tick is None else self.chunk_for_tick(start_tick)
+        for i in range(first, len(self.chunks)):
+            for frame in self._chunk_ticks(i):
+                if start_tick is not None and frame["tick"] < start_tick:
+                    continue
+                if end_tick is not None and frame["tick"] > end_tick:
+                    return
+                yield frame
+
+    def tick_at_time(self, seconds: float) -> int:
+        """First recorded tick at or after match time `seconds`."""
+        i = max(0, bisect.bisect_right(self._chunk_times, seconds) - 1)
+        for frame in self._chunk_ticks(i):
+            if frame["time"] >= seconds:
+                return frame["tick"]
+        return self.chunks[min(i + 1, len(self.chunks) - 1)][0]
+
+    def seek_minute(self, minute: float) -> Optional[dict]:
+        return self.seek(self.tick_at_time(minute * 60.0))
+
+    def find_transitions(self, prefix: Optional[str] = None) -> List[list]:
+        """[tick, tag] entries whose tag equals or starts with `prefix` ('ruck' → ruck.*)."""
+        if prefix is None:
+            return list(self.transitions)
+        return [t for t in self.transitions
+                if isinstance(t[1], str) and (t[1] == prefix or t[1].startswith(prefix + "."))]
+
+    def seek_transition(self, prefix: str, n: int) -> Optional[dict]:
+        """Frame where the n-th (1-based) `prefix` state began, e.g. ("ruck", 14)."""
+        episodes = self.episodes(prefix)
+        if n < 1 or n > len(episodes):
+            return None
+        return self.seek(episodes[n - 1])
+
+    def episodes(self, prefix: str) -> List[int]:
+        """Start ticks of each `prefix` episode; ruck.forming → ruck.over counts as one ruck."""
+        out, prev = [], False
+        for tick, tag in self.transitions:
+            inside = isinstance(tag, str) and (tag == prefix or tag.startswith(prefix + "."))
+            if inside and not prev:
+                out.append(tick)
+            prev = inside
+        return out
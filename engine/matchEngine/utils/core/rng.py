@@ -1,45 +1,105 @@
-# engine/matchEngine/utils/rng.py
+# engine/matchEngine/utils/core/rng.py
 
 import hashlib
-import struct
+import random
+
+import numpy as np
+
+_M64 = 0xFFFFFFFFFFFFFFFF
+_GOLDEN = 0x9E3779B97F4A7C15
+_INV_2_53 = 1.0 / (1 << 53)
+COUNTER_BITS = 24         # next() draws per (channel, key) per tick before ticks overlap
+
+
+def _mix64(z: int) -> int:
+    """SplitMix64 finaliser: 64-bit int -> well-mixed 64-bit int."""
+    z = (z + _GOLDEN) & _M64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _M64
+    return z ^ (z >> 31)
+
+
+_U64 = np.uint64
+_NP_GOLDEN, _NP_M1, _NP_M2 = _U64(_GOLDEN), _U64(0xBF58476D1CE4E5B9), _U64(0x94D049BB133111EB)
+_NP_30, _NP_27, _NP_31, _NP_11 = _U64(30), _U64(27), _U64(31), _U64(11)
+
+
+def _mix64_np(z: np.ndarray) -> np.ndarray:
+    """_mix64 over a uint64 array (NumPy arrays wrap at 64 bits); `z` is overwritten."""
+    z += _NP_GOLDEN
+    z ^= z >> _NP_30
+    z *= _NP_M1
+    z ^= z >> _NP_27
+    z *= _NP_M2
+    z ^= z >> _NP_31
+    return z
+
+
+def _pack(base: int, tick: int, key_h: int, counter: int) -> int:
+    """One 64-bit word per draw: tick in the high bits, the sequential counter below."""
+    return (base ^ key_h ^ (tick << COUNTER_BITS) ^ counter) & _M64
+
 
 class DeterministicRNG:
     """
     Deterministic RNG that produces the same number for the same
     (master_seed, tick, channel, key) combination, independent of call order.
+
+    Counter-based: channel/key strings are hashed once (blake2b / SplitMix64) and
+    cached as ints; a draw packs (channel_base, tick, key, counter) into one
+    64-bit word with XORs and shifts and runs it through the SplitMix64
+    finaliser. Only fixed-width integer arithmetic is involved, so a seed gives
+    the same stream on any platform and Python version.
     """
 
     def __init__(self, master_seed: int):
         self.master_seed = int(master_seed)
+        self._seed_h = _mix64(self.master_seed & _M64)
+        self._channel_base: dict = {}
+        self._key_h: dict = {}
+        self._key_arrays: dict = {}     # tuple(keys) -> uint64 array of their hashes (randf_many)
+        # sequential draws within one tick: (channel, key) -> n, reset on tick change
+        self._counters: dict = {}
+        self._counter_tick = None
 
-    def _hash_to_bytes(self, channel: str, tick: int, key: int | str = 0) -> bytes:
-        """
-        Creates a SHA256 hash of the deterministic RNG inputs.
-        """
-        # Normalize all parts to bytes
-        seed_bytes = str(self.master_seed).encode("utf-8")
-        tick_bytes = str(tick).encode("utf-8")
-        channel_bytes = str(channel).encode("utf-8")
-        key_bytes = str(key).encode("utf-8")
+    # -----------------------
+    # hashing
+    # -----------------------
+    def _hash_key(self, key) -> int:
+        h = self._key_h.get(key)
+        if h is None:
+            if isinstance(key, int) and not isinstance(key, bool):
+                h = _mix64(key & _M64)
+            else:
+                h = int.from_bytes(hashlib.blake2b(str(key).encode("utf-8"), digest_size=8).digest(), "little")
+            self._key_h[key] = h
+        return h
 
-        m = hashlib.sha256()
-        m.update(seed_bytes)
-        m.update(b"|")
-        m.update(tick_bytes)
-        m.update(b"|")
-        m.update(channel_bytes)
-        m.update(b"|")
-        m.update(key_bytes)
-        return m.digest()
+    def _base(self, channel: str) -> int:
+        b = self._channel_base.get(channel)
+        if b is None:
+            b = _mix64(self._seed_h ^ self._hash_key(("channel", channel)))
+            self._channel_base[channel] = b
+        return b
 
-    def randf(self, channel: str, tick: int, key: int | str = 0) -> float:
+    # -----------------------
+    # draws
+    # -----------------------
+    def randf(self, channel: str, tick: int, key: int | str = 0, counter: int = 0) -> float:
         """
-        Deterministic float in [0, 1) for given (channel, tick, key).
+        Deterministic float in [0, 1) for given (channel, tick, key[, counter]).
         """
-        h = self._hash_to_bytes(channel, tick, key)
-        # Take first 8 bytes as unsigned long long, normalize to [0,1)
-        val_int = struct.unpack(">Q", h[:8])[0]
-        return val_int / 2**64
+        b = self._channel_base.get(channel)
+        if b is None:
+            b = self._base(channel)
+        k = self._key_h.get(key)
+        if k is None:
+            k = self._hash_key(key)
+        # _mix64(_pack(...)) inlined: this is the hot path
+        z = ((b ^ k ^ (tick << COUNTER_BITS) ^ counter) + _GOLDEN) & _M64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _M64
+        return ((z ^ (z >> 31)) >> 11) * _INV_2_53
 
     def randint(self, channel: str, tick: int, a: int, b: int, key: int | str = 0) -> int:
         """
@@ -49,3 +109,69 @@ class DeterministicRNG:
             raise ValueError("a must be <= b")
         rf = self.randf(channel, tick, key)
         return a + int(rf * (b - a + 1))
+
+    def randf_many(self, channel: str, tick: int, keys) -> np.ndarray:
+        """
+        Batched randf: one float per key, identical to [randf(channel, tick, k) for k in keys].
+        The keys are hashed once per distinct key tuple; the pack and mix run on uint64 arrays.
+        """
+        keys = tuple(keys)
+        karr = self._key_arrays.get(keys)
+        if karr is None:
+            hk = self._hash_key
+            karr = self._key_arrays[keys] = np.array([hk(k) for k in keys], dtype=np.uint64)
+        b = self._channel_base.get(channel)
+        if b is None:
+            b = self._base(channel)
+        z = _mix64_np(karr ^ _U64(_pack(b, tick, 0, 0)))
+        z >>= _NP_11
+        return z.astype(np.float64) * _INV_2_53
+
+    def next(self, channel: str, tick: int, key: int | str = 0) -> float:
+        """
+        Sequential draw: the n-th call for (channel, key) within a tick uses counter n,
+        so repeated draws differ but a seed still reproduces the whole match.
+        """
+        if tick != self._counter_tick:
+            self._counters.clear()
+            self._counter_tick = tick
+        ck = (channel, key)
+        n = self._counters.get(ck, 0)
+        self._counters[ck] = n + 1
+        return self.randf(channel, tick, key, n)
+
+
+class RNGStream:
+    """
+    `random`-module-like view over match.rng for one (channel, key), drawing on
+    the current match tick. Without a match RNG (e.g. test doubles) it falls
+    back to the global `random` module.
+    """
+
+    __slots__ = ("_rng", "_match", "channel", "key")
+
+    def __init__(self, rng, match, channel: str, key: int | str = 0):
+        self._rng = rng
+        self._match = match
+        self.channel = channel
+        self.key = key
+
+    def random(self) -> float:
+        if self._rng is None:
+            return random.random()
+        return self._rng.next(self.channel, getattr(self._match, "tick_count", 0), self.key)
+
+    __call__ = random
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("cannot choose from an empty sequence")
+        return seq[min(int(self.random() * len(seq)), len(seq) - 1)]
+
+
+def stream(match, channel: str, key: int | str = 0) -> RNGStream:
+    """Per-call-site RNG: stream(match, "kick", kicker_id).random()"""
+    return RNGStream(getattr(match, "rng", None), match, channel, key)
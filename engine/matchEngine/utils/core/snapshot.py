@@ -0,0 +1,243 @@
+# utils/core/snapshot.py
+"""
+In-memory match snapshots for what-if lookahead.
+
+    snap = match.snapshot()        # state image at the current tick
+    match.restore(snap)            # rewind this match to it (snap stays reusable)
+    alt = match.fork()             # independent Match continuing from here
+    alt.team_a.tactics["attack_depth_10"] = 9.0
+
+A snapshot holds one attribute image per stateful object (match, ball, teams,
+players and their state_flags, controller + transition trace, event bus,
+think scheduler, rng counters). Images are copied containers, not pickles:
+immutable values (tuples, strings, numbers) are shared with the live match
+and only dicts / lists / sets are copied; append-only logs and the think
+plans (entries replaced, never edited) are copied shallowly. Taking or
+applying one is a walk over a few hundred small values. References between objects
+(e.g. think plans holding Players, team.squad) stay references; fork() maps
+them onto its own objects.
+
+Derived state is rebuilt, never copied: the player arrays are marked dirty,
+the registry is re-indexed, the spatial index re-syncs on its version, and
+tick_ctx / ball predictions are dropped. A restored or forked match continues
+tick for tick exactly like the original would have from the snapshot.
+
+The roster (which Player object holds each row) is part of the snapshot: a
+restore across Match.substitute() puts the original Players back on their
+rows, in the squads and in the registry, and unbinds the replacements.
+"""
+
+import copy
+from typing import Dict
+
+from event import EventBus
+from choice.think import ThinkScheduler
+from utils.core.rng import DeterministicRNG
+from utils.player.registry import PlayerRegistry
+from utils.player.state_arrays import PlayerFlags, PlayerStateArrays
+from utils.positioning.spatial_index import SpatialIndex
+
+# attributes that are structure (shared objects, bindings) or derived caches
+_SKIP = {
+    "match": {"ball", "team_a", "team_b", "players", "pitch", "registry", "player_arrays",
+              "spatial_index", "events", "think", "state", "rng", "profiler", "tick_ctx",
+              "replay"},
+    "ball": {"_pred"},
+    "team": {"registry"},
+    "player": {"_store", "_row", "_registry", "state_flags", "flags",
+               "name", "team_code", "height", "weight", "attributes", "norm_attributes"},
+    "controller": {"match", "trace"},
+    "trace": set(),
+    "events": set(),
+    "think": set(),
+    "rng": {"master_seed", "_seed_h", "_channel_base", "_key_h"},
+}
+
+# containers whose entries are never mutated in place, only added / replaced:
+# a shallow copy keeps snapshot and live match apart (copy-on-write). fork()
+# still copies them fully, since think plans hold Players it has to remap.
+_COW = {"trace": {"buf"}, "events": {"pending", "last_drained"}, "think": {"_plans"}}
+
+_ATOMS = (int, float, complex, str, bytes, bool, type(None), range)
+_ATOM_TYPES = frozenset(_ATOMS)
+
+
+class MatchSnapshot:
+    """State image of a match at `tick` (see module docstring)."""
+
+    __slots__ = ("tick", "images", "flags", "roster")
+
+    def __init__(self, tick, images: Dict, flags: list, roster: tuple):
+        self.tick = tick
+        self.images = images      # role -> {attr: value}
+        self.flags = flags        # per player (match.players order): state_flags contents
+        self.roster = roster      # the Player objects, match.players order
+
+
+def _kind(role) -> str:
+    if isinstance(role, tuple):
+        return role[0]
+    return "team" if role in ("team_a", "team_b") else role
+
+
+def _objects(match, players=None) -> Dict:
+    """role -> live object holding part of the match state (`players` overrides the roster)."""
+    ctrl = match.state.controller
+    objs = {
+        "match": match, "ball": match.ball, "team_a": match.team_a, "team_b": match.team_b,
+        "controller": ctrl, "trace": ctrl.trace, "events": match.events,
+        "think": match.think, "rng": match.rng,
+    }
+    for i, p in enumerate(match.players if players is None else players):
+        objs[("player", i)] = p
+    return objs
+
+
+def _attrs(obj) -> dict:
+    d = getattr(obj, "__dict__", None)
+    if d is not None:
+        return d
+    return {s: getattr(obj, s) for s in type(obj).__slots__ if hasattr(obj, s)}
+
+
+def _copy(v, memo: dict):
+    """Copy mutable containers, share immutables; objects in memo map to their counterpart."""
+    if type(v) in _ATOM_TYPES or isinstance(v, _ATOMS):
+        return v
+    hit = memo.get(id(v))
+    if hit is not None:
+        return hit
+    t = type(v)
+    if t is tuple:
+        for x in v:
+            if not isinstance(x, _ATOMS):
+                break
+        else:
+            return v
+        out = tuple(_copy(x, memo) for x in v)
+        return v if all(a is b for a, b in zip(out, v)) else out
+    # containers are recorded in memo so values shared between attributes stay shared
+    if t is dict:
+        out = memo[id(v)] = {}
+        for k, x in v.items():
+            out[k] = _copy(x, memo)
+        return out
+    if t is list:
+        out = memo[id(v)] = []
+        out.extend(_copy(x, memo) for x in v)
+        return out
+    if t is set:
+        out = memo[id(v)] = {_copy(x, memo) for x in v}
+        return out
+    # anything else (NamedTuples, small state objects like ScrumScore): generic copy
+    return copy.deepcopy(v, memo)
+
+
+def _memo(pairs) -> dict:
+    # deepcopy's memo is keyed by id(); _copy shares it. Keep the originals
+    # alive in the memo (deepcopy convention) so ids cannot be reused meanwhile.
+    memo = {}
+    keep = []
+    for src, dst in pairs:
+        memo[id(src)] = dst
+        keep.append(src)
+    memo[id(memo)] = keep
+    return memo
+
+
+def take(match) -> MatchSnapshot:
+    objs = _objects(match)
+    memo = _memo((o, o) for o in objs.values())
+    images = {}
+    for role, obj in objs.items():
+        kind = _kind(role)
+        skip, cow = _SKIP[kind], _COW.get(kind, ())
+        images[role] = {k: (v.copy() if k in cow else _copy(v, memo))
+                        for k, v in _attrs(obj).items() if k not in skip}
+    flags = [dict(p.state_flags) for p in match.players]
+    return MatchSnapshot(match.tick_count, images, flags, tuple(match.players))
+
+
+def _apply(match, snap: MatchSnapshot, memo: dict, same: bool) -> None:
+    for role, obj in _objects(match).items():
+        image = snap.images[role]
+        kind = _kind(role)
+        skip = _SKIP[kind]
+        cow = _COW.get(kind, ()) if same else ()
+        # attributes set after the snapshot was taken
+        for k in [k for k in _attrs(obj) if k not in skip and k not in image]:
+            delattr(obj, k)
+        for k, v in image.items():
+            setattr(obj, k, v.copy() if k in cow else _copy(v, memo))
+    for p, flags in zip(match.players, snap.flags):
+        p.state_flags.load(flags)
+    _rebuild_derived(match)
+
+
+def _rebuild_derived(match) -> None:
+    match.registry.rebuild(match.players)
+    store = match.player_arrays
+    for row, p in enumerate(store.players):
+        store.rn[row] = int(p.rn or 0)
+    store._dirty_pos.update(range(len(store.players)))
+    store._dirty_flags.update(range(len(store.players)))
+    store.refresh()
+    match.tick_ctx = None
+    match.ball._pred = (None, {})
+
+
+def _put_roster(match, roster: tuple) -> bool:
+    """Put the snapshot's Players back on their rows; True when the roster had changed."""
+    if all(a is b for a, b in zip(match.players, roster)):
+        return False
+    keep = {id(p) for p in roster}
+    for p in match.players:
+        if id(p) not in keep:
+            p._registry = None
+            p._store, p._row = None, -1
+            p.state_flags._store, p.state_flags._row = None, -1
+    match.players[:] = roster
+    store = match.player_arrays
+    for row, p in enumerate(roster):
+        store.players[row] = p
+        p._bind(store, row)
+    store._move_params = None
+    return True
+
+
+def restore(match, snap: MatchSnapshot) -> None:
+    changed = _put_roster(match, snap.roster)
+    objs = _objects(match)
+    _apply(match, snap, _memo((o, o) for o in objs.values()), same=True)
+    if changed and getattr(match, "replay", None) is not None:
+        match.replay.roster_changed()
+
+
+def fork(match, snap: MatchSnapshot = None):
+    """A new, independent Match in the state of `snap` (default: now)."""
+    snap = snap if snap is not None else take(match)
+    new = copy.copy(match)
+    new.profiler = None
+    new.ball = copy.copy(match.ball)
+    new.team_a = copy.copy(match.team_a)
+    new.team_b = copy.copy(match.team_b)
+    new.players = []
+    for p in snap.roster:
+        q = copy.copy(p)
+        q._store, q._row, q._registry = None, -1, None
+        q.state_flags = PlayerFlags()
+        new.players.append(q)
+
+    # fresh structure of the same kind; _apply fills in the state
+    new.rng = DeterministicRNG(match.seed)
+    new.events = EventBus()
+    new.think = ThinkScheduler()
+    new.state = type(match.state)(new)
+    new.registry = PlayerRegistry(new.players)
+    new.team_a.registry = new.team_b.registry = new.registry
+    new.player_arrays = PlayerStateArrays(new.players)
+    new.spatial_index = SpatialIndex(new.player_arrays)
+
+    old, cur = _objects(match, snap.roster), _objects(new)
+    _apply(new, snap, _memo((old[role], cur[role]) for role in old), same=False)
+    return new
@@ -0,0 +1,62 @@
+# utils/core/summary.py
+"""
+Compact match summary for headless runs (no per-tick frames).
+
+Collects, per tick and in O(1) amortised work:
+  - the event timeline: state-tag transitions, score changes, half/full time
+  - per-player counters: ball actions committed while the player was the holder
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from utils.core.logger import _state_tag
+
+TimelineEntry = Tuple[float, int, str, Any]   # (match_time, half, kind/tag, detail)
+
+
+class MatchSummary:
+    def __init__(self, match):
+        self.timeline: List[TimelineEntry] = []
+        self.player_counts: Dict[str, Counter] = {
+            f"{p.sn}{p.team_code}": Counter() for p in match.players
+        }
+        self._last_tag = None
+        self._last_status = None
+        self._last_score = dict(match.scoreboard)
+
+    def note(self, match, kind: str, detail: Any = None) -> None:
+        """Append a non-state entry (e.g. 'half_time') to the timeline."""
+        self.timeline.append((round(match.match_time, 2), match.period["half"], kind, detail))
+
+    def observe(self, match) -> None:
+        """Call once per tick after BaseState.tick()."""
+        tag = _state_tag(match)
+        if tag != self._last_tag:
+            ctx = match.state.controller.status[2]
+            self.note(match, tag, ctx if isinstance(ctx, (str, int, float)) or ctx is None else str(ctx))
+            self._last_tag = tag
+
+        ball = match.ball
+        status = ball.status
+        if status is not None and status is not self._last_status:
+            self._last_status = status
+            code = status.get("holder") or ball.true_holder
+            action = status.get("action")
+            if code in self.player_counts and action:
+                self.player_counts[code][action] += 1
+
+        if match.scoreboard != self._last_score:
+            self.note(match, "score", dict(match.scoreboard))
+            self._last_score = dict(match.scoreboard)
+
+    def result(self, match) -> dict:
+        return {
+            "teams": {"a": match.team_a.name, "b": match.team_b.name},
+            "seed": match.seed,
+            "score": dict(match.scoreboard),
+            "ticks": match.tick_count,
+            "match_time": round(match.match_time, 2),
+            "timeline": self.timeline,
+            "players": {code: dict(c) for code, c in self.player_counts.items() if c},
+        }
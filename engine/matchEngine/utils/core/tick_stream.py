@@ -0,0 +1,289 @@
+# utils/core/tick_stream.py
+"""
+Opt-in binary tick stream (alternative to dump_tick_json).
+
+Every message:  u8 type | u32 payload_len | payload        (all little-endian)
+
+  ROSTER   (1)  one-time JSON: {"version", "keyframe_every", "pos_scale", "orient_scale",
+                                "players": [{"name","sn","rn","team_code"}, ...]}
+  STRING   (2)  u16 id | utf-8 text      – interned state tags / player actions
+  KEYFRAME (3)  common | per player (roster order): i16 x, i16 y, i16 orient, u16 action
+  DELTA    (4)  common | u32 player_mask | per set bit: u8 field_mask | fields present
+                field_mask bits: 1 = x/y, 2 = orient, 4 = action; fields are diffed
+                against the previous KEYFRAME, so any delta decodes with just that keyframe.
+
+  common:  u32 tick | f32 time | u16 score_a | u16 score_b | u16 state_id |
+           i16 ball_x | i16 ball_y | i16 ball_z | u8 holder (roster index + 1, 0 = none) |
+           u16 offside_phase_id | u16 offside_law_id | i16 offside_a_x | i16 offside_b_x
+           (match.offside_lines; phase id 0 = no lines, LINE_NONE = no line for that side)
+
+Positions are centimetres (i16 covers the -15..115 m field), orientation is
+tenths of a degree, ORIENT_NONE marks "not set yet". String id 0 is None.
+Player z is not sent (players stay on the ground); decoders report 0.0.
+"""
+
+import json
+import struct
+
+from utils.core.logger import _state_tag
+
+MSG_ROSTER, MSG_STRING, MSG_KEYFRAME, MSG_DELTA = 1, 2, 3, 4
+
+STREAM_VERSION = 2
+POS_SCALE = 100.0        # metres → cm
+ORIENT_SCALE = 10.0      # degrees → 0.1°
+ORIENT_NONE = -32768
+LINE_NONE = -32768
+DEFAULT_KEYFRAME_EVERY = 20
+
+F_POS, F_ORIENT, F_ACTION = 1, 2, 4
+
+_MSG_HEAD = struct.Struct("<BI")
+_COMMON = struct.Struct("<IfHHHhhhBHHhh")
+_PLAYER = struct.Struct("<hhhH")
+_I16_MIN, _I16_MAX = -32768, 32767
+
+
+def _q(v: float, scale: float) -> int:
+    return max(_I16_MIN + 1, min(_I16_MAX, int(round(float(v) * scale))))
+
+
+def _line(x) -> int:
+    return LINE_NONE if x is None else _q(x, POS_SCALE)
+
+
+class BinaryTickWriter:
+    def __init__(self, match, out, keyframe_every: int = DEFAULT_KEYFRAME_EVERY, write_roster: bool = True):
+        """`out` is a binary file object (e.g. sys.stdout.buffer); it may be swapped between frames."""
+        self.match = match
+        self.out = out
+        self.keyframe_every = max(1, int(keyframe_every))
+        self._strings = {None: 0}
+        self._frames = 0
+        self._key_rows = None          # quantized player rows of the last keyframe
+        self._force_key = False
+        self._read_roster()
+        if write_roster:
+            self._write_roster()
+
+    def _read_roster(self) -> None:
+        self._roster = list(self.match.players)
+        if len(self._roster) > 32:
+            raise ValueError("binary tick stream supports at most 32 players (u32 delta mask)")
+        self._row_of_code = {f"{p.sn}{p.team_code}": i for i, p in enumerate(self._roster)}
+
+    def set_roster(self) -> None:
+        """
+        Re-read match.players (after a substitution): emits a ROSTER message now
+        and makes the next frame a keyframe, without moving the keyframe cadence.
+        """
+        self._read_roster()
+        self._write_roster()
+        self._force_key = True
+
+    # -----------------------
+    # framing
+    # -----------------------
+    def _emit(self, msg_type: int, payload: bytes) -> None:
+        self.out.write(_MSG_HEAD.pack(msg_type, len(payload)))
+        self.out.write(payload)
+
+    def roster_header(self) -> dict:
+        return {
+            "version": STREAM_VERSION,
+            "keyframe_every": self.keyframe_every,
+            "pos_scale": POS_SCALE,
+            "orient_scale": ORIENT_SCALE,
+            "players": [
+                {"name": p.name, "sn": p.sn, "rn": p.rn, "team_code": p.team_code}
+                for p in self._roster
+            ],
+        }
+
+    def _write_roster(self) -> None:
+        header = self.roster_header()
+        self._emit(MSG_ROSTER, json.dumps(header, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+
+    @property
+    def next_is_keyframe(self) -> bool:
+        return self._key_rows is None or self._frames % self.keyframe_every == 0
+
+    @property
+    def string_table(self) -> dict:
+        """{id: text} of everything interned so far (id 0 = None)."""
+        return {sid: text for text, sid in self._strings.items() if sid}
+
+    def _sid(self, text) -> int:
+        text = None if text is None else str(text)
+        sid = self._strings.get(text)
+        if sid is None:
+            sid = len(self._strings)
+            self._strings[text] = sid
+            self._emit(MSG_STRING, struct.pack("<H", sid) + text.encode("utf-8"))
+        return sid
+
+    # -----------------------
+    # frames
+    # -----------------------
+    def _common(self) -> bytes:
+        m = self.match
+        bx, by, bz = m.ball.location
+        holder = self._row_of_code.get(m.ball.holder, -1) + 1
+        lines = getattr(m, "offside_lines", None) or {}
+        return _COMMON.pack(
+            m.tick_count & 0xFFFFFFFF, float(m.match_time),
+            int(m.scoreboard.get("a", 0)), int(m.scoreboard.get("b", 0)),
+            self._sid(_state_tag(m)),
+            _q(bx, POS_SCALE), _q(by, POS_SCALE), _q(bz, POS_SCALE), holder,
+            self._sid(lines.get("phase")), self._sid(lines.get("law")),
+            _line(lines.get("a")), _line(lines.get("b")),
+        )
+
+    def _player_rows(self):
+        rows = []
+        for p in self._roster:
+            x, y = p.location[0], p.location[1]
+            o = p.orientation_deg
+            rows.append((
+                _q(x, POS_SCALE), _q(y, POS_SCALE),
+                ORIENT_NONE if o is None else _q(o, ORIENT_SCALE),
+                self._sid(p.action),
+            ))
+        return rows
+
+    def write_tick(self) -> int:
+        """Emit one frame for the current match state; returns bytes written."""
+        rows = self._player_rows()
+        common = self._common()
+        if self.next_is_keyframe or self._force_key:
+            payload = common + b"".join(_PLAYER.pack(*r) for r in rows)
+            self._key_rows = rows
+            self._force_key = False
+            msg = MSG_KEYFRAME
+        else:
+            mask = 0
+            parts = []
+            for i, (r, k) in enumerate(zip(rows, self._key_rows)):
+                if r == k:
+                    continue
+                mask |= 1 << i
+                fm = 0
+                body = b""
+                if r[0] != k[0] or r[1] != k[1]:
+                    fm |= F_POS
+                    body += struct.pack("<hh", r[0], r[1])
+                if r[2] != k[2]:
+                    fm |= F_ORIENT
+                    body += struct.pack("<h", r[2])
+                if r[3] != k[3]:
+                    fm |= F_ACTION
+                    body += struct.pack("<H", r[3])
+                parts.append(bytes((fm,)) + body)
+            payload = common + struct.pack("<I", mask) + b"".join(parts)
+            msg = MSG_DELTA
+        self._frames += 1
+        self._emit(msg, payload)
+        self.out.flush()
+        return _MSG_HEAD.size + len(payload)
+
+
+class TickDecoder:
+    """
+    Stateful decoder for the messages above; decode() returns a dict in the
+    serialize_tick shape (quantized values) for frame messages, None otherwise.
+    """
+
+    def __init__(self, roster=None, strings=None, pos_scale=POS_SCALE, orient_scale=ORIENT_SCALE):
+        self.roster = list(roster or [])
+        self.strings = {0: None, **(strings or {})}
+        self.pos_scale = pos_scale
+        self.orient_scale = orient_scale
+        self.key_rows = None
+
+    def decode(self, msg: int, payload: bytes):
+        if msg == MSG_ROSTER:
+            header = json.loads(payload.decode("utf-8"))
+            self.roster = header["players"]
+            self.pos_scale, self.orient_scale = header["pos_scale"], header["orient_scale"]
+            return None
+        if msg == MSG_STRING:
+            self.strings[struct.unpack_from("<H", payload)[0]] = payload[2:].decode("utf-8")
+            return None
+
+        roster, strings = self.roster, self.strings
+        tick, t, sa, sb, sid, bx, by, bz, holder, o_phase, o_law, o_a, o_b = _COMMON.unpack_from(payload)
+        off = _COMMON.size
+        if msg == MSG_KEYFRAME:
+            self.key_rows = [_PLAYER.unpack_from(payload, off + i * _PLAYER.size) for i in range(len(roster))]
+            rows = self.key_rows
+        else:
+            mask = struct.unpack_from("<I", payload, off)[0]
+            off += 4
+            rows = list(self.key_rows)
+            for i in range(len(roster)):
+                if not mask & (1 << i):
+                    continue
+                x, y, o, a = rows[i]
+                fm = payload[off]
+                off += 1
+                if fm & F_POS:
+                    x, y = struct.unpack_from("<hh", payload, off)
+                    off += 4
+                if fm & F_ORIENT:
+                    o = struct.unpack_from("<h", payload, off)[0]
+                    off += 2
+                if fm & F_ACTION:
+                    a = struct.unpack_from("<H", payload, off)[0]
+                    off += 2
+                rows[i] = (x, y, o, a)
+
+        ps, os_ = self.pos_scale, self.orient_scale
+        h = roster[holder - 1] if holder else None
+        out = {
+            "tick": tick,
+            "time": t,
+            "score": {"a": sa, "b": sb},
+            "ball": {
+                "location": (bx / ps, by / ps, bz / ps),
+                "holder": f"{h['sn']}{h['team_code']}" if h else None,
+            },
+            "players": [
+                {
+                    **info,
+                    "action": strings.get(a),
+                    "location": (x / ps, y / ps, 0.0),
+                    "orientation": None if o == ORIENT_NONE else o / os_,
+                }
+                for info, (x, y, o, a) in zip(roster, rows)
+            ],
+            "state": strings.get(sid),
+        }
+        if o_phase:
+            out["offside"] = {
+                "phase": strings.get(o_phase), "law": strings.get(o_law),
+                "a": None if o_a == LINE_NONE else o_a / ps,
+                "b": None if o_b == LINE_NONE else o_b / ps,
+            }
+        return out
+
+
+def iter_messages(fp):
+    """(msg_type, payload) pairs from a binary file object until EOF."""
+    while True:
+        head = fp.read(_MSG_HEAD.size)
+        if len(head) < _MSG_HEAD.size:
+            return
+        msg, n = _MSG_HEAD.unpack(head)
+        yield msg, fp.read(n)
+
+
+def read_ticks(fp, decoder: TickDecoder | None = None):
+    """
+    Decode a binary tick stream from a binary file object; yields dicts in the
+    serialize_tick shape (quantized values), e.g. for tests or offline analysis.
+    """
+    decoder = decoder or TickDecoder()
+    for msg, payload in iter_messages(fp):
+        tick = decoder.decode(msg, payload)
+        if tick is not None:
+            yield tick
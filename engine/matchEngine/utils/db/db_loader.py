@@ -1,7 +1,80 @@
+import os
 import sqlite3
 import json
+from collections import OrderedDict
+from types import MappingProxyType
 from utils.player.normalise_player import normalise_attrs
-def load_team_from_db(db_path, nation_team_id):
+
+# Squad cache: (abs db path, db version, nation_team_id) -> (team_name, players).
+# The db version is (mtime_ns, size, PRAGMA data_version) so a write from any
+# connection/process (e.g. the UI's save-selection) changes the key; stale
+# entries then simply age out of the LRU. invalidate_squad_cache() drops
+# entries explicitly.
+SQUAD_CACHE_SIZE = 32
+_squad_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_version_conns: dict = {}     # abs path -> connection kept open for PRAGMA data_version
+
+
+def _db_version(path):
+    st = os.stat(path)
+    conn = _version_conns.get(path)
+    if conn is None:
+        conn = _version_conns[path] = sqlite3.connect(path, check_same_thread=False)
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    return (st.st_mtime_ns, st.st_size, data_version)
+
+
+def invalidate_squad_cache(db_path=None, nation_team_id=None) -> int:
+    """Drop cached squads (all, one db, or one team of one db); returns how many."""
+    path = os.path.abspath(db_path) if db_path is not None else None
+    stale = [
+        key for key in _squad_cache
+        if (path is None or key[0] == path) and (nation_team_id is None or key[2] == nation_team_id)
+    ]
+    for key in stale:
+        del _squad_cache[key]
+    if path is not None and nation_team_id is None:
+        conn = _version_conns.pop(path, None)
+        if conn is not None:
+            conn.close()
+    return len(stale)
+
+
+def load_team_from_db(db_path, nation_team_id, use_cache=True):
+    """
+    (team_name, players) for a national team's selected starters.
+
+    Cached per (db, version, team): repeat calls skip SQLite and JSON/attribute
+    parsing. Each call returns fresh player dicts; "attributes" and
+    "norm_attributes" are shared read-only mappings, so copy them before mutating
+    (setup_match does).
+    """
+    path = os.path.abspath(db_path)
+    if not use_cache or not os.path.exists(path):
+        return _load_team(db_path, nation_team_id)
+
+    key = (path, _db_version(path), nation_team_id)
+    hit = _squad_cache.get(key)
+    if hit is None:
+        team_name, players = _load_team(path, nation_team_id)
+        for p in players:
+            p["attributes"] = MappingProxyType(p["attributes"])
+            p["norm_attributes"] = MappingProxyType(p["norm_attributes"])
+        hit = (team_name, tuple(players))
+        # a newer version of this team's squad makes older entries dead weight
+        for old in [k for k in _squad_cache if k[0] == path and k[2] == nation_team_id]:
+            del _squad_cache[old]
+        _squad_cache[key] = hit
+        while len(_squad_cache) > SQUAD_CACHE_SIZE:
+            _squad_cache.popitem(last=False)
+    else:
+        _squad_cache.move_to_end(key)
+
+    team_name, players = hit
+    return team_name, [dict(p) for p in players]
+
+
+def _load_team(db_path, nation_team_id):
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
@@ -77,3 +150,32 @@ def load_team_from_db(db_path, nation_team_id):
         })
 
     return team_name, players
+
+
+def load_player_from_db(db_path, player_id, sn=None, rn=None):
+    """One player in the load_team_from_db dict shape (e.g. a replacement from the bench)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT player_id, firstname, surname, current_ability, height, weight, attributes "
+            "FROM players WHERE player_id = ?",
+            (player_id,),
+        ).fetchone()
+    finally:
+        conn.close()
+    if not row:
+        raise ValueError(f"No player found with ID {player_id}")
+
+    pid, first, last, ca, height, weight, raw_attrs = row
+    attrs, norm_attrs = normalise_attrs(json.loads(raw_attrs) if raw_attrs else {})
+    return {
+        "player_id": pid,
+        "name": f"{first} {last}",
+        "sn": sn,
+        "rn": rn,
+        "current_ability": ca,
+        "height": height,
+        "weight": weight,
+        "attributes": attrs,
+        "norm_attributes": norm_attrs,
+    }
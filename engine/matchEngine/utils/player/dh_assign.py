@@ -20,7 +20,7 @@ def assign_dh_for_over(match, atk: str, base_xy: Tuple[float,float]) -> Optional
             p.state_flags["dummy_half"] = False
 
     # prefer 9 if available, on feet, not in ruck
-    nine = next((p for p in match.players if p.team_code == atk and p.rn == 9), None)
+    nine = (match.team_a if atk == "a" else match.team_b).get_player_by_rn(9)
     if nine and not nine.state_flags.get("in_ruck", False) and not nine.state_flags.get("off_feet", False):
         nine.state_flags["dummy_half"] = True
         return f"{nine.sn}{nine.team_code}"
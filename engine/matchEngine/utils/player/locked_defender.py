@@ -2,6 +2,7 @@
 
 from typing import Optional
 from states.open_play import OPEN_PLAY_TAGS
+from utils.positioning.spatial_index import index_of
 
 def _dist2(a_xy, b_xy) -> float:
     ax, ay = a_xy[0], a_xy[1]
@@ -44,15 +45,20 @@ def update(match, state_tag: Optional[str]) -> Optional[str]:
     opp_code = "b" if holder.team_code == "a" else "a"
 
     # find nearest opponent
-    nearest = None
-    best_d2 = float("inf")
-    for p in match.players:
-        if p.team_code != opp_code:
-            continue
-        d2 = _dist2(holder_xy, (p.location[0], p.location[1]))
-        if d2 < best_d2:
-            best_d2 = d2
-            nearest = p
+    index = index_of(match)
+    if index is not None:
+        hits = index.nearest(holder_xy, team=opp_code, k=1)
+        nearest = hits[0][0] if hits else None
+    else:
+        nearest = None
+        best_d2 = float("inf")
+        for p in match.players:
+            if p.team_code != opp_code:
+                continue
+            d2 = _dist2(holder_xy, (p.location[0], p.location[1]))
+            if d2 < best_d2:
+                best_d2 = d2
+                nearest = p
 
     # clear all, then set the one
     _set_flag_all(match, "locked_defender", False)
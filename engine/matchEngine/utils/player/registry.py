@@ -0,0 +1,94 @@
+# matchEngine/utils/player/registry.py
+"""
+O(1) player lookups, built once in setup_match:
+
+    code "10a"  -> Player   (role-number code, as Match.get_player_by_code parses it)
+    ("a", rn)   -> Player
+    ("a", sn)   -> Player
+
+Players registered here re-index themselves when `rn` / `sn` change (role
+swaps), and substitute() swaps one player for another, so every lookup stays
+consistent without rescanning squads.
+
+When two players share a key (e.g. mid-way through a role swap) the one
+registered or re-indexed last wins; once the swap completes the keys are
+unique again.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class PlayerRegistry:
+    def __init__(self, players: Iterable = ()):
+        self.by_code: Dict[str, object] = {}
+        self.by_rn: Dict[Tuple[str, object], object] = {}
+        self.by_sn: Dict[Tuple[str, object], object] = {}
+        self.rebuild(players)
+
+    # -----------------------
+    # maintenance
+    # -----------------------
+    def rebuild(self, players: Iterable) -> None:
+        """Re-index from scratch (e.g. after a snapshot restore rewrote rn / sn)."""
+        self.by_code.clear()
+        self.by_rn.clear()
+        self.by_sn.clear()
+        for p in players:
+            # first player wins on duplicates, like the old squad scans
+            if (p.team_code, p.rn) in self.by_rn or (p.team_code, p.sn) in self.by_sn:
+                p._registry = self
+                continue
+            self.add(p)
+
+    def add(self, p) -> None:
+        t = p.team_code
+        self.by_rn[(t, p.rn)] = p
+        self.by_sn[(t, p.sn)] = p
+        self.by_code[f"{p.rn}{t}"] = p
+        p._registry = self
+
+    def remove(self, p) -> None:
+        t = p.team_code
+        self._drop(self.by_rn, (t, p.rn), p)
+        self._drop(self.by_sn, (t, p.sn), p)
+        self._drop(self.by_code, f"{p.rn}{t}", p)
+        p._registry = None
+
+    @staticmethod
+    def _drop(index: dict, key, p) -> None:
+        if index.get(key) is p:
+            del index[key]
+
+    def reindex(self, p, field: str, old) -> None:
+        """Called by Player when rn / sn is reassigned."""
+        t = p.team_code
+        if field == "rn":
+            self._drop(self.by_rn, (t, old), p)
+            self._drop(self.by_code, f"{old}{t}", p)
+            self.by_rn[(t, p.rn)] = p
+            self.by_code[f"{p.rn}{t}"] = p
+        else:
+            self._drop(self.by_sn, (t, old), p)
+            self.by_sn[(t, p.sn)] = p
+
+    def substitute(self, off, on) -> None:
+        """`on` takes over every lookup that pointed at `off`."""
+        self.remove(off)
+        self.add(on)
+
+    # -----------------------
+    # lookups
+    # -----------------------
+    def code(self, code: Optional[str]):
+        return self.by_code.get(code) if code else None
+
+    def rn(self, team_code: str, rn):
+        return self.by_rn.get((team_code, rn))
+
+    def sn(self, team_code: str, sn):
+        return self.by_sn.get((team_code, sn))
+
+
+def registry_of(match) -> Optional[PlayerRegistry]:
+    """The match's registry, or None for test doubles."""
+    return getattr(match, "registry", None)
@@ -0,0 +1,308 @@
+# matchEngine/utils/player/state_arrays.py
+"""
+Struct-of-arrays mirror of the 30 on-field players for vectorised queries.
+
+Player objects stay the API everyone uses and own their state; each one is
+bound to a row here. The arrays are a mirror, not a view: writes to a Player
+(Player.update_location, state_flags[...] = ...) only mark its row dirty, and
+the dirty rows are pulled in one batch right before a query, so per-move cost
+stays O(1) and each query is a handful of NumPy ops over 30 rows instead of a
+Python loop. Nearest / within queries live in utils/positioning/spatial_index.
+"""
+
+from collections.abc import MutableMapping
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+TEAM_INDEX = {"a": 0, "b": 1}
+
+# boolean state_flags packed into `flags` bits (PlayerFlags.bits uses the same layout)
+FLAG_BITS = {
+    name: 1 << i for i, name in enumerate((
+        "being_tackled", "tackling", "off_feet", "in_scrum", "dummy_half",
+        "first_receiver", "in_ruck", "in_maul", "backfield", "has_ball",
+        "offside", "in_lineout", "locked_defender", "hold_for_pass", "jackal",
+    ))
+}
+
+
+# state_flags keys held as typed fields rather than bits (hold_for_pass is a
+# tick countdown; its FLAG_BITS bit means "non-zero")
+NUMERIC_FLAGS = {
+    "time_in_ruck": float,
+    "jackal_success": float,
+    "counter_cooldown": int,
+    "hold_for_pass": int,
+}
+
+_BOOL_BITS = {name: bit for name, bit in FLAG_BITS.items() if name not in NUMERIC_FLAGS}
+# presence of each known key (a popped / never-set key reads as missing, like a dict)
+_KEY_BITS = dict(FLAG_BITS)
+for _i, _name in enumerate(n for n in NUMERIC_FLAGS if n not in FLAG_BITS):
+    _KEY_BITS[_name] = 1 << (16 + _i)
+_MISSING = object()
+_bool_bit = _BOOL_BITS.get
+
+
+def flag_mask(*names: str) -> int:
+    """FLAG_BITS of boolean flags OR-ed together, for PlayerFlags.clear_bits."""
+    mask = 0
+    for name in names:
+        mask |= _BOOL_BITS[name]
+    return mask
+
+
+class PlayerFlags(MutableMapping):
+    """
+    Player.state_flags: boolean flags packed into `bits` (FLAG_BITS layout, the
+    same word the arrays' `flags` column holds), NUMERIC_FLAGS as typed fields,
+    any other key in a small dict. Reads and writes keep the dict API
+    (flags["in_ruck"] = True, .get, .pop, `in`), plus named accessors
+    (flags.in_ruck). Writes mark the owner's row dirty exactly when a dict
+    would have: a new key, a removed key or a change of truthiness. Iteration
+    follows insertion order, like a dict (clear_bits adds new keys in bit order).
+    """
+
+    __slots__ = ("bits", "_present", "time_in_ruck", "jackal_success", "counter_cooldown",
+                 "hold_for_pass", "_extra", "_order", "_store", "_row")
+
+    def __init__(self, *args, **kwargs):
+        self.bits = 0
+        self._present = 0
+        self.time_in_ruck = 0.0
+        self.jackal_success = 0.0
+        self.counter_cooldown = 0
+        self.hold_for_pass = 0
+        self._extra = None
+        self._order = {}        # present keys in insertion order (values unused)
+        self._store = None
+        self._row = -1
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def _touch(self):
+        if self._store is not None:
+            self._store._dirty_flags.add(self._row)
+
+    # -----------------------
+    # mapping
+    # -----------------------
+    def __getitem__(self, key):
+        v = self.get(key, _MISSING)
+        if v is _MISSING:
+            raise KeyError(key)
+        return v
+
+    def get(self, key, default=None):
+        bit = _bool_bit(key)
+        if bit is not None:
+            if self._present & bit:
+                return self.bits & bit != 0
+            return default
+        if key in NUMERIC_FLAGS:
+            return getattr(self, key) if self._present & _KEY_BITS[key] else default
+        extra = self._extra
+        return default if extra is None else extra.get(key, default)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __setitem__(self, key, value):
+        bit = _bool_bit(key)
+        if bit is not None:
+            old = self.bits
+            new = old | bit if value else old & ~bit
+            # handlers re-assert the same flags every tick; only a change of
+            # truthiness (or a new key) can change the packed bits
+            if new != old or not self._present & bit:
+                if not self._present & bit:
+                    self._order[key] = None
+                self.bits = new
+                self._present |= bit
+                self._touch()
+            return
+        cast = NUMERIC_FLAGS.get(key)
+        if cast is not None:
+            value = cast(value)
+            key_bit = _KEY_BITS[key]
+            old = getattr(self, key) if self._present & key_bit else _MISSING
+            setattr(self, key, value)
+            self._present |= key_bit
+            if key == "hold_for_pass":
+                self.bits = self.bits | key_bit if value else self.bits & ~key_bit
+            if old is _MISSING:
+                self._order[key] = None
+                self._touch()
+            elif (not old) != (not value):
+                self._touch()
+            return
+        if self._extra is None:
+            self._extra = {}
+        old = self._extra.get(key, _MISSING)
+        self._extra[key] = value
+        if old is _MISSING:
+            self._order[key] = None
+            self._touch()
+        elif (not old) != (not value):
+            self._touch()
+
+    def __delitem__(self, key):
+        key_bit = _KEY_BITS.get(key)
+        if key_bit is not None:
+            if not self._present & key_bit:
+                raise KeyError(key)
+            self._present &= ~key_bit
+            self.bits &= ~key_bit
+            if key in NUMERIC_FLAGS:
+                setattr(self, key, NUMERIC_FLAGS[key]())
+        elif self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+        del self._order[key]
+        self._touch()
+
+    # pop / update come from MutableMapping and go through __delitem__ /
+    # __setitem__, so they mark the row only on a real change
+
+    def setdefault(self, key, default=None):
+        v = self.get(key, _MISSING)
+        if v is _MISSING:
+            self[key] = default
+            v = self.get(key)      # the stored value (cast), as a dict would return it
+        return v
+
+    def __iter__(self):
+        return iter(list(self._order))
+
+    def __len__(self):
+        return len(self._order)
+
+    def clear(self):
+        if not self._order:
+            return
+        self.bits = self._present = 0
+        self.time_in_ruck = self.jackal_success = 0.0
+        self.counter_cooldown = self.hold_for_pass = 0
+        self._extra = None
+        self._order.clear()
+        self._touch()
+
+    def copy(self) -> dict:
+        return dict(self)
+
+    def load(self, values) -> None:
+        """Replace the whole contents (snapshot restore)."""
+        self.clear()
+        self.update(values)
+
+    def clear_bits(self, mask: int) -> None:
+        """Set every boolean flag in `mask` (see flag_mask) to False in one step."""
+        if self.bits & mask or (self._present & mask) != mask:
+            new = mask & ~self._present
+            if new:
+                order = self._order
+                for key, bit in _BOOL_BITS.items():
+                    if new & bit:
+                        order[key] = None
+            self.bits &= ~mask
+            self._present |= mask
+            self._touch()
+
+    def __repr__(self) -> str:
+        return f"PlayerFlags({dict(self)!r})"
+
+
+def _bool_flag(name: str, bit: int) -> property:
+    def fget(self):
+        return (self.bits & bit) != 0
+
+    def fset(self, value):
+        self[name] = value
+
+    return property(fget, fset, doc=f"state_flags[{name!r}] as an attribute")
+
+
+for _name, _bit in _BOOL_BITS.items():
+    setattr(PlayerFlags, _name, _bool_flag(_name, _bit))
+
+
+class PlayerStateArrays:
+    def __init__(self, players: Sequence):
+        self.players: List = list(players)
+        n = len(self.players)
+        # positions stay float64: planners compare them against exact tuple
+        # coordinates (ball placed on a player, lines through a player's x)
+        self.pos = np.zeros((n, 3), dtype=np.float64)          # x, y, z
+        self.team = np.zeros(n, dtype=np.int8)                 # 0 = 'a', 1 = 'b'
+        self.rn = np.zeros(n, dtype=np.int8)
+        self.flags = np.zeros(n, dtype=np.uint32)
+
+        self.pos_version = 0                                   # bumped whenever pos changes
+        self.flags_version = 0                                 # bumped whenever flags change
+        self._dirty_pos: set = set(range(n))
+        self._dirty_flags: set = set(range(n))
+        self._team_masks = {}
+
+        for row, p in enumerate(self.players):
+            self.team[row] = TEAM_INDEX.get(p.team_code, 0)
+            self.rn[row] = int(p.rn or 0)
+            p._bind(self, row)
+        for code, idx in TEAM_INDEX.items():
+            self._team_masks[code] = self.team == idx
+        self.refresh()
+
+    # -----------------------
+    # sync
+    # -----------------------
+    def refresh(self) -> None:
+        """Pull dirty rows from the Player views into the arrays."""
+        if self._dirty_pos:
+            rows = list(self._dirty_pos)
+            self.pos[rows] = [self.players[r].location for r in rows]
+            self._dirty_pos.clear()
+            self.pos_version += 1
+        self.refresh_flags()
+
+    def refresh_flags(self) -> None:
+        """Pull only the dirty flag rows (for flag-only queries)."""
+        if self._dirty_flags:
+            players = self.players
+            for r in self._dirty_flags:
+                self.flags[r] = players[r].state_flags.bits
+            self._dirty_flags.clear()
+            self.flags_version += 1
+
+    def push_positions(self, rows=None, values=None) -> None:
+        """
+        Write array positions back to the views (after a batched array update).
+        With `values` ((len(rows), 3) array) the rows are set first, in one go.
+        """
+        rows = list(range(len(self.players))) if rows is None else list(rows)
+        if values is None:
+            values = self.pos[rows]
+        else:
+            self.pos[rows] = values
+        players = self.players
+        for r, xyz in zip(rows, values.tolist()):
+            players[r].location = tuple(xyz)
+        self.pos_version += 1
+
+    # -----------------------
+    # masks
+    # -----------------------
+    def team_mask(self, code: Optional[str]) -> np.ndarray:
+        if code is None:
+            return np.ones(len(self.players), dtype=bool)
+        return self._team_masks[code]
+
+    def dist2(self, xy) -> np.ndarray:
+        self.refresh()
+        d = self.pos[:, :2] - np.asarray(xy[:2], dtype=np.float64)
+        return np.einsum("ij,ij->i", d, d)
+
+
+def arrays_of(match) -> Optional[PlayerStateArrays]:
+    """The match's store, or None for test doubles / unbound players."""
+    return getattr(match, "player_arrays", None)
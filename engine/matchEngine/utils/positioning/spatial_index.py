@@ -0,0 +1,149 @@
+# matchEngine/utils/positioning/spatial_index.py
+"""
+Uniform-grid spatial index over the playing area (dead-ball line to dead-ball
+line × touchline to touchline, 5 m buckets by default).
+
+Backed by the match's PlayerStateArrays: `sync()` recomputes every row's cell
+in one vectorised step and only moves the rows whose cell changed, so it is a
+cheap no-op when nobody moved. Queries sync lazily, i.e. at most once per tick
+in practice (decisions run before the movement step).
+
+Positions outside the grid are clamped into the edge buckets; every query
+does an exact distance / coordinate check on the candidates it gathers.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from constants import DEADBALL_LINE_A_X, DEADBALL_LINE_B_X, TOUCHLINE_BOTTOM_Y, TOUCHLINE_TOP_Y
+
+CELL_M = 5.0
+GRID_X0, GRID_X1 = DEADBALL_LINE_A_X, DEADBALL_LINE_B_X
+GRID_Y0, GRID_Y1 = TOUCHLINE_BOTTOM_Y, TOUCHLINE_TOP_Y
+
+
+class SpatialIndex:
+    def __init__(self, store, cell: float = CELL_M):
+        self.store = store
+        self.cell = float(cell)
+        self.nx = int(math.ceil((GRID_X1 - GRID_X0) / self.cell))
+        self.ny = int(math.ceil((GRID_Y1 - GRID_Y0) / self.cell))
+        self.buckets: List[List[int]] = [[] for _ in range(self.nx * self.ny)]
+        self._cell_of = np.full(len(store.players), -1, dtype=np.int64)
+        self._version = None
+        store.spatial_index = self
+        self.sync()
+
+    # -----------------------
+    # maintenance
+    # -----------------------
+    def _cx(self, x: float) -> int:
+        return min(self.nx - 1, max(0, int((x - GRID_X0) // self.cell)))
+
+    def _cy(self, y: float) -> int:
+        return min(self.ny - 1, max(0, int((y - GRID_Y0) // self.cell)))
+
+    def sync(self) -> None:
+        store = self.store
+        store.refresh()
+        if self._version == store.pos_version:
+            return
+        cx = np.clip(((store.pos[:, 0] - GRID_X0) // self.cell).astype(np.int64), 0, self.nx - 1)
+        cy = np.clip(((store.pos[:, 1] - GRID_Y0) // self.cell).astype(np.int64), 0, self.ny - 1)
+        cells = cx * self.ny + cy
+        for row in np.flatnonzero(cells != self._cell_of).tolist():
+            old = int(self._cell_of[row])
+            if old >= 0:
+                self.buckets[old].remove(row)
+            new = int(cells[row])
+            self.buckets[new].append(row)
+            self._cell_of[row] = new
+        self._version = store.pos_version
+
+    def _rows_in_cells(self, cx0: int, cx1: int, cy0: int, cy1: int):
+        b, ny = self.buckets, self.ny
+        for cx in range(cx0, cx1 + 1):
+            base = cx * ny
+            for cy in range(cy0, cy1 + 1):
+                yield from b[base + cy]
+
+    # -----------------------
+    # queries
+    # -----------------------
+    def within(self, xy, r: float, team: Optional[str] = None, exclude=None) -> List:
+        """Players within r metres (XY) of xy, nearest first (ties in roster order)."""
+        self.sync()
+        x, y = float(xy[0]), float(xy[1])
+        r2 = r * r
+        players = self.store.players
+        hits = []
+        for row in self._rows_in_cells(self._cx(x - r), self._cx(x + r), self._cy(y - r), self._cy(y + r)):
+            p = players[row]
+            if (team is not None and p.team_code != team) or p is exclude:
+                continue
+            px, py = p.location[0], p.location[1]
+            d2 = (px - x) * (px - x) + (py - y) * (py - y)
+            if d2 <= r2:
+                hits.append((d2, row))
+        hits.sort()
+        return [players[row] for _, row in hits]
+
+    def nearest(self, xy, team: Optional[str] = None, k: int = 1, exclude=None) -> List[Tuple[object, float]]:
+        """
+        Up to k (player, distance²) pairs nearest to xy, nearest first.
+        Expands square rings of cells until the k-th best is provably final.
+        """
+        self.sync()
+        x, y = float(xy[0]), float(xy[1])
+        players = self.store.players
+        cx, cy = self._cx(x), self._cy(y)
+        best: List[Tuple[float, int]] = []
+        max_ring = max(self.nx, self.ny)
+        for ring in range(max_ring + 1):
+            for row in self._ring_rows(cx, cy, ring):
+                p = players[row]
+                if (team is not None and p.team_code != team) or p is exclude:
+                    continue
+                px, py = p.location[0], p.location[1]
+                best.append(((px - x) * (px - x) + (py - y) * (py - y), row))
+            if len(best) >= k:
+                best.sort()
+                # anything in ring+1 is at least `ring * cell` away from xy
+                reach = ring * self.cell
+                if best[k - 1][0] <= reach * reach:
+                    break
+        best.sort()
+        return [(players[row], d2) for d2, row in best[:k]]
+
+    def _ring_rows(self, cx: int, cy: int, ring: int):
+        if ring == 0:
+            yield from self.buckets[cx * self.ny + cy]
+            return
+        x0, x1, y0, y1 = cx - ring, cx + ring, cy - ring, cy + ring
+        for gx in range(max(x0, 0), min(x1, self.nx - 1) + 1):
+            edge = gx in (x0, x1)
+            for gy in range(max(y0, 0), min(y1, self.ny - 1) + 1):
+                if edge or gy in (y0, y1):
+                    yield from self.buckets[gx * self.ny + gy]
+
+    def count_in_band(self, x0: float, x1: float, team: Optional[str] = None) -> int:
+        """Players (of `team`) with x0 <= x <= x1."""
+        self.sync()
+        if x0 > x1:
+            x0, x1 = x1, x0
+        players = self.store.players
+        n = 0
+        for row in self._rows_in_cells(self._cx(x0), self._cx(x1), 0, self.ny - 1):
+            p = players[row]
+            if team is not None and p.team_code != team:
+                continue
+            if x0 <= p.location[0] <= x1:
+                n += 1
+        return n
+
+
+def index_of(match) -> Optional[SpatialIndex]:
+    """The match's grid index, or None for test doubles."""
+    return getattr(match, "spatial_index", None)
@@ -16,7 +16,9 @@ scale_factor_lookup = {
     12: 0.0007660485615191882
 }
  
-def balanced_score(attacker_norm, defender_norm, scale):
+def balanced_score(attacker_norm, defender_norm, scale, rng=None):
+    """rng: zero-arg callable in [0, 1), e.g. stream(match, "tackle", code); defaults to random.random."""
+    rnd = rng or random.random
     scale_factor = scale_factor_lookup[scale+1]
 
 
@@ -26,8 +28,8 @@ def balanced_score(attacker_norm, defender_norm, scale):
     att_pow = attacker_norm 
     def_pow = defender_norm 
     # Generate samples skewed toward 1 to approximate a normal distribution
-    att_rand = random.random() ** 0.5
-    def_rand = random.random() ** 0.5
+    att_rand = rnd() ** 0.5
+    def_rand = rnd() ** 0.5
     atk = (att_pow* att_rand) /scale_factor
     dfd = (def_pow * def_rand)/scale_factor
     
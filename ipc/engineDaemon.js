@@ -0,0 +1,58 @@
+// ipc/engineDaemon.js
+// Client for the resident match engine (engine/matchEngine/daemon.py).
+// One python process for the whole session: request(cmd, args) resolves with the
+// reply's result (rejects on {ok: false}); frames go to onTick, events to onEvent.
+
+const path = require("path");
+const { spawn } = require("child_process");
+const { createTickDecoder } = require("./tickStream");
+
+const MSG_REQUEST = 16;
+const MSG_REPLY = 17;
+const MSG_EVENT = 18;
+
+function startEngineDaemon({ onTick, onEvent = () => {}, db = "tmp/temp.db" } = {}) {
+  const daemonPath = path.join(__dirname, "../engine/matchEngine/daemon.py");
+  const python = spawn("python3", [daemonPath, "--db", db]);
+  const pending = new Map();
+  let nextId = 1;
+
+  const push = createTickDecoder(onTick, (type, payload) => {
+    const msg = JSON.parse(payload.toString("utf8"));
+    if (type === MSG_EVENT) {
+      onEvent(msg);
+      return;
+    }
+    if (type !== MSG_REPLY) return;
+    const waiter = pending.get(msg.id);
+    if (!waiter) return;
+    pending.delete(msg.id);
+    if (msg.ok) waiter.resolve(msg.result);
+    else waiter.reject(new Error(msg.error));
+  });
+  python.stdout.on("data", push);
+  python.stderr.on("data", (data) => {
+    console.error("[Engine]", data.toString());
+  });
+  python.on("close", (code) => {
+    console.log(`Engine daemon exited with code ${code}`);
+    for (const waiter of pending.values()) waiter.reject(new Error("engine daemon exited"));
+    pending.clear();
+  });
+
+  function request(cmd, args = {}) {
+    const id = nextId++;
+    const body = Buffer.from(JSON.stringify({ id, cmd, args }), "utf8");
+    const head = Buffer.alloc(5);
+    head.writeUInt8(MSG_REQUEST, 0);
+    head.writeUInt32LE(body.length, 1);
+    return new Promise((resolve, reject) => {
+      pending.set(id, { resolve, reject });
+      python.stdin.write(Buffer.concat([head, body]));
+    });
+  }
+
+  return { request, process: python };
+}
+
+module.exports = { startEngineDaemon };
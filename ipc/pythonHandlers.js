@@ -1,27 +1,53 @@
 const path = require("path");
 const { spawn } = require("child_process");
+const { createTickDecoder } = require("./tickStream");
+const { startEngineDaemon } = require("./engineDaemon");
+
+// opt-in binary tick stream (see engine/matchEngine/utils/core/tick_stream.py)
+const BINARY_TICKS = process.env.DOR_BINARY_TICKS === "1";
 
 module.exports = function setupPythonHandlers(ipcMain, win) {
+  // Resident engine (engine/matchEngine/daemon.py), started on first use:
+  // engine-command("load_match", {team_a, team_b}), ("run"), ("pause"), ("set_speed", {speed}), ...
+  let daemon = null;
+  ipcMain.handle("engine-command", async (_event, cmd, args) => {
+    if (!daemon) {
+      daemon = startEngineDaemon({
+        onTick: (tick) => win.webContents.send("match-tick", tick),
+        onEvent: (event) => win.webContents.send("match-event", event),
+      });
+      daemon.process.on("close", () => {
+        daemon = null;
+      });
+    }
+    return daemon.request(cmd, args || {});
+  });
+
   // Match engine live runner — sends ticks to frontend
   ipcMain.handle("run-python", async () => {
     return new Promise((resolve, reject) => {
       const matchPath = path.join(__dirname, "../engine/matchEngine/match.py");
-      const python = spawn("python3", [matchPath]);
+      const python = spawn("python3", BINARY_TICKS ? [matchPath, "--binary"] : [matchPath]);
 
       let output = "";
 
-      python.stdout.on("data", (data) => {
-        const lines = data.toString().split("\n").filter(Boolean);
-        lines.forEach((line) => {
-          try {
-            const parsed = JSON.parse(line);
-            win.webContents.send("match-tick", parsed); // 👈 sends each tick to frontend
-          } catch (err) {
-            console.warn("Non-JSON line from Python:", line);
-          }
-          output += line + "\n";
+      if (BINARY_TICKS) {
+        const push = createTickDecoder((tick) => win.webContents.send("match-tick", tick));
+        python.stdout.on("data", push);
+      } else {
+        python.stdout.on("data", (data) => {
+          const lines = data.toString().split("\n").filter(Boolean);
+          lines.forEach((line) => {
+            try {
+              const parsed = JSON.parse(line);
+              win.webContents.send("match-tick", parsed); // 👈 sends each tick to frontend
+            } catch (err) {
+              console.warn("Non-JSON line from Python:", line);
+            }
+            output += line + "\n";
+          });
         });
-      });
+      }
 
       python.stderr.on("data", (data) => {
         console.error("[Python error]", data.toString());
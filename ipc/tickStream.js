@@ -0,0 +1,145 @@
+// ipc/tickStream.js
+// Decoder for the binary tick stream written by engine/matchEngine/utils/core/tick_stream.py.
+// Feed it stdout chunks; it calls onTick(tick) with the same shape dump_tick_json sends.
+// Other message types (e.g. the engine daemon's replies) go to onOther(type, payload).
+
+const MSG_ROSTER = 1;
+const MSG_STRING = 2;
+const MSG_KEYFRAME = 3;
+const MSG_DELTA = 4;
+
+const F_POS = 1;
+const F_ORIENT = 2;
+const F_ACTION = 4;
+const ORIENT_NONE = -32768;
+const LINE_NONE = -32768;
+
+const HEAD_SIZE = 5; // u8 type, u32 length
+const COMMON_SIZE = 29; // <IfHHHhhhBHHhh
+const PLAYER_SIZE = 8; // <hhhH
+
+function createTickDecoder(onTick, onOther = null) {
+  let pending = Buffer.alloc(0);
+  let roster = [];
+  let posScale = 100;
+  let orientScale = 10;
+  const strings = new Map([[0, null]]);
+  let keyRows = null;
+
+  function readCommon(buf) {
+    return {
+      tick: buf.readUInt32LE(0),
+      time: buf.readFloatLE(4),
+      scoreA: buf.readUInt16LE(8),
+      scoreB: buf.readUInt16LE(10),
+      stateId: buf.readUInt16LE(12),
+      ball: [buf.readInt16LE(14), buf.readInt16LE(16), buf.readInt16LE(18)],
+      holder: buf.readUInt8(20),
+      offside: [buf.readUInt16LE(21), buf.readUInt16LE(23), buf.readInt16LE(25), buf.readInt16LE(27)],
+    };
+  }
+
+  function emit(common, rows) {
+    const h = common.holder ? roster[common.holder - 1] : null;
+    const [oPhase, oLaw, oA, oB] = common.offside;
+    const tick = {
+      tick: common.tick,
+      time: common.time,
+      score: { a: common.scoreA, b: common.scoreB },
+      ball: {
+        location: common.ball.map((v) => v / posScale),
+        holder: h ? `${h.sn}${h.team_code}` : null,
+      },
+      players: roster.map((info, i) => {
+        const [x, y, o, a] = rows[i];
+        return {
+          ...info,
+          action: strings.get(a) ?? null,
+          location: [x / posScale, y / posScale, 0],
+          orientation: o === ORIENT_NONE ? null : o / orientScale,
+        };
+      }),
+      state: strings.get(common.stateId) ?? null,
+    };
+    if (oPhase) {
+      tick.offside = {
+        phase: strings.get(oPhase) ?? null,
+        law: strings.get(oLaw) ?? null,
+        a: oA === LINE_NONE ? null : oA / posScale,
+        b: oB === LINE_NONE ? null : oB / posScale,
+      };
+    }
+    onTick(tick);
+  }
+
+  function handle(type, payload) {
+    if (type === MSG_ROSTER) {
+      const header = JSON.parse(payload.toString("utf8"));
+      roster = header.players;
+      posScale = header.pos_scale;
+      orientScale = header.orient_scale;
+      return;
+    }
+    if (type === MSG_STRING) {
+      strings.set(payload.readUInt16LE(0), payload.subarray(2).toString("utf8"));
+      return;
+    }
+    if (type !== MSG_KEYFRAME && type !== MSG_DELTA) {
+      if (onOther) onOther(type, payload);
+      return;
+    }
+
+    const common = readCommon(payload);
+    let off = COMMON_SIZE;
+    let rows;
+    if (type === MSG_KEYFRAME) {
+      keyRows = roster.map((_, i) => {
+        const o = off + i * PLAYER_SIZE;
+        return [payload.readInt16LE(o), payload.readInt16LE(o + 2), payload.readInt16LE(o + 4), payload.readUInt16LE(o + 6)];
+      });
+      rows = keyRows;
+    } else if (type === MSG_DELTA && keyRows) {
+      const mask = payload.readUInt32LE(off);
+      off += 4;
+      rows = keyRows.slice();
+      for (let i = 0; i < roster.length; i++) {
+        if (!(mask & (1 << i))) continue;
+        let [x, y, o, a] = rows[i];
+        const fm = payload.readUInt8(off);
+        off += 1;
+        if (fm & F_POS) {
+          x = payload.readInt16LE(off);
+          y = payload.readInt16LE(off + 2);
+          off += 4;
+        }
+        if (fm & F_ORIENT) {
+          o = payload.readInt16LE(off);
+          off += 2;
+        }
+        if (fm & F_ACTION) {
+          a = payload.readUInt16LE(off);
+          off += 2;
+        }
+        rows[i] = [x, y, o, a];
+      }
+    } else {
+      return;
+    }
+    emit(common, rows);
+  }
+
+  return function push(chunk) {
+    pending = pending.length ? Buffer.concat([pending, chunk]) : chunk;
+    let off = 0;
+    while (pending.length - off >= HEAD_SIZE) {
+      const type = pending.readUInt8(off);
+      const len = pending.readUInt32LE(off + 1);
+      if (pending.length - off - HEAD_SIZE < len) break;
+      handle(type, pending.subarray(off + HEAD_SIZE, off + HEAD_SIZE + len));
+      off += HEAD_SIZE + len;
+    }
+    pending = pending.subarray(off);
+  };
+}
+
+module.exports = { createTickDecoder };
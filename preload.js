@@ -19,4 +19,6 @@ saveSelection: (selection) => ipcRenderer.invoke("save-selection", selection),
 getFullSquad: () => ipcRenderer.invoke("get-full-squad"),
 getPlayerById: (id) => ipcRenderer.invoke("get-player-by-id", id),
 onMatchTick: (callback) => ipcRenderer.on("match-tick", (_event, data) => callback(data)),
+engineCommand: (cmd, args) => ipcRenderer.invoke("engine-command", cmd, args),
+onMatchEvent: (callback) => ipcRenderer.on("match-event", (_event, data) => callback(data)),
 });
\ No newline at end of file
@@ -0,0 +1,89 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from ball import Ball, TICK_S
+
+KICKS = 200
+MAX_TICKS = 400
+
+
+class DummyMatch:
+    """All Ball.update reads from an unheld ball's match."""
+    tick_rate = TICK_S
+    current_state = None
+
+
+def random_ball(rng):
+    ball = Ball((rng.uniform(0.0, 100.0), rng.uniform(0.0, 70.0), rng.uniform(0.0, 1.5)))
+    target = (rng.uniform(-10.0, 110.0), rng.uniform(-5.0, 75.0), 0.0)
+    kind = rng.random()
+    if kind < 0.6:
+        ball.start_parabola_to(target, T=rng.uniform(0.4, 4.0), H=rng.uniform(0.0, 25.0),
+                               gamma=rng.uniform(0.6, 1.6))
+    elif kind < 0.8:
+        ball.start_linear_to((target[0], target[1], rng.uniform(0.0, 2.0)), speed=rng.uniform(4.0, 25.0))
+    else:
+        ball.start_skid(rng.uniform(-15.0, 15.0), rng.uniform(-15.0, 15.0))
+    return ball
+
+
+def stepped(ball):
+    """Locations after each update() until the ball stops."""
+    match = DummyMatch()
+    out = []
+    while ball.transit and len(out) < MAX_TICKS:
+        ball.update(match)
+        out.append(ball.location)
+    return out
+
+
+def close(a, b):
+    return a == pytest.approx(b, abs=1e-6)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_location_at_follows_update(seed):
+    rng = random.Random(seed)
+    for _ in range(KICKS // 4):
+        ball = random_ball(rng)
+        predicted = [ball.location_at(n * TICK_S) for n in range(1, MAX_TICKS + 1)]
+        path = stepped(ball)
+        assert ball.transit is None
+        for n, loc in enumerate(path):
+            assert close(predicted[n], loc), (n, ball)
+        # once stopped the prediction stays put
+        assert close(predicted[-1], path[-1])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_rest_point_is_where_update_stops(seed):
+    rng = random.Random(100 + seed)
+    for _ in range(KICKS // 4):
+        ball = random_ball(rng)
+        rest = ball.rest_point()
+        path = stepped(ball)
+        assert close(rest, path[-1])
+
+
+def test_predictions_hold_mid_flight():
+    rng = random.Random(7)
+    match = DummyMatch()
+    for _ in range(50):
+        ball = random_ball(rng)
+        for _ in range(rng.randrange(1, 30)):
+            ball.update(match)
+        if not ball.transit:
+            continue
+        rest = ball.rest_point()
+        ahead = [ball.location_at(n * TICK_S) for n in (1, 5, 20)]
+        path = stepped(ball)
+        for n, loc in zip((1, 5, 20), ahead):
+            assert close(loc, path[min(n, len(path)) - 1])
+        assert close(rest, path[-1])
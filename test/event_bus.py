@@ -0,0 +1,105 @@
+import sys
+from pathlib import Path
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+import event
+from event import DEFAULT_PRIORITY, EventBus, priority_of
+
+
+class DummyMatch:
+    pass
+
+
+# --- priorities ----------------------------------------------------------
+
+def test_priority_of_families():
+    assert priority_of("try") == 0
+    assert priority_of("penalty_try_given") == 0
+    assert priority_of("penalty.offside") == 1
+    assert priority_of("penalty_given") == 1
+    assert priority_of("scrum.knock_on") == 2
+    assert priority_of("lineout.touch") == 3
+    assert priority_of("restart.goal_line_drop") == DEFAULT_PRIORITY
+
+
+# --- push / peek / drain -------------------------------------------------
+
+def test_push_keeps_every_event():
+    bus = EventBus()
+    bus.push("scrum.knock_on", (10, 20), "a")
+    bus.push("scrum.forward_pass", (30, 20), "b")
+    assert len(bus) == 2
+
+
+def test_drain_orders_by_priority_then_push_order():
+    bus = EventBus()
+    bus.push("lineout.touch", (0, 0), "a")
+    bus.push("scrum.knock_on", (1, 0), "b")
+    bus.push("penalty.offside", (2, 0), "a")
+    bus.push("scrum.forward_pass", (3, 0), "a")
+    bus.push("try", (4, 0), "b")
+    out = bus.drain()
+    assert [e.type for e in out] == [
+        "try", "penalty.offside", "scrum.knock_on", "scrum.forward_pass", "lineout.touch",
+    ]
+    assert len(bus) == 0
+    assert bus.last_drained == out
+    assert bus.drain() == []
+
+
+def test_explicit_priority_overrides_family():
+    bus = EventBus()
+    bus.push("penalty.offside", (0, 0), "a")
+    bus.push("restart.kickoff", (50, 35), "b", priority=0)
+    assert bus.peek().type == "restart.kickoff"
+
+
+def test_peek_does_not_remove():
+    bus = EventBus()
+    assert bus.peek() is None
+    bus.push("scrum.knock_on", (1, 0), "b")
+    bus.push("penalty.offside", (2, 0), "a")
+    assert bus.peek().type == "penalty.offside"
+    assert bus.peek().type == "penalty.offside"
+    assert len(bus) == 2
+    assert [e.type for e in bus] == ["penalty.offside", "scrum.knock_on"]
+
+
+def test_seq_keeps_growing_across_drains():
+    bus = EventBus()
+    first = bus.push("scrum", (0, 0), "a")
+    bus.drain()
+    second = bus.push("scrum", (0, 0), "a")
+    assert second.seq > first.seq
+
+
+def test_clear_drops_pending_only():
+    bus = EventBus()
+    bus.push("try", (0, 0), "a")
+    drained = bus.drain()
+    bus.push("scrum", (0, 0), "a")
+    bus.clear()
+    assert len(bus) == 0 and bus.peek() is None
+    assert bus.last_drained == drained
+
+
+def test_status_tuple():
+    evt = EventBus().push("lineout.touch", (5, 0, 0), "b")
+    assert evt.status == ("lineout.touch", (5, 0, 0), "b")
+
+
+# --- match helpers -------------------------------------------------------
+
+def test_helpers_attach_a_bus_to_test_doubles():
+    m = DummyMatch()
+    event.push(m, "scrum", (0, 0), "a")
+    event.push(m, "penalty", (0, 0), "b")
+    assert isinstance(m.events, EventBus)
+    assert event.peek(m).type == "penalty"
+    assert [e.type for e in event.drain(m)] == ["penalty", "scrum"]
+    event.push(m, "scrum", (0, 0), "a")
+    event.clear(m)
+    assert len(m.events) == 0
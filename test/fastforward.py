@@ -0,0 +1,70 @@
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from constants import CONVERSION_WINDOW_S
+from match import Match
+from states.scoring import try_now
+from utils.core.fastforward import FastForward
+
+DB = str(ROOT / "database" / "GameData.db")
+
+
+def late_try(seed=7, left=120.0):
+    """A try by 11a with `left` seconds of the match to go."""
+    match = Match(DB, 2, 1, seed=seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        match._advance_clock()
+        match.state.tick()
+        match.period.update(half=2, time=match.half_limit() - left)
+        match.ball.holder = "11a"
+        try_now(match, "a")
+    return match
+
+
+def test_results_match_without_fast_forward():
+    for seed in (7, 8):
+        skipped = late_try(seed)
+        result = skipped.run_headless(fast_forward=True)
+        assert skipped.ticks_skipped > 0
+        played = late_try(seed)
+        assert played.run_headless(fast_forward=False) == result
+        assert played.ticks_skipped == 0
+
+
+def test_conversion_wait_is_skipped():
+    match = late_try()
+    result = match.run_headless()
+    conversions = [t for t, _, kind, _ in result["timeline"] if kind == "nudge.conversion"]
+    kicks = [t for t, _, kind, _ in result["timeline"] if kind == "nudge.after_conversion"]
+    assert kicks[0] - conversions[0] >= CONVERSION_WINDOW_S
+    # all but the few ticks it takes to see that nothing moves
+    assert match.ticks_skipped >= (CONVERSION_WINDOW_S / match.tick_rate) - 5
+
+
+def test_try_at_the_end_of_the_half_is_converted_at_once():
+    match = late_try(left=CONVERSION_WINDOW_S / 2)
+    result = match.run_headless()
+    kinds = [kind for _, _, kind, _ in result["timeline"]]
+    assert "nudge.after_conversion" in kinds
+    assert match.ticks_skipped == 0
+
+
+def test_jump_stops_the_tick_before_the_wake_up():
+    match = Match(DB, 2, 1, seed=7)
+    ff = FastForward()
+    assert ff.jump(match, (None, lambda m: m.tick_count >= 50)) == 49
+    assert match.tick_count == 49
+
+    at = match.match_time + 1.0
+    n = ff.jump(match, (at, None))
+    assert match.match_time < at <= match.match_time + match.tick_rate
+    assert n == match.tick_count - 49 and match.ticks_skipped == 49 + n
+
+    ff.jump(match, (None, None))
+    assert match.period["time"] < match.half_limit() <= match.period["time"] + match.tick_rate
@@ -0,0 +1,84 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from shapes.library import formation, place
+from shapes.lineout.five_man import generate_five_man_lineout_shape
+from shapes.lineout.five_man_backline import generate_phase_play_shape as lineout_backline
+from shapes.scrum.default import generate_phase_play_shape as scrum_backline
+from shapes.scrum.scrum import generate_scrum_shape
+
+DB = str(ROOT / "database" / "GameData.db")
+MARKS = 40
+
+
+@pytest.fixture(scope="module")
+def match():
+    return Match(DB, 2, 1, seed=2)
+
+
+def apply_loop(match, team, sub_layout, bx, by, mirror_y=False):
+    """The per-player loop set_pieces used before shapes/library (kept as the reference)."""
+    for rn, (lx, ly) in sub_layout.items():
+        try:
+            jersey = int(rn)
+        except (TypeError, ValueError):
+            continue
+        p = team.get_player_by_rn(jersey)
+        if not p:
+            continue
+        wx = bx + lx
+        wy = by - ly if mirror_y else by + ly
+        p.update_location(match.pitch.clamp_position((wx, wy, 0.0)))
+
+
+def locations(match):
+    return [p.location for p in match.players]
+
+
+def marks(seed):
+    rng = random.Random(seed)
+    # includes marks near the dead-ball lines and touchlines, so clamping shows
+    return [(rng.uniform(-10.0, 110.0), rng.uniform(0.0, 70.0)) for _ in range(MARKS)]
+
+
+@pytest.mark.parametrize("attack_dir", [1.0, -1.0])
+def test_scrum_place_matches_the_loop(match, attack_dir):
+    layout = generate_scrum_shape(attack_dir=attack_dir, backline_positions=scrum_backline("default", attack_dir))
+    shape = formation("scrum.default", attack_dir)
+    teams = (match.team_a, match.team_b)
+    for bx, by in marks(int(attack_dir)):
+        apply_loop(match, teams[0], layout["team_a"], bx, by)
+        apply_loop(match, teams[1], layout["team_b"], bx, by)
+        expected = locations(match)
+        for p in match.players:
+            p.update_location((50.0, 35.0, 0.0))
+        place(match, shape, (bx, by), teams)
+        assert locations(match) == expected
+
+
+@pytest.mark.parametrize("touch_is_bottom", [True, False])
+@pytest.mark.parametrize("attack_dir", [1.0, -1.0])
+def test_lineout_place_matches_the_loop(match, attack_dir, touch_is_bottom):
+    layout = generate_five_man_lineout_shape(touch_is_bottom=touch_is_bottom, attack_dir=attack_dir,
+                                             backline_positions=lineout_backline("default", attack_dir))
+    shape = formation("lineout.five_man", attack_dir)
+    teams = (match.team_b, match.team_a)
+    by = 0.0 if touch_is_bottom else 70.0        # the mark is on the touchline
+    for bx, _y in marks(int(attack_dir) * 2 + touch_is_bottom):
+        apply_loop(match, teams[0], layout["team_a"], bx, by, mirror_y=not touch_is_bottom)
+        apply_loop(match, teams[1], layout["team_b"], bx, by, mirror_y=not touch_is_bottom)
+        expected = locations(match)
+        for p in match.players:
+            p.update_location((50.0, 35.0, 0.0))
+        place(match, shape, (bx, by), teams, mirror_y=not touch_is_bottom)
+        assert locations(match) == expected
+    match.player_arrays.refresh()
+    assert [tuple(r) for r in match.player_arrays.pos.tolist()] == locations(match)
@@ -0,0 +1,87 @@
+import contextlib
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from utils.core.frames import FrameClock
+from utils.core.tick_stream import read_ticks
+
+DB = str(ROOT / "database" / "GameData.db")
+TICKS = 40                 # two match seconds at 20 Hz
+SECONDS = 2
+
+
+def json_frames(fps, interpolate):
+    match = Match(DB, 2, 1, seed=4)
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        match.run(ticks=TICKS, realtime=False, fps=fps, interpolate=interpolate)
+    frames = []
+    for line in out.getvalue().splitlines():
+        if line.startswith("{"):
+            blob = json.loads(line)
+            if "tick" in blob:
+                frames.append(blob)
+    return frames
+
+
+def binary_ticks(monkeypatch, fps, interpolate):
+    match = Match(DB, 2, 1, seed=4)
+    stdout = io.TextIOWrapper(io.BytesIO())
+    monkeypatch.setattr(sys, "stdout", stdout)
+    with contextlib.redirect_stderr(io.StringIO()):
+        match.run(ticks=TICKS, realtime=False, stream="binary", fps=fps, interpolate=interpolate)
+    return [t["tick"] for t in read_ticks(io.BytesIO(stdout.buffer.getvalue()))]
+
+
+@pytest.mark.parametrize("interpolate", [False, True])
+@pytest.mark.parametrize("fps", [10, 20, 60])
+def test_json_frame_rate(fps, interpolate):
+    frames = json_frames(fps, interpolate)
+    assert len(frames) == fps * SECONDS
+    ticks = [f["tick"] for f in frames]
+    assert ticks == sorted(ticks) and ticks[-1] == TICKS
+    between = [f for f in frames if "alpha" in f]
+    if interpolate and fps > 20:
+        assert len(between) == len(frames) * 2 // 3
+        assert all(0.0 < f["alpha"] < 1.0 for f in between)
+    else:
+        assert between == []
+    if fps > 20 and not interpolate:
+        # without interpolation the extra frames show the tick as it is
+        for a, b in zip(frames, frames[1:]):
+            if a["tick"] == b["tick"]:
+                assert a["players"] == b["players"] and a["ball"] == b["ball"]
+
+
+def test_interpolated_frames_lie_between_ticks():
+    frames = json_frames(60, True)
+    for prev, tween, cur in zip(frames[2::3], frames[3::3], frames[5::3]):
+        assert prev["tick"] + 1 == tween["tick"] == cur["tick"]
+        a = tween["alpha"]
+        for p0, pt, p1 in zip(prev["players"], tween["players"], cur["players"]):
+            for c0, ct, c1 in zip(p0["location"][:2], pt["location"][:2], p1["location"][:2]):
+                assert ct == pytest.approx(c0 + (c1 - c0) * a, abs=1e-4)   # alpha is rounded
+
+
+@pytest.mark.parametrize("interpolate", [False, True])
+@pytest.mark.parametrize("fps", [10, 20, 60])
+def test_binary_stream_never_repeats_a_tick(monkeypatch, fps, interpolate):
+    ticks = binary_ticks(monkeypatch, fps, interpolate)
+    assert len(ticks) == min(fps, 20) * SECONDS
+    assert ticks == sorted(set(ticks)) and ticks[-1] == TICKS
+
+
+def test_decimate_only_clock_caps_fps():
+    match = Match(DB, 2, 1, seed=4)
+    assert FrameClock(match, fps=60, upsample=False).fps == 20
+    assert FrameClock(match, fps=10, upsample=False).fps == 10
+    assert FrameClock(match, fps=60).fps == 60
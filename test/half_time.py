@@ -0,0 +1,66 @@
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+
+DB = str(ROOT / "database" / "GameData.db")
+
+
+def tick(match, n=1):
+    tags = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(n):
+            match._advance_clock()
+            match.state.tick()
+            tags.append(match.state.controller.status[0])
+    return tags
+
+
+def to_half_time(match):
+    """Run the clock up to the end of the first half; the next tick starts the second."""
+    match.period["time"] = match.half_limit() - match.tick_rate / 2
+
+
+def test_second_half_leaves_the_kick_off():
+    match = Match(DB, 2, 1, seed=7)
+    tick(match)
+    dirs = (match.team_a.tactics["attack_dir"], match.team_b.tactics["attack_dir"])
+    to_half_time(match)
+    tags = tick(match, 40)
+    assert match.period["half"] == 2
+    assert (match.team_a.tactics["attack_dir"], match.team_b.tactics["attack_dir"]) == (-dirs[0], -dirs[1])
+    assert tags[0] == "restart.kick_off"
+    assert not any(t == "restart.kick_off" for t in tags[5:])
+
+
+def test_half_ending_on_a_kick_off():
+    # the first half ends straight after a kick-off by the side that also kicks
+    # off the second half, so both kick-offs leave the same ball status
+    match = Match(DB, 2, 1, seed=7)
+    tick(match)
+    second_to = "b" if match.first_kickoff_to == "a" else "a"
+    match.state.controller.status = ("restart.kick_off", (50.0, 35.0, 0.0), second_to)
+    tick(match)
+    to_half_time(match)
+    tags = tick(match, 40)
+    assert match.period["half"] == 2
+    assert not any(t == "restart.kick_off" for t in tags[5:])
+
+
+def test_half_time_resets_the_ball():
+    match = Match(DB, 2, 1, seed=7)
+    tick(match, 30)
+    to_half_time(match)
+    with contextlib.redirect_stdout(io.StringIO()):
+        match._advance_clock()
+    ball = match.ball
+    assert match.state.controller.status[0] == "restart.kick_off"
+    assert ball.location == (50.0, 35.0, 0.0)
+    assert ball.holder is None and ball.transit is None
+    assert ball.status is None and ball.last_status is None
@@ -0,0 +1,102 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from constants import TOUCHLINE_BOTTOM_Y, TOUCHLINE_TOP_Y
+from match import Match
+from actions import movement
+from actions.movement import BATCH_MIN_MOVERS, do_action, do_actions_batch
+
+DB = str(ROOT / "database" / "GameData.db")
+STEPS = 12
+
+
+def pair(seed=6):
+    """Two identical fresh matches: one moved in batch, one per player."""
+    return Match(DB, 2, 1, seed=seed), Match(DB, 2, 1, seed=seed)
+
+
+def state(match):
+    return [(p.location, p.orientation_deg, p.current_speed, p.current_action, p.target)
+            for p in match.players]
+
+
+def targets(match, rng, n=None):
+    """A target per player, mixing the cases the integrator branches on."""
+    out = []
+    for i, p in enumerate(match.players[:n]):
+        x, y, z = p.location
+        kind = i % 6 if rng.random() < 0.8 else rng.randrange(6)
+        if kind == 0:                      # off the pitch → clamped
+            t = (x, -30.0 if y < 35.0 else 100.0, 0.0)
+        elif kind == 1:                    # inside the arrive radius / one step
+            t = (x + rng.uniform(-0.3, 0.3), y + rng.uniform(-0.3, 0.3), z)
+        elif kind == 2:                    # behind the player → turn-rate limit
+            t = (x - 15.0, y + rng.uniform(-2.0, 2.0), 0.0)
+        elif kind == 3:                    # already there → idle
+            t = (x, y, z)
+        elif kind == 4:                    # keep the last target
+            t = None
+        else:
+            t = (rng.uniform(0.0, 100.0), rng.uniform(0.0, 70.0), 0.0)
+        out.append((p, t))
+    return out
+
+
+def step_both(batched, single, rng, n=None):
+    moves = targets(batched, rng, n)
+    by_code = {f"{p.sn}{p.team_code}": t for p, t in moves}
+    do_actions_batch(batched, moves)
+    for p in single.players[:n]:
+        do_action(single, f"{p.sn}{p.team_code}", None, p.location, by_code[f"{p.sn}{p.team_code}"])
+
+
+def test_batch_matches_per_player_moves():
+    batched, single = pair()
+    rng = random.Random(11)
+    for _ in range(STEPS):
+        step_both(batched, single, rng)
+        assert state(batched) == state(single)
+    batched.player_arrays.refresh()
+    assert [tuple(r) for r in batched.player_arrays.pos.tolist()] == [p.location for p in batched.players]
+
+
+def test_batch_covers_every_branch():
+    batched, single = pair()
+    for match in (batched, single):
+        for p in match.players[::6]:       # start the off-pitch runners by the touchline
+            x, y, z = p.location
+            p.update_location((x, TOUCHLINE_BOTTOM_Y + 0.5 if y < 35.0 else TOUCHLINE_TOP_Y - 0.5, z))
+    rng = random.Random(11)
+    actions = set()
+    clamped = arrived = turned = False
+    for _ in range(STEPS):
+        before = {id(p): (p.location, p.orientation_deg) for p in batched.players}
+        step_both(batched, single, rng)
+        pitch = batched.pitch
+        actions |= {p.current_action for p in batched.players}
+        clamped |= any(p.location == pitch.clamp_position(p.target) != p.target
+                       for p in batched.players if p.target)
+        arrived |= any(p.location == p.target != before[id(p)][0] for p in batched.players)
+        turned |= any(before[id(p)][1] is not None and p.current_action == "idle"
+                      and p.orientation_deg != before[id(p)][1] for p in batched.players)
+    assert {"run", "idle"} <= actions
+    assert clamped and arrived and turned
+
+
+@pytest.mark.parametrize("n", [1, BATCH_MIN_MOVERS - 1])
+def test_few_movers_take_the_per_player_path(monkeypatch, n):
+    batched, single = pair()
+    calls = []
+    monkeypatch.setattr(movement, "do_action", lambda *a: calls.append(a[1]) or do_action(*a))
+    rng = random.Random(3)
+    for _ in range(4):
+        step_both(batched, single, rng, n)
+        assert state(batched) == state(single)
+    assert len(calls) == 4 * n
@@ -0,0 +1,70 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from states import offside
+
+DB = str(ROOT / "database" / "GameData.db")
+STATES = 60
+TAGS = ["ruck.over", "maul.forming", "scrum.stable", "lineout.start", "restart.kick_off",
+        "open_play.phase_play", "open_play.kick_chase"]
+
+
+@pytest.fixture(scope="module")
+def match():
+    return Match(DB, 2, 1, seed=9)
+
+
+def shuffle(match, rng):
+    """A random picture: positions, directions, lineout / contact players and the last kick."""
+    dirs = rng.choice((1, -1))
+    match.team_a.tactics["attack_dir"], match.team_b.tactics["attack_dir"] = dirs, -dirs
+    for p in match.players:
+        p.update_location((rng.uniform(-15.0, 115.0), rng.uniform(0.0, 70.0), 0.0))
+        p.flags["offside"] = rng.random() < 0.3
+        p.flags["in_lineout"] = rng.random() < 0.2
+
+    # contact players for the breakdown; sometimes one side (or both) has nobody bound
+    bound = [p for p in match.players if rng.random() < 0.15]
+    match.get_current_contact_players = lambda: bound
+
+    ball = match.ball
+    ball.status = ball.last_status = None
+    if rng.random() < 0.7:
+        kicker = rng.choice(match.players)
+        action = rng.choice(("kicked", "kick", "passed", "caught"))
+        last = {"action": action, "holder": f"{kicker.sn}{kicker.team_code}", "location": kicker.location}
+        if rng.random() < 0.2:             # Ball has no touched_by_opposition slot
+            last["touched_by_opposition"] = True
+        ball.last_status = last
+        ball.status = {"action": rng.choice((None, "kicked", "caught")), "holder": None,
+                       "location": ball.location}
+    return (rng.uniform(0.0, 100.0), rng.uniform(0.0, 70.0), 0.0)
+
+
+@pytest.mark.parametrize("tag", TAGS)
+def test_evaluate_matches_the_per_player_laws(match, tag):
+    rng = random.Random(tag)
+    phase = offside._phase(tag)
+    for _ in range(STATES):
+        loc = shuffle(match, rng)
+        _lines, mask = offside.evaluate(match, tag, loc)
+        offside._update_flags_scan(match, phase, loc)
+        assert [bool(v) for v in mask] == [bool(p.flags["offside"]) for p in match.players]
+
+
+def test_every_law_comes_up(match):
+    laws = set()
+    for tag in TAGS:
+        rng = random.Random(tag)
+        for _ in range(STATES):
+            loc = shuffle(match, rng)
+            laws.add(offside.evaluate(match, tag, loc)[0]["law"])
+    assert laws == {"breakdown", "scrum", "lineout", "kick", None}
@@ -0,0 +1,137 @@
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from utils.player.state_arrays import FLAG_BITS, NUMERIC_FLAGS, PlayerFlags, flag_mask
+
+BOOL_KEYS = [k for k in FLAG_BITS if k not in NUMERIC_FLAGS]
+KEYS = BOOL_KEYS + list(NUMERIC_FLAGS) + ["tackle_ctx", "kick_target"]
+VALUES = [True, False, 0, 1, 2, 0.0, 0.5, 3.7, None, "x", ""]
+NUMBERS = [True, False, 0, 1, 2, 0.0, 0.5, 3.7]
+
+
+class DummyStore:
+    def __init__(self):
+        self._dirty_flags = set()
+
+
+def bound():
+    flags = PlayerFlags()
+    flags._store, flags._row = DummyStore(), 0
+    return flags
+
+
+def value_for(rng, key):
+    return rng.choice(NUMBERS if key in NUMERIC_FLAGS else VALUES)
+
+
+def expected(key, value):
+    """What reads back: numeric flags are cast on write, boolean flags are bools."""
+    if key in NUMERIC_FLAGS:
+        return NUMERIC_FLAGS[key](value)
+    return bool(value) if key in FLAG_BITS else value
+
+
+def changed(before: dict, after: dict) -> bool:
+    """The row must be re-synced: a key added / removed or a truthiness change."""
+    if before.keys() != after.keys():
+        return True
+    return any(bool(before[k]) != bool(after[k]) for k in before)
+
+
+def test_against_dict_random_operations():
+    rng = random.Random(2024)
+    flags, ref = bound(), {}
+    dirty = flags._store._dirty_flags
+    for step in range(5000):
+        key = rng.choice(KEYS)
+        value = value_for(rng, key)
+        op = rng.randrange(7)
+        before = dict(ref)
+        dirty.clear()
+        if op == 0:
+            flags[key] = value
+            ref[key] = expected(key, value)
+        elif op == 1:
+            assert flags.pop(key, "missing") == ref.pop(key, "missing")
+        elif op == 2:
+            if key in ref:
+                del flags[key]
+                del ref[key]
+            else:
+                with pytest.raises(KeyError):
+                    del flags[key]
+        elif op == 3:
+            assert flags.setdefault(key, value) == ref.setdefault(key, expected(key, value))
+        elif op == 4:
+            extra = {k: value_for(rng, k) for k in rng.sample(KEYS, 2)}
+            flags.update(extra)
+            ref.update({k: expected(k, v) for k, v in extra.items()})
+        elif op == 5:
+            names = rng.sample(BOOL_KEYS, 2)
+            flags.clear_bits(flag_mask(*names))
+            for name in sorted(names, key=FLAG_BITS.get):     # new keys land in bit order
+                ref[name] = False
+        elif rng.random() < 0.05:
+            flags.clear()
+            ref.clear()
+
+        assert list(flags) == list(ref), step
+        assert len(flags) == len(ref)
+        assert dict(flags) == ref
+        for k in KEYS:
+            assert (k in flags) == (k in ref)
+            assert flags.get(k, "missing") == ref.get(k, "missing")
+        assert bool(dirty) == changed(before, ref), step
+
+
+def test_numeric_flags_are_cast():
+    flags = PlayerFlags()
+    flags["counter_cooldown"] = 2.9
+    flags["time_in_ruck"] = 1
+    assert flags["counter_cooldown"] == 2 and isinstance(flags["counter_cooldown"], int)
+    assert flags["time_in_ruck"] == 1.0 and isinstance(flags["time_in_ruck"], float)
+
+
+def test_hold_for_pass_sets_its_bit():
+    flags = PlayerFlags()
+    flags["hold_for_pass"] = 3
+    assert flags.bits & FLAG_BITS["hold_for_pass"]
+    flags["hold_for_pass"] = 0
+    assert not flags.bits & FLAG_BITS["hold_for_pass"]
+    assert flags["hold_for_pass"] == 0
+
+
+def test_reasserting_a_flag_does_not_mark_dirty():
+    flags = bound()
+    flags["in_ruck"] = True
+    flags._store._dirty_flags.clear()
+    flags["in_ruck"] = 1
+    flags["in_ruck"] = True
+    flags.setdefault("in_ruck", False)
+    flags.pop("off_feet", None)
+    assert flags._store._dirty_flags == set()
+
+
+def test_iteration_follows_insertion_order():
+    flags = PlayerFlags()
+    for key in ("jackal", "custom", "time_in_ruck", "being_tackled"):
+        flags[key] = True
+    assert list(flags) == ["jackal", "custom", "time_in_ruck", "being_tackled"]
+    del flags["custom"]
+    flags["custom"] = 1
+    assert list(flags) == ["jackal", "time_in_ruck", "being_tackled", "custom"]
+
+
+def test_attribute_access():
+    flags = PlayerFlags(in_ruck=True)
+    assert flags.in_ruck is True
+    flags.tackling = True
+    assert flags["tackling"] is True
+    assert flags.copy() == {"in_ruck": True, "tackling": True}
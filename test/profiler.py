@@ -0,0 +1,56 @@
+import contextlib
+import hashlib
+import io
+import sys
+from pathlib import Path
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from utils.core import profiler as profiler_mod
+from utils.core.profiler import TickProfiler
+
+DB = str(ROOT / "database" / "GameData.db")
+TICKS = 400
+
+
+def trace(match):
+    h = hashlib.sha1()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(TICKS):
+            match._advance_clock()
+            match.state.tick()
+            h.update(repr((
+                [tuple(round(c, 6) for c in p.location) for p in match.players],
+                tuple(round(c, 6) for c in match.ball.location),
+                match.state.controller.status[0],
+            )).encode())
+    return h.hexdigest()
+
+
+def test_profiled_tick_plays_the_same_match():
+    plain = Match(DB, 2, 1, seed=5)
+    profiled = Match(DB, 2, 1, seed=5, profile=True)
+    assert plain.profiler is None
+    assert trace(plain) == trace(profiled)
+    assert profiled.profiler.ticks == TICKS
+
+
+def test_profiled_stages():
+    match = Match(DB, 2, 1, seed=5, profile=True)
+    trace(match)
+    stages = set(match.profiler.summary()["by_stage"])
+    assert {"controller", "sync_flags", "advantage", "hard.restart", "boundaries", "open_play",
+            "choose_select", "do_actions", "ball.update", "sync_flags.post", "tick"} <= stages
+
+
+def test_signal_handler_dumps_every_registered_profiler(monkeypatch):
+    dumped = []
+    monkeypatch.setattr(TickProfiler, "dump", lambda self, *a, **k: dumped.append(self))
+    first, second = TickProfiler(), TickProfiler()
+    first.install_signal()
+    second.install_signal()
+    profiler_mod._dump_registered(None, None)
+    assert first in dumped and second in dumped
@@ -0,0 +1,112 @@
+import contextlib
+import io
+import sqlite3
+import sys
+from pathlib import Path
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from player import Player
+from utils.db.db_loader import load_player_from_db
+from utils.player.registry import PlayerRegistry
+
+DB = str(ROOT / "database" / "GameData.db")
+
+
+def squad(team_code, n=3):
+    return [Player(f"{team_code}{i}", i, i, team_code) for i in range(1, n + 1)]
+
+
+# --- lookups -------------------------------------------------------------
+
+def test_lookups_by_code_rn_sn():
+    a, b = squad("a"), squad("b")
+    reg = PlayerRegistry(a + b)
+    assert reg.code("2a") is a[1]
+    assert reg.rn("b", 3) is b[2]
+    assert reg.sn("a", 1) is a[0]
+    assert reg.code(None) is None
+    assert reg.code("9a") is None
+
+
+def test_duplicates_keep_first_player():
+    a = squad("a")
+    dup = Player("dup", 1, 1, "a")
+    reg = PlayerRegistry(a + [dup])
+    assert reg.rn("a", 1) is a[0]
+    assert dup._registry is reg
+
+
+# --- reindex -------------------------------------------------------------
+
+def test_rn_change_reindexes():
+    a = squad("a")
+    reg = PlayerRegistry(a)
+    a[0].rn = 9
+    assert reg.code("9a") is a[0]
+    assert reg.rn("a", 9) is a[0]
+    assert reg.code("1a") is None
+    assert reg.rn("a", 1) is None
+
+
+def test_sn_change_reindexes():
+    a = squad("a")
+    reg = PlayerRegistry(a)
+    a[1].sn = 22
+    assert reg.sn("a", 22) is a[1]
+    assert reg.sn("a", 2) is None
+    assert reg.code("2a") is a[1]        # codes follow rn, not sn
+
+
+def test_role_swap_ends_consistent():
+    a = squad("a")
+    reg = PlayerRegistry(a)
+    a[0].rn, a[1].rn = 2, 1
+    assert reg.code("1a") is a[1]
+    assert reg.code("2a") is a[0]
+    assert {reg.rn("a", rn).rn for rn in (1, 2, 3)} == {1, 2, 3}
+
+
+def test_rebuild_after_rewrite():
+    a = squad("a")
+    reg = PlayerRegistry(a)
+    a[2]._rn = 7                          # bypasses the setter, like a snapshot restore
+    reg.rebuild(a)
+    assert reg.code("7a") is a[2]
+    assert reg.code("3a") is None
+
+
+# --- substitute ----------------------------------------------------------
+
+def test_substitute_moves_every_lookup():
+    a = squad("a")
+    reg = PlayerRegistry(a)
+    off = a[1]
+    on = Player("on", off.sn, off.rn, "a")
+    reg.substitute(off, on)
+    assert reg.code("2a") is on
+    assert reg.rn("a", 2) is on
+    assert reg.sn("a", 2) is on
+    assert off._registry is None and on._registry is reg
+    off.rn = 5                            # the player who left no longer re-indexes
+    assert reg.code("5a") is None
+
+
+def test_match_substitute_updates_team_lookups():
+    conn = sqlite3.connect(DB)
+    try:
+        pid = conn.execute("SELECT player_id FROM players ORDER BY player_id LIMIT 1").fetchone()[0]
+    finally:
+        conn.close()
+    with contextlib.redirect_stdout(io.StringIO()):
+        match = Match(DB, 2, 1, seed=1)
+        off = match.get_player_by_code("10a")
+        on = match.substitute("10a", load_player_from_db(DB, pid))
+    assert on is not off
+    assert match.get_player_by_code("10a") is on
+    assert match.team_a.get_player_by_rn(10) is on
+    assert match.team_a.get_player_by_sn(off.sn) is on
+    assert on in match.players and off not in match.players
@@ -0,0 +1,99 @@
+import contextlib
+import io
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from utils.core.logger import serialize_tick
+from utils.core.replay import Replay, ReplayWriter
+from utils.db.db_loader import load_player_from_db
+
+DB = str(ROOT / "database" / "GameData.db")
+TICKS = 600
+SUBS = {250: ("10a", 0), 430: ("3b", 1)}    # tick -> (player code replaced before it, bench index)
+
+
+def q(v, scale=100.0):
+    return None if v is None else round(v * scale)
+
+
+def comparable(frame):
+    """The fields a replay frame carries, at the stream's precision."""
+    return {
+        "tick": frame["tick"],
+        "score": (frame["score"]["a"], frame["score"]["b"]),
+        "state": frame["state"],
+        "ball": ([q(c) for c in frame["ball"]["location"]], frame["ball"]["holder"]),
+        "players": [
+            (p["name"], p["sn"], p["team_code"], p["action"],
+             q(p["location"][0]), q(p["location"][1]), q(p["orientation"], 10.0))
+            for p in frame["players"]
+        ],
+    }
+
+
+@pytest.fixture(scope="module")
+def recorded(tmp_path_factory):
+    """(replay path, {tick: reference frame}) for TICKS ticks with two substitutions."""
+    path = str(tmp_path_factory.mktemp("replay") / "match.dorr")
+    conn = sqlite3.connect(DB)
+    try:
+        bench = [r[0] for r in conn.execute("SELECT player_id FROM players ORDER BY player_id LIMIT 2")]
+    finally:
+        conn.close()
+
+    match = Match(DB, 2, 1, seed=3)
+    match.replay = ReplayWriter(match, path)
+    ref = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(TICKS):
+            if i in SUBS:
+                code, b = SUBS[i]
+                match.substitute(code, load_player_from_db(DB, bench[b]))
+            match._advance_clock()
+            match.state.tick()
+            match.replay.write_tick()
+            ref[match.tick_count] = comparable(serialize_tick(match))
+    match.replay.close()
+    return path, ref
+
+
+def test_frames_round_trip(recorded):
+    path, ref = recorded
+    with Replay(path) as rp:
+        frames = [comparable(f) for f in rp.frames()]
+    assert len(frames) == TICKS
+    assert [f["tick"] for f in frames] == sorted(ref)
+    assert [f["tick"] for f in frames if f != ref[f["tick"]]] == []
+
+
+def test_seek_matches_reference(recorded):
+    path, ref = recorded
+    with Replay(path) as rp:
+        for tick in (1, 99, 100, 101, 251, 252, 431, 599, TICKS):
+            assert comparable(rp.seek(tick)) == ref[tick]
+        assert rp.seek(TICKS + 50) is None
+
+
+def test_rosters_follow_substitutions(recorded):
+    path, ref = recorded
+    with Replay(path) as rp:
+        assert [r[0] for r in rp.rosters] == [t + 1 for t in SUBS]
+        names_before = [p["name"] for p in rp.seek(250)["players"]]
+        names_after = [p["name"] for p in rp.seek(251)["players"]]
+    assert names_before != names_after
+    assert names_after == [p[0] for p in ref[251]["players"]]
+
+
+def test_frame_range(recorded):
+    path, _ref = recorded
+    with Replay(path) as rp:
+        ticks = [f["tick"] for f in rp.frames(190, 210)]
+    assert ticks == list(range(190, 211))
@@ -102,7 +102,8 @@ def test_compute_stage3_and_penalty():
     match = DummyMatch(DummyTeam(a_players), DummyTeam(b_players))
 
     s = ScrumScore()
-    with patch("engine.matchEngine.choice.scrum.common.random.random", side_effect=[1.0, 0.0, 0.0, 0.0]):
+    # DummyMatch has no rng, so the scrum stream falls back to the global random module
+    with patch("random.random", side_effect=[1.0, 0.0, 0.0, 0.0]):
         compute_stage_3(match, "a", s)
 
     assert pytest.approx(s.value, rel=1e-6) == 0.5 + (700 / 1000) * 2 * 1.0
@@ -0,0 +1,137 @@
+import contextlib
+import io
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from utils.core.logger import serialize_tick
+from utils.db.db_loader import load_player_from_db
+
+DB = str(ROOT / "database" / "GameData.db")
+
+
+def run(match, n):
+    """n ticks; returns each tick's serialize_tick as JSON."""
+    out = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(n):
+            match._advance_clock()
+            match.state.tick()
+            out.append(json.dumps(serialize_tick(match), default=str))
+    return out
+
+
+@pytest.fixture
+def mid_match():
+    # seed 7 is in open play from tick 400 on, so a tactics change shows
+    match = Match(DB, 2, 1, seed=7)
+    run(match, 400)
+    return match
+
+
+def test_restore_replays_the_same_ticks(mid_match):
+    snap = mid_match.snapshot()
+    first = run(mid_match, 300)
+    mid_match.restore(snap)
+    assert run(mid_match, 300) == first
+    mid_match.restore(snap)
+    assert run(mid_match, 300) == first
+
+
+def test_restored_match_equals_uninterrupted_run(mid_match):
+    snap = mid_match.snapshot()
+    run(mid_match, 150)
+    mid_match.restore(snap)
+    resumed = run(mid_match, 300)
+
+    ref = Match(DB, 2, 1, seed=7)
+    run(ref, 400)
+    assert run(ref, 300) == resumed
+
+
+def test_fork_matches_original_and_stays_independent(mid_match):
+    snap = mid_match.snapshot()
+    fork = mid_match.fork(snap)
+    assert fork is not mid_match
+    assert fork.players[0] is not mid_match.players[0]
+    assert fork.tick_count == mid_match.tick_count
+
+    from_fork = run(fork, 300)
+    assert run(mid_match, 300) == from_fork
+
+    other = mid_match.fork(snap)
+    other.team_a.tactics["attack_depth_10"] = 12.0
+    changed = run(other, 300)
+    mid_match.restore(snap)
+    assert run(mid_match, 300) == from_fork
+    assert changed != from_fork
+
+
+def test_restore_brings_back_flags_and_score(mid_match):
+    snap = mid_match.snapshot()
+    flags = [dict(p.state_flags) for p in mid_match.players]
+    score = dict(mid_match.scoreboard)
+    tick = mid_match.tick_count
+
+    mid_match.players[0].state_flags["in_ruck"] = True
+    mid_match.players[1].state_flags.clear()
+    mid_match.scoreboard["a"] += 7
+    mid_match.restore(snap)
+
+    assert [dict(p.state_flags) for p in mid_match.players] == flags
+    assert mid_match.scoreboard == score
+    assert mid_match.tick_count == tick
+    store = mid_match.player_arrays
+    store.refresh()
+    assert [int(v) for v in store.flags] == [p.state_flags.bits for p in mid_match.players]
+
+
+def bench_player():
+    conn = sqlite3.connect(DB)
+    try:
+        pid = conn.execute("SELECT player_id FROM players ORDER BY player_id LIMIT 1").fetchone()[0]
+    finally:
+        conn.close()
+    return load_player_from_db(DB, pid)
+
+
+def test_restore_across_a_substitution(mid_match):
+    snap = mid_match.snapshot()
+    expected = run(mid_match, 200)
+    mid_match.restore(snap)
+
+    off = mid_match.get_player_by_code("4a")
+    with contextlib.redirect_stdout(io.StringIO()):
+        on = mid_match.substitute("4a", bench_player())
+    run(mid_match, 50)
+    mid_match.restore(snap)
+
+    assert mid_match.get_player_by_code("4a") is off
+    assert on not in mid_match.players and on._registry is None and on._store is None
+    for team in (mid_match.team_a, mid_match.team_b):
+        assert all(any(p is q for q in mid_match.players) for p in team.squad)
+        assert all(team.get_player_by_rn(p.rn) is p for p in team.squad)
+    store = mid_match.player_arrays
+    assert all(store.players[p._row] is p for p in mid_match.players)
+    assert run(mid_match, 200) == expected
+
+
+def test_fork_from_before_a_substitution(mid_match):
+    snap = mid_match.snapshot()
+    expected = run(mid_match, 200)
+    mid_match.restore(snap)
+    with contextlib.redirect_stdout(io.StringIO()):
+        mid_match.substitute("4a", bench_player())
+    fork = mid_match.fork(snap)
+    assert [p.name for p in fork.players] == [p.name for p in snap.roster]
+    assert not any(p is q for p in fork.players for q in mid_match.players)
+    assert all(any(p is q for q in fork.players) for p in fork.team_a.squad)
+    assert run(fork, 200) == expected
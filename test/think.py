@@ -0,0 +1,98 @@
+import contextlib
+import hashlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from constants import THINK_BALL_MOVE_M, THINK_EVERY_TICKS
+from match import Match
+from choice.think import ThinkScheduler
+
+DB = str(ROOT / "database" / "GameData.db")
+
+
+def trace(match, n=400):
+    h = hashlib.sha1()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(n):
+            match._advance_clock()
+            match.state.tick()
+            h.update(repr((
+                [tuple(round(c, 6) for c in p.location) for p in match.players],
+                tuple(round(c, 6) for c in match.ball.location),
+                match.state.controller.status[0],
+            )).encode())
+    return h.hexdigest()
+
+
+def test_every_tick_plays_like_no_scheduler():
+    plain = Match(DB, 2, 1, seed=5)
+    plain.think = None
+    every = Match(DB, 2, 1, seed=5, think_every=1)
+    assert trace(plain) == trace(every)
+    assert every.think.planned == every.think.reused == 0
+
+
+def test_default_scheduler_reuses_plans():
+    assert THINK_EVERY_TICKS > 1
+    match = Match(DB, 2, 1, seed=5)
+    trace(match, 1000)
+    assert match.think.reused > match.think.planned > 0
+
+
+@pytest.fixture
+def planner():
+    """A fresh match, its scheduler and a compute() that counts its calls."""
+    match = Match(DB, 2, 1, seed=5)
+    match.ball.location = (50.0, 35.0, 0.0)
+    match.ball.holder = "10a"
+    think = ThinkScheduler(every=5, ball_move_m=THINK_BALL_MOVE_M)
+    runs = []
+
+    def ask(tag="open_play.joue", anchor=None):
+        return think.support_calls(match, "team", tag, lambda: runs.append(match.tick_count) or [len(runs)], anchor)
+
+    return match, think, runs, ask
+
+
+def test_replans_every_k_ticks(planner):
+    match, think, runs, ask = planner
+    for _ in range(11):
+        ask()
+        match.tick_count += 1
+    assert len(runs) == 3 and runs[1] - runs[0] == 5
+    assert think.reused == 8
+
+
+def test_replans_when_the_ball_moves(planner):
+    match, think, runs, ask = planner
+    ask()
+    match.ball.location = (50.0 + THINK_BALL_MOVE_M * 0.9, 35.0, 0.0)
+    assert ask() == [1]
+    match.ball.location = (50.0 + THINK_BALL_MOVE_M * 1.1, 35.0, 0.0)
+    assert ask() == [2]
+
+
+def test_replans_on_holder_tag_and_flag_changes(planner):
+    match, think, runs, ask = planner
+    ask()
+    match.ball.holder = "12a"
+    assert ask() == [2]
+    assert ask("open_play.phase_play") == [3]
+    match.get_player_by_code("6b").state_flags["tackling"] = True
+    assert ask("open_play.phase_play") == [4]
+    assert ask("open_play.phase_play") == [4]
+
+
+def test_anchor_replaces_the_ball(planner):
+    match, think, runs, ask = planner
+    ask(anchor=(80.0, 20.0))
+    match.ball.location = (60.0, 35.0, 0.0)   # the ball flies, the drop point holds
+    assert ask(anchor=(80.0, 20.0)) == [1]
+    assert ask(anchor=(80.0, 20.0 + THINK_BALL_MOVE_M * 1.1)) == [2]
@@ -0,0 +1,82 @@
+import contextlib
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+# The engine modules import each other flat ("from match import Match").
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "engine" / "matchEngine"))
+
+from match import Match
+from states import offside
+from utils.core.logger import serialize_tick
+from utils.core.tick_stream import (
+    BinaryTickWriter,
+    MSG_ROSTER,
+    MSG_KEYFRAME,
+    iter_messages,
+    read_ticks,
+)
+
+DB = str(ROOT / "database" / "GameData.db")
+TICKS = 600
+
+
+def q(v, scale=100.0):
+    return None if v is None else round(v * scale)
+
+
+def comparable(frame):
+    """The fields the stream carries, at the stream's precision."""
+    lines = frame.get("offside")
+    return {
+        "tick": frame["tick"],
+        "score": (frame["score"]["a"], frame["score"]["b"]),
+        "state": frame["state"],
+        "ball": ([q(c) for c in frame["ball"]["location"]], frame["ball"]["holder"]),
+        "players": [
+            (p["name"], p["sn"], p["team_code"], p["action"],
+             q(p["location"][0]), q(p["location"][1]), q(p["orientation"], 10.0))
+            for p in frame["players"]
+        ],
+        "offside": None if not lines else (
+            lines["phase"], lines["law"], q(lines["a"]), q(lines["b"])),
+    }
+
+
+@pytest.fixture(scope="module")
+def recorded():
+    """(stream bytes, reference serialize_tick frames) for TICKS ticks of one match."""
+    match = Match(DB, 2, 1, seed=3)
+    buf = io.BytesIO()
+    writer = BinaryTickWriter(match, buf)
+    ref = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(TICKS):
+            match._advance_clock()
+            match.state.tick()
+            tag, loc, _ctx = match.state.controller.status
+            match.offside_lines = offside.evaluate(match, tag, loc)[0]
+            writer.write_tick()
+            ref.append(comparable(serialize_tick(match)))
+    return buf.getvalue(), ref
+
+
+def test_round_trip_has_no_mismatches(recorded):
+    data, ref = recorded
+    got = [comparable(t) for t in read_ticks(io.BytesIO(data))]
+    assert len(got) == TICKS
+    mismatches = [r["tick"] for r, g in zip(ref, got) if r != g]
+    assert mismatches == []
+    assert any(r["offside"] for r in ref)
+
+
+def test_starts_with_roster_and_keyframe(recorded):
+    data, _ref = recorded
+    types = [msg for msg, _payload in iter_messages(io.BytesIO(data))]
+    assert types[0] == MSG_ROSTER
+    assert types.count(MSG_ROSTER) == 1
+    assert types.count(MSG_KEYFRAME) == TICKS // 20
+